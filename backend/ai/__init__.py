@@ -3,18 +3,8 @@ Repazoo AI Analysis Module
 LangChain-powered Twitter reputation analysis with risk and bias detection
 """
 
-from .langchain_analyzer import LangChainAnalyzer, create_analyzer, get_model_for_tier_name
-from .analysis_pipeline import AnalysisPipeline, create_pipeline
-from .risk_detector import RiskDetector, BiasDetector
-from .purpose_handler import PurposeHandler
-from .schemas import (
-    AnalysisResult,
-    RiskLevel,
-    SentimentType,
-    BiasCategory,
-    RiskCategory,
-    PurposeCategory
-)
+import importlib
+
 from .config import (
     AIModel,
     SubscriptionTier,
@@ -26,6 +16,49 @@ from .config import (
 
 __version__ = "1.0.0"
 
+# Heavy symbols (LangChain, pydantic schemas) are imported on first access
+# (PEP 562), so importing the package for config/tier routing stays cheap
+_LAZY_IMPORTS = {
+    # Main classes
+    "LangChainAnalyzer": ".langchain_analyzer",
+    "AnalysisPipeline": ".analysis_pipeline",
+    "RiskDetector": ".risk_detector",
+    "BiasDetector": ".risk_detector",
+    "PurposeHandler": ".purpose_handler",
+
+    # Factory functions
+    "create_analyzer": ".langchain_analyzer",
+    "create_pipeline": ".analysis_pipeline",
+    "get_model_for_tier_name": ".langchain_analyzer",
+    "get_purpose_handler": ".purpose_handler",
+    "get_risk_detector": ".risk_detector",
+
+    # Schemas
+    "AnalysisResult": ".schemas",
+    "RiskLevel": ".schemas",
+    "SentimentType": ".schemas",
+    "BiasCategory": ".schemas",
+    "RiskCategory": ".schemas",
+    "PurposeCategory": ".schemas",
+}
+
+
+def __getattr__(name: str):
+    """Import lazily exported symbols on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """Include lazily exported symbols in dir()"""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     # Main classes
     "LangChainAnalyzer",
@@ -37,6 +70,8 @@ __all__ = [
     # Factory functions
     "create_analyzer",
     "create_pipeline",
+    "get_purpose_handler",
+    "get_risk_detector",
 
     # Schemas
     "AnalysisResult",
@@ -3,30 +3,47 @@ Complete Analysis Pipeline
 End-to-end AI analysis orchestration with database integration
 """
 
+import asyncio
+import hashlib
 import logging
+import os
+import re
 import uuid
+from contextvars import ContextVar
+from itertools import zip_longest
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
 
-from .langchain_analyzer import LangChainAnalyzer, create_analyzer
-from .risk_detector import RiskDetector, BiasDetector
-from .purpose_handler import PurposeHandler
+import orjson
+import redis.asyncio as aioredis
+
+from .langchain_analyzer import create_analyzer, _get_sync_loop
+from .risk_detector import RiskDetector, BiasDetector, RISK_SCANNER, get_risk_detector
+from .purpose_handler import PurposeHandler, get_purpose_handler
+from .prompts.analysis_prompt import estimate_tweet_tokens, simhash
 from .schemas import (
     AnalysisResult,
-    AnalysisResultDB,
     PurposeCategory,
-    SentimentScore,
-    Theme,
-    EngagementMetrics,
-    RiskAssessment,
-    BiasAnalysis,
     Recommendation
 )
-from .config import AnalysisConfig, get_model_for_tier
+from .config import AnalysisConfig, get_model_for_tier, get_redis_url
 from ..database.supabase_client import SupabaseClient
+from ..database.async_pool import AsyncDatabasePool, async_db as shared_async_db
 
 logger = logging.getLogger(__name__)
 
+# Tweet text cleanup applied before analysis
+_URL_RE = re.compile(r"https?://\S+|www\.\S+", re.IGNORECASE)
+_RT_PREFIX_RE = re.compile(r"^RT @\w+:\s*")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Redis client for a run_analysis_sync call. Set only inside the coroutine
+# running on the analyzer's sync loop, where the caller's asyncpg pool and
+# Redis client (bound to another loop) can't be used
+_sync_call_cache: ContextVar[Optional[aioredis.Redis]] = ContextVar(
+    "_sync_call_cache", default=None
+)
+
 
 # ============================================================================
 # Analysis Pipeline
@@ -41,7 +58,8 @@ class AnalysisPipeline:
         self,
         user_id: str,
         tier: str,
-        db_client: Optional[SupabaseClient] = None
+        db_client: Optional[SupabaseClient] = None,
+        async_db: Optional[AsyncDatabasePool] = None
     ):
         """
         Initialize analysis pipeline
@@ -50,16 +68,23 @@ class AnalysisPipeline:
             user_id: User ID
             tier: Subscription tier
             db_client: Database client (optional)
+            async_db: asyncpg pool for the async path (optional, defaults to
+                the shared pool when DATABASE_URL is configured and no
+                db_client is given)
         """
         self.user_id = user_id
         self.tier = tier.lower()
+        if async_db is None and db_client is None and shared_async_db.is_configured:
+            async_db = shared_async_db
         self.db = db_client or SupabaseClient()
+        self.async_db = async_db
 
         # Initialize components
         self.analyzer = create_analyzer(tier=self.tier)
         self.risk_detector: Optional[RiskDetector] = None
         self.bias_detector = BiasDetector()
         self.purpose_handler: Optional[PurposeHandler] = None
+        self._cache: Optional[aioredis.Redis] = None
 
         logger.info(
             f"Initialized analysis pipeline for user {user_id}, tier {tier}"
@@ -90,69 +115,202 @@ class AnalysisPipeline:
             f"Starting analysis for user {self.user_id}, "
             f"purpose: {purpose}, tier: {self.tier}"
         )
+        started_at = datetime.now(timezone.utc)
 
-        # Step 1: Validate quota
-        if not self._check_quota():
-            raise RuntimeError("User has exceeded analysis quota")
-
-        # Step 2: Fetch Twitter data
-        tweet_data, user_profile = self._fetch_twitter_data(twitter_account_id)
+        # Steps 1-4: Check quota, fetch, sanitize and validate tweet data
+        sanitized_data, user_profile = await self._load_tweet_data(twitter_account_id)
 
-        # Step 3: Validate data
-        self._validate_data(tweet_data, user_profile)
+        # Step 5: Initialize purpose-specific components
+        self.purpose_handler = get_purpose_handler(purpose)
+        self.risk_detector = get_risk_detector(purpose)
 
-        # Step 4: Initialize purpose-specific components
-        self.purpose_handler = PurposeHandler(purpose)
-        self.risk_detector = RiskDetector(purpose)
+        # Rule-based detection doesn't depend on the AI result, so run it
+        # in a worker thread while the LLM calls are in flight
+        detection_task = asyncio.create_task(
+            asyncio.to_thread(self._run_detection, sanitized_data)
+        )
 
-        # Step 5: Sanitize data (remove PII)
-        sanitized_data = self._sanitize_data(tweet_data)
+        try:
+            # Step 6: Run AI analysis over tweet chunks concurrently
+            ai_result = await self._analyze_tweets(
+                sanitized_data,
+                user_profile,
+                purpose,
+                force_refresh
+            )
+        except BaseException:
+            detection_task.cancel()
+            raise
 
-        # Step 6: Run AI analysis
-        ai_result = await self.analyzer.analyze(
-            tweet_data=sanitized_data,
-            user_profile=user_profile,
-            purpose=purpose
+        # Steps 7-12: Merge detection, personalize, build and store result
+        analysis_result = await self._complete_analysis(
+            ai_result,
+            await detection_task,
+            self.purpose_handler,
+            twitter_account_id,
+            purpose,
+            started_at
         )
 
-        # Step 7: Enhance with rule-based detection
-        enhanced_result = self._enhance_with_detection(
-            ai_result,
-            sanitized_data
+        logger.info(
+            f"Analysis completed for user {self.user_id}, "
+            f"ID: {analysis_result.analysis_id}"
         )
 
-        # Step 8: Generate personalized recommendations
-        recommendations = self.purpose_handler.personalize_recommendations(
-            enhanced_result
+        return analysis_result
+
+    async def run_multi_purpose(
+        self,
+        purposes: List[str],
+        twitter_account_id: Optional[str] = None,
+        force_refresh: bool = False
+    ) -> Dict[str, AnalysisResult]:
+        """
+        Run analyses for several purposes over the same tweets
+
+        Tweets are fetched and sanitized once. The purpose-agnostic sections
+        (sentiment, themes, engagement) are generated by one model call per
+        chunk for all purposes; risk, bias, recommendations and summaries
+        are generated per purpose, concurrently (see
+        ``LangChainAnalyzer.analyze_multi_purpose``). Rule-based detection,
+        personalization and storage also run per purpose. Each purpose is
+        stored and billed as its own analysis.
+
+        Args:
+            purposes: Analysis purposes
+            twitter_account_id: Twitter account ID (optional)
+            force_refresh: Force new analysis (ignore cache)
+
+        Returns:
+            Dict mapping purpose to its AnalysisResult
+
+        Raises:
+            ValueError: If no purposes are given or user has no Twitter data
+            RuntimeError: If analysis fails
+        """
+        purposes = _unique(p.lower() for p in purposes)
+        if not purposes:
+            raise ValueError("At least one purpose is required")
+
+        logger.info(
+            f"Starting multi-purpose analysis for user {self.user_id}, "
+            f"purposes: {', '.join(purposes)}, tier: {self.tier}"
         )
-        enhanced_result["recommendations"] = [
-            r.dict() for r in recommendations
-        ]
+        started_at = datetime.now(timezone.utc)
+
+        sanitized_data, user_profile = await self._load_tweet_data(twitter_account_id)
+
+        handlers = [get_purpose_handler(purpose) for purpose in purposes]
+        detection_task = asyncio.create_task(asyncio.to_thread(
+            self._run_detections,
+            sanitized_data,
+            [get_risk_detector(purpose) for purpose in purposes]
+        ))
+
+        try:
+            ai_results = await self._analyze_tweets_multi(
+                sanitized_data,
+                user_profile,
+                purposes,
+                force_refresh
+            )
+        except BaseException:
+            detection_task.cancel()
+            raise
+
+        detections = await detection_task
+
+        results = await asyncio.gather(*[
+            self._complete_analysis(
+                ai_results[purpose],
+                detection,
+                handler,
+                twitter_account_id,
+                purpose,
+                started_at
+            )
+            for purpose, handler, detection in zip(purposes, handlers, detections)
+        ])
 
-        # Step 9: Create structured result
-        analysis_result = self._create_analysis_result(
-            enhanced_result,
-            purpose
+        logger.info(
+            f"Multi-purpose analysis completed for user {self.user_id}, "
+            f"IDs: {', '.join(r.analysis_id for r in results)}"
         )
 
-        # Step 10: Store in database
-        await self._store_result(
-            analysis_result,
-            twitter_account_id
+        return dict(zip(purposes, results))
+
+    async def analyze_stream(
+        self,
+        twitter_account_id: Optional[str] = None,
+        purpose: str = "personal_reputation"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run analysis pipeline, streaming partial results as they arrive
+
+        Yields ``{"event": "partial", "data": {...}}`` events while the model
+        is generating, then a single ``{"event": "complete", "data": {...}}``
+        event carrying the stored AnalysisResult. Events can be written to
+        an SSE response with ``format_sse_event``.
+
+        Args:
+            twitter_account_id: Twitter account ID (optional)
+            purpose: Analysis purpose
+
+        Yields:
+            Partial and final analysis events
+
+        Raises:
+            ValueError: If user has no Twitter data
+            RuntimeError: If analysis fails
+        """
+        logger.info(
+            f"Starting streamed analysis for user {self.user_id}, "
+            f"purpose: {purpose}, tier: {self.tier}"
         )
+        started_at = datetime.now(timezone.utc)
 
-        # Step 11: Update usage
-        self._increment_usage()
+        # Steps 1-4: Check quota, fetch, sanitize and validate tweet data
+        sanitized_data, user_profile = await self._load_tweet_data(twitter_account_id)
 
-        # Step 12: Log audit
-        self._log_audit(analysis_result.analysis_id, purpose)
+        # Step 5: Initialize purpose-specific components
+        self.purpose_handler = get_purpose_handler(purpose)
+        self.risk_detector = get_risk_detector(purpose)
+
+        # Rule-based detection runs in a worker thread while the model streams
+        detection_task = asyncio.create_task(
+            asyncio.to_thread(self._run_detection, sanitized_data)
+        )
+
+        try:
+            # Step 6: Stream AI analysis (last item is the complete result)
+            ai_result: Dict[str, Any] = {}
+            async for partial in self.analyzer.analyze_stream(
+                tweet_data=sanitized_data,
+                user_profile=user_profile,
+                purpose=purpose
+            ):
+                ai_result = partial
+                yield {"event": "partial", "data": partial}
+        except BaseException:
+            detection_task.cancel()
+            raise
+
+        # Steps 7-12: Merge detection, personalize, build and store result
+        analysis_result = await self._complete_analysis(
+            ai_result,
+            await detection_task,
+            self.purpose_handler,
+            twitter_account_id,
+            purpose,
+            started_at
+        )
 
         logger.info(
-            f"Analysis completed for user {self.user_id}, "
+            f"Streamed analysis completed for user {self.user_id}, "
             f"ID: {analysis_result.analysis_id}"
         )
 
-        return analysis_result
+        yield {"event": "complete", "data": analysis_result.model_dump(mode="json")}
 
     def run_analysis_sync(
         self,
@@ -160,92 +318,234 @@ class AnalysisPipeline:
         purpose: str = "personal_reputation",
         force_refresh: bool = False
     ) -> AnalysisResult:
-        """Synchronous version of run_analysis"""
-        logger.info(
-            f"Starting sync analysis for user {self.user_id}, "
-            f"purpose: {purpose}, tier: {self.tier}"
-        )
+        """
+        Synchronous version of run_analysis
+
+        Runs the async pipeline on the analyzer's background event loop, so
+        sync callers get the same chunked, concurrent analysis and reuse the
+        pooled LLM clients.
 
+        Raises:
+            RuntimeError: If called from inside a running event loop
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "run_analysis_sync cannot be called from a running event loop; "
+                "await run_analysis instead"
+            )
+
+        async def _run() -> AnalysisResult:
+            # The asyncpg pool and self._cache are bound to the caller's
+            # loop, so this call uses the Supabase client and its own Redis
+            # connection (scoped to this task, not stored on the instance)
+            cache = aioredis.from_url(
+                get_redis_url(),
+                encoding="utf-8",
+                decode_responses=True
+            )
+            _sync_call_cache.set(cache)
+            try:
+                return await self.run_analysis(
+                    twitter_account_id=twitter_account_id,
+                    purpose=purpose,
+                    force_refresh=force_refresh
+                )
+            finally:
+                await cache.aclose()
+
+        return asyncio.run_coroutine_threadsafe(_run(), _get_sync_loop()).result()
+
+    async def _load_tweet_data(
+        self,
+        twitter_account_id: Optional[str]
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Check quota, then fetch, sanitize and validate the user's tweets
+
+        Returns:
+            Tuple of (sanitized_data, user_profile)
+
+        Raises:
+            RuntimeError: If user has exceeded quota
+            ValueError: If user has no usable Twitter data
+        """
         # Step 1: Validate quota
-        if not self._check_quota():
+        if not await self._db_call("check_quota", self.user_id):
             raise RuntimeError("User has exceeded analysis quota")
 
         # Step 2: Fetch Twitter data
-        tweet_data, user_profile = self._fetch_twitter_data(twitter_account_id)
+        accounts = await self._db_call("get_twitter_accounts", self.user_id)
+        tweet_data, user_profile = self._extract_twitter_data(
+            accounts,
+            twitter_account_id
+        )
+
+        # Step 3: Sanitize data (remove PII), off the event loop since it
+        # fingerprints every tweet
+        sanitized_data = await asyncio.to_thread(self._sanitize_data, tweet_data)
 
-        # Step 3: Validate data
-        self._validate_data(tweet_data, user_profile)
+        # Step 4: Validate the tweets that will actually be analyzed
+        # (sanitizing drops empty and duplicate tweets)
+        self._validate_data(sanitized_data, user_profile)
 
-        # Step 4: Initialize purpose-specific components
-        self.purpose_handler = PurposeHandler(purpose)
-        self.risk_detector = RiskDetector(purpose)
+        return sanitized_data, user_profile
 
-        # Step 5: Sanitize data
-        sanitized_data = self._sanitize_data(tweet_data)
+    async def _analyze_tweets(
+        self,
+        sanitized_data: Dict[str, Any],
+        user_profile: Dict[str, Any],
+        purpose: str,
+        force_refresh: bool
+    ) -> Dict[str, Any]:
+        """
+        Run AI analysis over tweet chunks concurrently, reusing a cached
+        result for an unchanged tweet set
 
-        # Step 6: Run AI analysis
-        ai_result = self.analyzer.analyze_sync(
-            tweet_data=sanitized_data,
+        Returns:
+            Reduced AI analysis result
+        """
+        cache_key = self._cache_key(sanitized_data, user_profile, purpose)
+        if not force_refresh:
+            ai_result = await self._get_cached_result(cache_key)
+            if ai_result is not None:
+                return ai_result
+
+        tweet_chunks = _chunk_tweets(
+            sanitized_data,
+            token_budget=self.analyzer.chunk_token_budget
+        )
+        chunk_results = await self.analyzer.analyze_chunks(
+            tweet_chunks=tweet_chunks,
             user_profile=user_profile,
             purpose=purpose
         )
+        ai_result = _reduce_chunk_results(
+            chunk_results,
+            [len(chunk["tweets"]) for chunk in tweet_chunks]
+        )
+        await self._cache_result(cache_key, ai_result)
+
+        return ai_result
+
+    async def _analyze_tweets_multi(
+        self,
+        sanitized_data: Dict[str, Any],
+        user_profile: Dict[str, Any],
+        purposes: List[str],
+        force_refresh: bool
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run AI analysis for several purposes, reusing cached per-purpose results
+
+        Purposes without a cached result share one multi-purpose analysis
+        (a single uncached purpose takes the regular path). Results are
+        cached per purpose, so they are also reused by run_analysis.
+
+        Returns:
+            Dict mapping purpose to its reduced AI analysis result
+        """
+        cache_keys = {
+            purpose: self._cache_key(sanitized_data, user_profile, purpose)
+            for purpose in purposes
+        }
+        ai_results: Dict[str, Dict[str, Any]] = {}
+        if not force_refresh:
+            cached = await asyncio.gather(*[
+                self._get_cached_result(cache_keys[purpose]) for purpose in purposes
+            ])
+            ai_results = {
+                purpose: result for purpose, result in zip(purposes, cached)
+                if result is not None
+            }
+
+        pending = [purpose for purpose in purposes if purpose not in ai_results]
+        if len(pending) == 1:
+            ai_results[pending[0]] = await self._analyze_tweets(
+                sanitized_data,
+                user_profile,
+                pending[0],
+                force_refresh=True
+            )
+        elif pending:
+            tweet_chunks = _chunk_tweets(
+                sanitized_data,
+                token_budget=self.analyzer.chunk_token_budget
+            )
+            chunk_results = await self.analyzer.analyze_multi_purpose(
+                tweet_chunks=tweet_chunks,
+                user_profile=user_profile,
+                purposes=pending
+            )
+            chunk_sizes = [len(chunk["tweets"]) for chunk in tweet_chunks]
+            for purpose, results in zip(pending, chunk_results):
+                ai_results[purpose] = _reduce_chunk_results(results, chunk_sizes)
+
+            await asyncio.gather(*[
+                self._cache_result(cache_keys[purpose], ai_results[purpose])
+                for purpose in pending
+            ])
+
+        return ai_results
 
+    async def _complete_analysis(
+        self,
+        ai_result: Dict[str, Any],
+        detection: Tuple[Any, ...],
+        purpose_handler: PurposeHandler,
+        twitter_account_id: Optional[str],
+        purpose: str,
+        started_at: datetime
+    ) -> AnalysisResult:
+        """
+        Merge detection, personalize recommendations, then build and store
+        the result for one purpose
+
+        Returns:
+            Stored AnalysisResult
+        """
         # Step 7: Enhance with rule-based detection
-        enhanced_result = self._enhance_with_detection(
-            ai_result,
-            sanitized_data
-        )
+        enhanced_result = self._merge_detection(ai_result, detection)
 
         # Step 8: Generate personalized recommendations
-        recommendations = self.purpose_handler.personalize_recommendations(
+        recommendations = purpose_handler.personalize_recommendations(
             enhanced_result
         )
         enhanced_result["recommendations"] = [
-            r.dict() for r in recommendations
+            r.model_dump() for r in recommendations
         ]
 
-        # Step 9: Create structured result
-        analysis_result = self._create_analysis_result(
+        # Step 9: Create structured result and its database row
+        analysis_result, record = self._create_analysis_result(
             enhanced_result,
-            purpose
-        )
-
-        # Step 10: Store in database
-        self._store_result_sync(
-            analysis_result,
+            purpose,
+            started_at,
             twitter_account_id
         )
 
-        # Step 11: Update usage
-        self._increment_usage()
-
-        # Step 12: Log audit
-        self._log_audit(analysis_result.analysis_id, purpose)
-
-        logger.info(
-            f"Sync analysis completed for user {self.user_id}, "
-            f"ID: {analysis_result.analysis_id}"
+        # Steps 10-12: Store result, update usage and log audit concurrently
+        await self._persist_result(
+            analysis_result,
+            record,
+            purpose
         )
 
         return analysis_result
 
-    def _check_quota(self) -> bool:
-        """Check if user has remaining quota"""
-        return self.db.check_quota(self.user_id)
-
-    def _fetch_twitter_data(
+    def _extract_twitter_data(
         self,
+        accounts: List[Dict[str, Any]],
         twitter_account_id: Optional[str]
     ) -> tuple[Dict[str, Any], Dict[str, Any]]:
         """
-        Fetch Twitter data from database
+        Pick the Twitter account to analyze and extract its data
 
         Returns:
             Tuple of (tweet_data, user_profile)
         """
-        # Get user's Twitter accounts
-        accounts = self.db.get_twitter_accounts(self.user_id)
-
         if not accounts:
             raise ValueError("No Twitter accounts connected")
 
@@ -323,16 +623,36 @@ class AnalysisPipeline:
         """
         sanitized = tweet_data.copy()
 
-        # Limit number of tweets
-        tweets = sanitized.get("tweets", [])
-        if len(tweets) > AnalysisConfig.MAX_TWEETS_TO_ANALYZE:
-            sanitized["tweets"] = tweets[:AnalysisConfig.MAX_TWEETS_TO_ANALYZE]
+        cleaned_tweets = []
+        seen_digests = set()
+
+        for tweet in tweet_data.get("tweets", []):
+            # Limit number of tweets
+            if len(cleaned_tweets) >= AnalysisConfig.MAX_TWEETS_TO_ANALYZE:
+                break
+
+            # Strip retweet prefixes and URLs (no signal, billed as tokens)
+            text = _RT_PREFIX_RE.sub("", tweet.get("text", ""))
+            text = _URL_RE.sub("", text)
+            text = _WHITESPACE_RE.sub(" ", text).strip()
+            if not text:
+                continue
 
-        # Truncate long tweets
-        for tweet in sanitized["tweets"]:
-            text = tweet.get("text", "")
+            # Truncate long tweets
             if len(text) > AnalysisConfig.MAX_TWEET_LENGTH:
-                tweet["text"] = text[:AnalysisConfig.MAX_TWEET_LENGTH]
+                text = text[:AnalysisConfig.MAX_TWEET_LENGTH]
+
+            # Skip duplicates (repeated boilerplate, retweets of included tweets)
+            digest = hashlib.blake2b(
+                text.lower().encode("utf-8"),
+                digest_size=8
+            ).digest()
+            if digest in seen_digests:
+                continue
+            seen_digests.add(digest)
+
+            # Fingerprint once here so prompt tweet selection doesn't rehash
+            tweet = dict(tweet, text=text, simhash=simhash(text))
 
             # Remove location data
             tweet.pop("location", None)
@@ -345,8 +665,102 @@ class AnalysisPipeline:
                     if "username" in m
                 ]
 
+            cleaned_tweets.append(tweet)
+
+        sanitized["tweets"] = cleaned_tweets
+
         return sanitized
 
+    def _cache_key(
+        self,
+        sanitized_data: Dict[str, Any],
+        user_profile: Dict[str, Any],
+        purpose: str
+    ) -> str:
+        """
+        Build cache key for an analysis of this tweet set
+
+        Hashes everything that goes into the prompts - each tweet's text,
+        date and engagement, the account-level fields, the user profile and
+        the analyzer's token budgets - so changed engagement or profile data
+        is analyzed afresh instead of being served from the cache.
+
+        Args:
+            sanitized_data: Sanitized tweet data
+            user_profile: Twitter profile information
+            purpose: Analysis purpose
+
+        Returns:
+            Redis key derived from the prompt inputs, purpose, tier and
+            prompt version
+        """
+        tweets = [
+            (
+                t.get("id"),
+                t.get("text"),
+                t.get("created_at"),
+                t.get("likes"),
+                t.get("retweets"),
+                t.get("replies")
+            )
+            for t in sanitized_data.get("tweets", [])
+        ]
+        payload = orjson.dumps(
+            (
+                purpose.lower(),
+                self.tier,
+                AnalysisConfig.PROMPT_VERSION,
+                self.analyzer.tweet_token_budget,
+                self.analyzer.chunk_token_budget,
+                user_profile,
+                {k: v for k, v in sanitized_data.items() if k != "tweets"},
+                tweets
+            ),
+            default=str,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        )
+        digest = hashlib.blake2b(payload, digest_size=16)
+
+        return f"{AnalysisConfig.ANALYSIS_CACHE_PREFIX}{digest.hexdigest()}"
+
+    def _get_cache(self) -> aioredis.Redis:
+        """Get (lazily created) Redis client for the analysis cache"""
+        sync_cache = _sync_call_cache.get()
+        if sync_cache is not None:
+            return sync_cache
+        if self._cache is None:
+            self._cache = aioredis.from_url(
+                get_redis_url(),
+                encoding="utf-8",
+                decode_responses=True
+            )
+        return self._cache
+
+    async def _get_cached_result(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Return cached AI result, or None on miss or cache failure"""
+        try:
+            cached = await self._get_cache().get(cache_key)
+        except Exception as e:
+            logger.warning(f"Analysis cache lookup failed: {e}")
+            return None
+
+        if cached is None:
+            return None
+
+        logger.info(f"Analysis cache hit for user {self.user_id}")
+        return orjson.loads(cached)
+
+    async def _cache_result(self, cache_key: str, ai_result: Dict[str, Any]):
+        """Cache AI result (failures are logged, not raised)"""
+        try:
+            await self._get_cache().setex(
+                cache_key,
+                AnalysisConfig.ANALYSIS_CACHE_TTL,
+                orjson.dumps(ai_result, default=str, option=orjson.OPT_NON_STR_KEYS)
+            )
+        except Exception as e:
+            logger.warning(f"Failed to cache analysis result: {e}")
+
     def _enhance_with_detection(
         self,
         ai_result: Dict[str, Any],
@@ -362,16 +776,83 @@ class AnalysisPipeline:
         Returns:
             Enhanced results
         """
-        # Run risk detection
-        risk_score, risk_level, risk_flags = self.risk_detector.detect_risks(
+        return self._merge_detection(ai_result, self._run_detection(tweet_data))
+
+    def _run_detection(
+        self,
+        tweet_data: Dict[str, Any],
+        risk_detector: Optional[RiskDetector] = None
+    ) -> Tuple[Any, ...]:
+        """
+        Run rule-based risk and bias detection
+
+        Independent of the AI result, so it can run concurrently with the
+        LLM calls.
+
+        Args:
+            tweet_data: Tweet data
+            risk_detector: Purpose-specific detector (defaults to the
+                pipeline's current one)
+
+        Returns:
+            Tuple of (risk_score, risk_level, risk_flags,
+            bias_score, political_leaning, bias_indicators)
+        """
+        return self._run_detections(
             tweet_data,
-            ai_result
-        )
+            [risk_detector or self.risk_detector]
+        )[0]
 
-        # Run bias detection
+    def _run_detections(
+        self,
+        tweet_data: Dict[str, Any],
+        risk_detectors: List[RiskDetector]
+    ) -> List[Tuple[Any, ...]]:
+        """
+        Run rule-based detection for several purpose-specific detectors
+
+        The keyword scan and bias detection don't depend on the purpose, so
+        they run once; only risk weighting runs per detector.
+
+        Args:
+            tweet_data: Tweet data
+            risk_detectors: Purpose-specific risk detectors
+
+        Returns:
+            One _run_detection tuple per detector, in order
+        """
+        # Lowercase and scan the tweets once for every detector
         tweets = tweet_data.get("tweets", [])
-        bias_score, political_leaning, bias_indicators = \
-            self.bias_detector.detect_political_bias(tweets)
+        hits = RISK_SCANNER.scan_tweets(tweets)
+
+        # Run bias detection
+        bias = self.bias_detector.detect_political_bias(tweets, hits)
+
+        # Run risk detection per purpose
+        return [
+            risk_detector.detect_risks(tweet_data, hits=hits) + bias
+            for risk_detector in risk_detectors
+        ]
+
+    def _merge_detection(
+        self,
+        ai_result: Dict[str, Any],
+        detection: Tuple[Any, ...]
+    ) -> Dict[str, Any]:
+        """
+        Merge rule-based detection output into AI results
+
+        Args:
+            ai_result: AI analysis results
+            detection: Output of _run_detection
+
+        Returns:
+            Enhanced results
+        """
+        (
+            risk_score, risk_level, risk_flags,
+            bias_score, political_leaning, bias_indicators
+        ) = detection
 
         # Enhance risk assessment
         if "risk_assessment" in ai_result:
@@ -404,70 +885,174 @@ class AnalysisPipeline:
     def _create_analysis_result(
         self,
         enhanced_result: Dict[str, Any],
-        purpose: str
-    ) -> AnalysisResult:
+        purpose: str,
+        timestamp: Optional[datetime] = None,
+        twitter_account_id: Optional[str] = None
+    ) -> Tuple[AnalysisResult, Dict[str, Any]]:
         """
-        Create structured AnalysisResult from enhanced data
+        Create structured AnalysisResult and its database row from enhanced data
 
         Args:
             enhanced_result: Enhanced analysis results
             purpose: Analysis purpose
+            timestamp: Analysis start time (defaults to now)
+            twitter_account_id: Analyzed Twitter account (stored on the row)
 
         Returns:
-            Structured AnalysisResult
-        """
-        analysis_id = str(uuid.uuid4())
-
-        return AnalysisResult(
-            analysis_id=analysis_id,
-            user_id=self.user_id,
-            timestamp=datetime.now(timezone.utc),
-            tier=self.tier,
-            purpose=PurposeCategory(purpose.lower()),
-            model_used=enhanced_result.get("model_used", get_model_for_tier(self.tier).value),
-            sentiment=SentimentScore(**enhanced_result["sentiment"]),
-            themes=[Theme(**t) for t in enhanced_result["themes"]],
-            engagement=EngagementMetrics(**enhanced_result["engagement"]),
-            risk_assessment=RiskAssessment(**enhanced_result["risk_assessment"]),
-            bias_indicators=BiasAnalysis(**enhanced_result["bias_indicators"]),
-            recommendations=[
-                Recommendation(**r) for r in enhanced_result["recommendations"]
+            Tuple of (structured AnalysisResult, analyses table row)
+        """
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc)
+
+        # Time-ordered ID keeps analyses primary key inserts append-only
+        analysis_id = str(_uuid7(timestamp))
+
+        # Validated in one pass; nested models are built from the merged dicts
+        result = AnalysisResult.model_validate({
+            "analysis_id": analysis_id,
+            "user_id": self.user_id,
+            "timestamp": timestamp,
+            "tier": self.tier,
+            "purpose": PurposeCategory(purpose.lower()),
+            "model_used": enhanced_result.get("model_used", get_model_for_tier(self.tier).value),
+            "sentiment": enhanced_result["sentiment"],
+            "themes": enhanced_result["themes"],
+            "engagement": enhanced_result["engagement"],
+            "risk_assessment": enhanced_result["risk_assessment"],
+            "bias_indicators": enhanced_result["bias_indicators"],
+            # Recommendations were dumped from validated models in step 8;
+            # model instances are not revalidated
+            "recommendations": [
+                Recommendation.model_construct(**r)
+                for r in enhanced_result["recommendations"]
             ],
-            executive_summary=enhanced_result.get("executive_summary", ""),
-            key_findings=enhanced_result.get("key_findings", []),
-            processing_time_ms=enhanced_result.get("processing_time_ms", 0),
-            token_count=enhanced_result.get("token_count", 0),
-            confidence_level=enhanced_result.get("confidence_level", 0.8),
-            human_review_required=enhanced_result.get("human_review_required", False),
-            raw_response=enhanced_result
+            "executive_summary": enhanced_result.get("executive_summary", ""),
+            "key_findings": enhanced_result.get("key_findings", []),
+            "processing_time_ms": enhanced_result.get("processing_time_ms", 0),
+            "token_count": enhanced_result.get("token_count", 0),
+            "confidence_level": enhanced_result.get("confidence_level", 0.8),
+            "human_review_required": enhanced_result.get("human_review_required", False)
+        })
+
+        return result, self._build_analysis_record(
+            result,
+            enhanced_result,
+            twitter_account_id
         )
 
     async def _store_result(
         self,
         result: AnalysisResult,
-        twitter_account_id: Optional[str]
+        record: Dict[str, Any]
     ):
         """Store analysis result in database"""
-        self._store_result_sync(result, twitter_account_id)
+        stored = await self._db_call("create_analysis", record)
+
+        if not stored:
+            logger.error(f"Failed to store analysis result {result.analysis_id}")
+        else:
+            logger.info(f"Stored analysis result {result.analysis_id}")
 
-    def _store_result_sync(
+    async def _persist_result(
         self,
         result: AnalysisResult,
-        twitter_account_id: Optional[str]
+        record: Dict[str, Any],
+        purpose: str
     ):
-        """Store analysis result in database (sync)"""
-        analysis_data = {
+        """
+        Store result, increment usage and write audit log
+
+        On the asyncpg pool all three writes go out as a single statement
+        (finalize_analysis). With the synchronous Supabase client they run
+        concurrently in worker threads instead.
+        """
+        audit_metadata = {
+            "purpose": purpose,
+            "tier": self.tier
+        }
+
+        async_db = self._get_async_db()
+        if async_db is not None:
+            finalized = await async_db.finalize_analysis(
+                record,
+                1,
+                {
+                    "action": "analysis_completed",
+                    "resource_type": "analysis",
+                    "metadata": audit_metadata
+                }
+            )
+
+            if not finalized:
+                logger.error(f"Failed to store analysis result {result.analysis_id}")
+            else:
+                logger.info(f"Stored analysis result {result.analysis_id}")
+            return
+
+        _, usage_incremented, _ = await asyncio.gather(
+            self._store_result(result, record),
+            self._db_call("increment_usage", self.user_id, count=1),
+            self._db_call(
+                "log_audit",
+                user_id=self.user_id,
+                action="analysis_completed",
+                resource_type="analysis",
+                resource_id=result.analysis_id,
+                metadata=audit_metadata
+            )
+        )
+
+        if not usage_incremented:
+            logger.warning(f"Failed to increment usage for user {self.user_id}")
+
+    async def _db_call(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call a database operation without blocking the event loop
+
+        Uses the asyncpg pool when configured, otherwise runs the matching
+        SupabaseClient method in a worker thread.
+
+        Args:
+            method: Name of the database method (same on both clients)
+
+        Returns:
+            The database method's return value
+        """
+        async_db = self._get_async_db()
+        if async_db is not None:
+            return await getattr(async_db, method)(*args, **kwargs)
+        return await asyncio.to_thread(getattr(self.db, method), *args, **kwargs)
+
+    def _get_async_db(self) -> Optional[AsyncDatabasePool]:
+        """Get the asyncpg pool, or None when running under run_analysis_sync"""
+        if _sync_call_cache.get() is not None:
+            return None
+        return self.async_db
+
+    def _build_analysis_record(
+        self,
+        result: AnalysisResult,
+        enhanced_result: Dict[str, Any],
+        twitter_account_id: Optional[str]
+    ) -> Dict[str, Any]:
+        """
+        Build the analyses table row for a result
+
+        The JSON columns reuse the enhanced_result sections the result was
+        just validated from instead of dumping the nested models again.
+        """
+        return {
             "id": result.analysis_id,
             "user_id": self.user_id,
             "twitter_account_id": twitter_account_id,
             "tier": self.tier,
             "purpose": result.purpose.value,
-            "sentiment_data": result.sentiment.dict(),
-            "themes_data": [t.dict() for t in result.themes],
-            "engagement_data": result.engagement.dict(),
-            "risk_data": result.risk_assessment.dict(),
-            "bias_data": result.bias_indicators.dict(),
-            "recommendations_data": [r.dict() for r in result.recommendations],
+            "sentiment_data": enhanced_result["sentiment"],
+            "themes_data": enhanced_result["themes"],
+            "engagement_data": enhanced_result["engagement"],
+            "risk_data": enhanced_result["risk_assessment"],
+            "bias_data": enhanced_result["bias_indicators"],
+            "recommendations_data": enhanced_result["recommendations"],
             "executive_summary": result.executive_summary,
             "key_findings": result.key_findings,
             "model_used": result.model_used,
@@ -477,32 +1062,300 @@ class AnalysisPipeline:
             "human_review_required": result.human_review_required
         }
 
-        # Store in analysis_results table
-        stored = self.db.create_analysis(analysis_data)
 
-        if not stored:
-            logger.error(f"Failed to store analysis result {result.analysis_id}")
-        else:
-            logger.info(f"Stored analysis result {result.analysis_id}")
+# ============================================================================
+# Chunking Helpers
+# ============================================================================
 
-    def _increment_usage(self):
-        """Increment API usage counter"""
-        success = self.db.increment_usage(self.user_id, count=1)
-        if not success:
-            logger.warning(f"Failed to increment usage for user {self.user_id}")
+def _chunk_tweets(
+    tweet_data: Dict[str, Any],
+    token_budget: int
+) -> List[Dict[str, Any]]:
+    """
+    Split tweet data into chunks for concurrent analysis
 
-    def _log_audit(self, analysis_id: str, purpose: str):
-        """Log analysis to audit log"""
-        self.db.log_audit(
-            user_id=self.user_id,
-            action="analysis_completed",
-            resource_type="analysis",
-            resource_id=analysis_id,
-            metadata={
-                "purpose": purpose,
-                "tier": self.tier
-            }
+    Tweets are packed greedily, in order, so each chunk fills as much of
+    the token budget as possible (fewer LLM calls).
+
+    Each chunk keeps the account-level fields of tweet_data (date range,
+    engagement totals) so the prompt context stays the same per chunk.
+
+    Args:
+        tweet_data: Sanitized tweet data
+        token_budget: Maximum estimated prompt tokens of tweets per chunk
+
+    Returns:
+        List of tweet data dicts, one per chunk
+    """
+    chunks = []
+    for group in _pack_by_tokens(tweet_data.get("tweets", []), token_budget):
+        chunk = dict(tweet_data)
+        chunk["tweets"] = group
+        chunk["total_count"] = len(group)
+        chunks.append(chunk)
+
+    return chunks
+
+
+def _pack_by_tokens(
+    tweets: List[Dict[str, Any]],
+    budget: int
+) -> List[List[Dict[str, Any]]]:
+    """
+    Greedily pack tweets, in order, into groups within a token budget
+
+    A single tweet larger than the budget still gets its own group.
+
+    Args:
+        tweets: Tweets to pack
+        budget: Maximum estimated prompt tokens per group
+
+    Returns:
+        List of tweet groups (at least one, possibly empty)
+    """
+    groups: List[List[Dict[str, Any]]] = [[]]
+    used = 0
+
+    for tweet in tweets:
+        tokens = estimate_tweet_tokens(tweet)
+        if groups[-1] and used + tokens > budget:
+            groups.append([])
+            used = 0
+        groups[-1].append(tweet)
+        used += tokens
+
+    return groups
+
+
+def _weighted_mean(values: List[float], weights: List[float]) -> float:
+    """Weighted mean of values (weights must sum to 1)"""
+    return sum(v * w for v, w in zip(values, weights))
+
+
+def _unique(items) -> List[Any]:
+    """Deduplicate items preserving first-seen order"""
+    items = list(items)
+    try:
+        return list(dict.fromkeys(items))
+    except TypeError:
+        # Unhashable items (objects where the schema asks for strings)
+        unique: Dict[bytes, Any] = {}
+        for item in items:
+            unique.setdefault(
+                orjson.dumps(item, default=str, option=orjson.OPT_SORT_KEYS),
+                item
+            )
+        return list(unique.values())
+
+
+def _weighted_vote(labels: List[str], weights: List[float], default: str) -> str:
+    """Pick the label with the largest total weight"""
+    totals: Dict[str, float] = {}
+    for label, weight in zip(labels, weights):
+        if label:
+            totals[label] = totals.get(label, 0.0) + weight
+    return max(totals, key=totals.get) if totals else default
+
+
+def _reduce_themes(chunk_results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Union themes across chunks by (case-insensitive) name"""
+    themes: Dict[str, Dict[str, Any]] = {}
+
+    for result in chunk_results:
+        for theme in result.get("themes", []):
+            key = theme.get("name", "").strip().lower()
+            merged = themes.get(key)
+
+            if merged is None:
+                themes[key] = dict(theme)
+                continue
+
+            merged["frequency"] = merged.get("frequency", 0) + theme.get("frequency", 0)
+            merged["relevance_score"] = max(
+                merged.get("relevance_score", 0.0),
+                theme.get("relevance_score", 0.0)
+            )
+            merged["is_controversial"] = (
+                merged.get("is_controversial", False) or
+                theme.get("is_controversial", False)
+            )
+            merged["example_tweets"] = _unique(
+                merged.get("example_tweets", []) + theme.get("example_tweets", [])
+            )[:3]
+
+    return sorted(
+        themes.values(),
+        key=lambda t: t.get("frequency", 0),
+        reverse=True
+    )
+
+
+def _reduce_chunk_results(
+    chunk_results: List[Dict[str, Any]],
+    chunk_sizes: List[int]
+) -> Dict[str, Any]:
+    """
+    Merge per-chunk analysis results into a single result
+
+    Scores and ratios are averaged weighted by each chunk's tweet count,
+    themes are unioned by name, engagement totals are summed and risk is
+    taken from the most severe chunk.
+
+    Args:
+        chunk_results: Per-chunk analysis results
+        chunk_sizes: Number of tweets in each chunk
+
+    Returns:
+        Merged analysis result
+    """
+    if len(chunk_results) == 1:
+        return chunk_results[0]
+
+    total = sum(chunk_sizes) or 1
+    weights = [size / total for size in chunk_sizes]
+
+    sentiments = [r.get("sentiment", {}) for r in chunk_results]
+    engagements = [r.get("engagement", {}) for r in chunk_results]
+    risks = [r.get("risk_assessment", {}) for r in chunk_results]
+    biases = [r.get("bias_indicators", {}) for r in chunk_results]
+    geo = [b.get("geopolitical_alignment", {}) for b in biases]
+
+    def mean(sections, key, default=0.0):
+        return _weighted_mean([s.get(key, default) for s in sections], weights)
+
+    def concat(sections, key):
+        return [item for s in sections for item in s.get(key, [])]
+
+    sentiment = {
+        "overall_sentiment": _weighted_vote(
+            [s.get("overall_sentiment") for s in sentiments], weights, "neutral"
+        ),
+        "sentiment_score": mean(sentiments, "sentiment_score"),
+        "positive_ratio": mean(sentiments, "positive_ratio"),
+        "negative_ratio": mean(sentiments, "negative_ratio"),
+        "neutral_ratio": mean(sentiments, "neutral_ratio"),
+        "confidence": mean(sentiments, "confidence"),
+        "concerning_patterns": _unique(concat(sentiments, "concerning_patterns")),
+        "sample_quotes": _unique(concat(sentiments, "sample_quotes"))
+    }
+
+    engagement = {
+        "total_tweets": sum(e.get("total_tweets", 0) for e in engagements),
+        "average_likes": mean(engagements, "average_likes"),
+        "average_retweets": mean(engagements, "average_retweets"),
+        "average_replies": mean(engagements, "average_replies"),
+        "engagement_rate": mean(engagements, "engagement_rate"),
+        "peak_engagement_times": _unique(concat(engagements, "peak_engagement_times")),
+        "engagement_trend": _weighted_vote(
+            [e.get("engagement_trend") for e in engagements], weights, "stable"
+        ),
+        "most_engaging_content_types": _unique(
+            concat(engagements, "most_engaging_content_types")
         )
+    }
+
+    worst = max(
+        range(len(risks)),
+        key=lambda i: risks[i].get("overall_risk_score", 0)
+    )
+    risk_assessment = {
+        "overall_risk_score": risks[worst].get("overall_risk_score", 0.0),
+        "risk_level": risks[worst].get("risk_level", "low"),
+        "flags": concat(risks, "flags"),
+        "association_risks": concat(risks, "association_risks"),
+        "content_integrity_issues": concat(risks, "content_integrity_issues"),
+        "timeline_analysis": " ".join(
+            _unique(r["timeline_analysis"] for r in risks if r.get("timeline_analysis"))
+        ),
+        "escalation_required": any(r.get("escalation_required", False) for r in risks)
+    }
+
+    leanings = _unique(b["political_leaning"] for b in biases if b.get("political_leaning"))
+    bias_indicators = {
+        "overall_bias_score": mean(biases, "overall_bias_score"),
+        "bias_indicators": concat(biases, "bias_indicators"),
+        "political_leaning": leanings[0] if len(leanings) == 1 else "mixed",
+        "demographic_patterns": _unique(concat(biases, "demographic_patterns")),
+        "geopolitical_alignment": {
+            "alignment_score": min(g.get("alignment_score", 100.0) for g in geo),
+            "primary_affiliations": _unique(concat(geo, "primary_affiliations")),
+            "sensitive_topics": _unique(concat(geo, "sensitive_topics")),
+            "regional_risk_factors": _unique(concat(geo, "regional_risk_factors")),
+            "international_relations_concerns": _unique(
+                concat(geo, "international_relations_concerns")
+            )
+        },
+        "neutrality_score": mean(biases, "neutrality_score"),
+        "recommendations": _unique(concat(biases, "recommendations"))
+    }
+
+    # Interleave key findings so every chunk is represented in the top 5
+    key_findings = _unique(
+        finding
+        for round_ in zip_longest(*(r.get("key_findings", []) for r in chunk_results))
+        for finding in round_ if finding
+    )[:5]
+
+    merged = {
+        "sentiment": sentiment,
+        "themes": _reduce_themes(chunk_results),
+        "engagement": engagement,
+        "risk_assessment": risk_assessment,
+        "bias_indicators": bias_indicators,
+        "recommendations": concat(chunk_results, "recommendations"),
+        "executive_summary": chunk_results[worst].get("executive_summary", ""),
+        "key_findings": key_findings,
+        "confidence_level": mean(chunk_results, "confidence_level", 0.8),
+        "human_review_required": any(
+            r.get("human_review_required", False) for r in chunk_results
+        ),
+        "token_count": sum(r.get("token_count", 0) for r in chunk_results),
+        "processing_time_ms": max(r.get("processing_time_ms", 0) for r in chunk_results),
+        "model_used": "+".join(
+            _unique(r.get("model_used") for r in chunk_results if r.get("model_used"))
+        ),
+        "tier": chunk_results[0].get("tier")
+    }
+
+    notes = _unique(r["notes"] for r in chunk_results if r.get("notes"))
+    if notes:
+        merged["notes"] = " ".join(notes)
+
+    token_usage: Dict[str, int] = {}
+    for r in chunk_results:
+        for key, value in r.get("token_usage", {}).items():
+            token_usage[key] = token_usage.get(key, 0) + value
+    if token_usage:
+        merged["token_usage"] = token_usage
+
+    return merged
+
+
+# ============================================================================
+# ID Helpers
+# ============================================================================
+
+def _uuid7(timestamp: datetime) -> uuid.UUID:
+    """
+    Generate a UUIDv7 (RFC 9562) for a timestamp
+
+    The 48-bit millisecond prefix makes IDs sort by creation time; the
+    remaining 74 bits are random.
+
+    Args:
+        timestamp: Timezone-aware creation time
+
+    Returns:
+        Version 7 UUID
+    """
+    unix_ms = int(timestamp.timestamp() * 1000) & 0xFFFF_FFFF_FFFF
+    value = (unix_ms << 80) | int.from_bytes(os.urandom(10), "big")
+
+    # Set version (7) and RFC 4122 variant (0b10) bits
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+
+    return uuid.UUID(int=value)
 
 
 # ============================================================================
@@ -512,7 +1365,8 @@ class AnalysisPipeline:
 def create_pipeline(
     user_id: str,
     tier: str,
-    db_client: Optional[SupabaseClient] = None
+    db_client: Optional[SupabaseClient] = None,
+    async_db: Optional[AsyncDatabasePool] = None
 ) -> AnalysisPipeline:
     """
     Factory function to create analysis pipeline
@@ -521,6 +1375,7 @@ def create_pipeline(
         user_id: User ID
         tier: Subscription tier
         db_client: Database client (optional)
+        async_db: asyncpg pool (optional)
 
     Returns:
         Configured AnalysisPipeline instance
@@ -529,7 +1384,27 @@ def create_pipeline(
         pipeline = create_pipeline(user_id="123", tier="pro")
         result = await pipeline.run_analysis(purpose="job_search")
     """
-    return AnalysisPipeline(user_id, tier, db_client)
+    return AnalysisPipeline(user_id, tier, db_client, async_db)
+
+
+def format_sse_event(event: Dict[str, Any]) -> str:
+    """
+    Format a streamed pipeline event as a Server-Sent Events frame
+
+    Args:
+        event: Event from AnalysisPipeline.analyze_stream
+
+    Returns:
+        SSE frame string
+
+    Example:
+        async for event in pipeline.analyze_stream(purpose="job_search"):
+            yield format_sse_event(event)
+    """
+    payload = orjson.dumps(
+        event["data"], default=str, option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+    return f"event: {event['event']}\ndata: {payload}\n\n"
 
 
 # ============================================================================
@@ -538,5 +1413,6 @@ def create_pipeline(
 
 __all__ = [
     "AnalysisPipeline",
-    "create_pipeline"
+    "create_pipeline",
+    "format_sse_event"
 ]
@@ -3,7 +3,8 @@ AI Configuration Module
 Model configuration, tier routing, and analysis settings
 """
 
-from typing import Dict, Any
+from dataclasses import dataclass
+from typing import Dict, Tuple
 from enum import Enum
 from config import settings
 
@@ -44,34 +45,54 @@ TIER_MODEL_MAP: Dict[SubscriptionTier, AIModel] = {
 # Model Configuration
 # ============================================================================
 
-MODEL_CONFIG: Dict[AIModel, Dict[str, Any]] = {
-    AIModel.HAIKU: {
-        "max_tokens": 4096,
-        "temperature": 0.7,
-        "top_p": 0.9,
-        "cost_per_1k_input": 0.00025,
-        "cost_per_1k_output": 0.00125,
-        "timeout": 30,
-        "max_retries": 2,
-    },
-    AIModel.SONNET_35: {
-        "max_tokens": 8192,
-        "temperature": 0.7,
-        "top_p": 0.9,
-        "cost_per_1k_input": 0.003,
-        "cost_per_1k_output": 0.015,
-        "timeout": 60,
-        "max_retries": 3,
-    },
-    AIModel.OPUS_35: {
-        "max_tokens": 8192,
-        "temperature": 0.7,
-        "top_p": 0.9,
-        "cost_per_1k_input": 0.015,
-        "cost_per_1k_output": 0.075,
-        "timeout": 90,
-        "max_retries": 3,
-    },
+@dataclass(frozen=True, slots=True)
+class ModelConfig:
+    """Generation settings and pricing for a model"""
+    context_window: int
+    max_tokens: int
+    temperature: float
+    top_p: float
+    cost_per_1k_input: float
+    cost_per_1k_output: float
+    timeout: int
+    max_retries: int
+    requests_per_minute: int  # Client-side cap, kept under the API rate limit
+
+
+MODEL_CONFIG: Dict[AIModel, ModelConfig] = {
+    AIModel.HAIKU: ModelConfig(
+        context_window=200000,
+        max_tokens=4096,
+        temperature=0.7,
+        top_p=0.9,
+        cost_per_1k_input=0.00025,
+        cost_per_1k_output=0.00125,
+        timeout=30,
+        max_retries=2,
+        requests_per_minute=1000
+    ),
+    AIModel.SONNET_35: ModelConfig(
+        context_window=200000,
+        max_tokens=8192,
+        temperature=0.7,
+        top_p=0.9,
+        cost_per_1k_input=0.003,
+        cost_per_1k_output=0.015,
+        timeout=60,
+        max_retries=3,
+        requests_per_minute=1000
+    ),
+    AIModel.OPUS_35: ModelConfig(
+        context_window=200000,
+        max_tokens=8192,
+        temperature=0.7,
+        top_p=0.9,
+        cost_per_1k_input=0.015,
+        cost_per_1k_output=0.075,
+        timeout=90,
+        max_retries=3,
+        requests_per_minute=500
+    ),
 }
 
 
@@ -105,13 +126,29 @@ class AnalysisConfig:
     MODERATE_BIAS_THRESHOLD = 0.4
 
     # Processing
-    BATCH_SIZE = 50
+    PROMPT_OVERHEAD_TOKENS = 2000  # Instructions and schema around the tweets
+    MAX_PROMPT_TWEET_TOKENS: Dict[str, int] = {  # Tweet tokens per prompt, by tier
+        "free": 6000,
+        "basic": 16000,
+        "pro": 32000,
+        "enterprise": 64000
+    }
     MAX_PARALLEL_ANALYSES = 5
+    LENGTH_BIN_TOKENS = (8000, 32000)  # Prompt size bin edges for batched LLM calls
+    CASCADE_ENABLED = True  # Screen chunks with Haiku, escalate uncertain ones
+    SMALL_INPUT_TOKENS = 4000  # Single analyses below this prompt size run on Haiku
+    SMALL_INPUT_TIERS = ("basic", "pro")  # Tiers whose small inputs are routed to Haiku
+    PARALLEL_ASPECTS = False  # Split each chunk into concurrent per-aspect prompts (lower latency, ~4x input tokens)
     ANALYSIS_CACHE_TTL = 3600  # 1 hour
+    ANALYSIS_CACHE_PREFIX = "ai:analysis:"
+    RESULT_CACHE_SIZE = 256  # Final results kept in the in-process analyzer cache
+    PROMPT_VERSION = "2"  # Bump when prompts change to invalidate cached results
 
     # Retry configuration
     MAX_RETRIES = 3
     RETRY_DELAY = 2  # seconds
+    MAX_RETRY_DELAY = 60  # seconds, also caps honored retry-after headers
+    RATE_LIMIT_BURST = 20  # Requests a model's limiter lets through back to back
     EXPONENTIAL_BACKOFF = True
 
 
@@ -119,105 +156,115 @@ class AnalysisConfig:
 # Purpose-Specific Configuration
 # ============================================================================
 
-PURPOSE_CONFIG: Dict[str, Dict[str, Any]] = {
-    "job_search": {
-        "focus_areas": [
+@dataclass(frozen=True, slots=True)
+class PurposeConfig:
+    """Focus areas, scoring weights and critical flags for a purpose"""
+    focus_areas: Tuple[str, ...]
+    weight_risk: float
+    weight_sentiment: float
+    weight_engagement: float
+    critical_flags: Tuple[str, ...]
+
+
+PURPOSE_CONFIG: Dict[str, PurposeConfig] = {
+    "job_search": PurposeConfig(
+        focus_areas=(
             "professional_tone",
             "controversial_content",
             "brand_safety",
             "skill_endorsements"
-        ],
-        "weight_risk": 1.5,  # Higher weight on risk detection
-        "weight_sentiment": 1.2,
-        "weight_engagement": 0.8,
-        "critical_flags": [
+        ),
+        weight_risk=1.5,  # Higher weight on risk detection
+        weight_sentiment=1.2,
+        weight_engagement=0.8,
+        critical_flags=(
             "hate_speech",
             "extremism",
             "professional_conduct"
-        ]
-    },
-    "visa_application": {
-        "focus_areas": [
+        )
+    ),
+    "visa_application": PurposeConfig(
+        focus_areas=(
             "geopolitical_alignment",
             "extremism",
             "controversial_associations",
             "misinformation"
-        ],
-        "weight_risk": 2.0,  # Highest weight on risk
-        "weight_sentiment": 1.0,
-        "weight_engagement": 0.5,
-        "critical_flags": [
+        ),
+        weight_risk=2.0,  # Highest weight on risk
+        weight_sentiment=1.0,
+        weight_engagement=0.5,
+        critical_flags=(
             "extremism",
             "hate_speech",
             "geopolitical",
             "misinformation"
-        ]
-    },
-    "brand_building": {
-        "focus_areas": [
+        )
+    ),
+    "brand_building": PurposeConfig(
+        focus_areas=(
             "engagement_patterns",
             "content_themes",
             "audience_sentiment",
             "brand_safety"
-        ],
-        "weight_risk": 1.0,
-        "weight_sentiment": 1.5,
-        "weight_engagement": 2.0,  # Highest weight on engagement
-        "critical_flags": [
+        ),
+        weight_risk=1.0,
+        weight_sentiment=1.5,
+        weight_engagement=2.0,  # Highest weight on engagement
+        critical_flags=(
             "brand_safety",
             "controversial_topics"
-        ]
-    },
-    "political_campaign": {
-        "focus_areas": [
+        )
+    ),
+    "political_campaign": PurposeConfig(
+        focus_areas=(
             "political_bias",
             "controversial_topics",
             "public_sentiment",
             "engagement_patterns"
-        ],
-        "weight_risk": 1.2,
-        "weight_sentiment": 1.5,
-        "weight_engagement": 1.5,
-        "critical_flags": [
+        ),
+        weight_risk=1.2,
+        weight_sentiment=1.5,
+        weight_engagement=1.5,
+        critical_flags=(
             "misinformation",
             "hate_speech",
             "controversial_topics"
-        ]
-    },
-    "security_clearance": {
-        "focus_areas": [
+        )
+    ),
+    "security_clearance": PurposeConfig(
+        focus_areas=(
             "extremism",
             "foreign_associations",
             "controversial_content",
             "misinformation"
-        ],
-        "weight_risk": 2.5,  # Extreme weight on risk
-        "weight_sentiment": 1.0,
-        "weight_engagement": 0.3,
-        "critical_flags": [
+        ),
+        weight_risk=2.5,  # Extreme weight on risk
+        weight_sentiment=1.0,
+        weight_engagement=0.3,
+        critical_flags=(
             "extremism",
             "hate_speech",
             "geopolitical",
             "misinformation",
             "controversial_topics"
-        ]
-    },
-    "personal_reputation": {
-        "focus_areas": [
+        )
+    ),
+    "personal_reputation": PurposeConfig(
+        focus_areas=(
             "overall_sentiment",
             "brand_safety",
             "controversial_topics",
             "engagement_patterns"
-        ],
-        "weight_risk": 1.3,
-        "weight_sentiment": 1.5,
-        "weight_engagement": 1.2,
-        "critical_flags": [
+        ),
+        weight_risk=1.3,
+        weight_sentiment=1.5,
+        weight_engagement=1.2,
+        critical_flags=(
             "hate_speech",
             "brand_safety",
             "professional_conduct"
-        ]
-    }
+        )
+    )
 }
 
 
@@ -245,7 +292,7 @@ def get_model_for_tier(tier: str) -> AIModel:
         raise ValueError(f"Invalid subscription tier: {tier}")
 
 
-def get_model_config(model: AIModel) -> Dict[str, Any]:
+def get_model_config(model: AIModel) -> ModelConfig:
     """
     Get configuration for specific model
 
@@ -253,12 +300,12 @@ def get_model_config(model: AIModel) -> Dict[str, Any]:
         model: AIModel enum value
 
     Returns:
-        Model configuration dictionary
+        Model configuration
     """
     return MODEL_CONFIG.get(model, MODEL_CONFIG[AIModel.HAIKU])
 
 
-def get_purpose_config(purpose: str) -> Dict[str, Any]:
+def get_purpose_config(purpose: str) -> PurposeConfig:
     """
     Get configuration for specific purpose
 
@@ -266,7 +313,7 @@ def get_purpose_config(purpose: str) -> Dict[str, Any]:
         purpose: Analysis purpose
 
     Returns:
-        Purpose configuration dictionary
+        Purpose configuration
     """
     return PURPOSE_CONFIG.get(
         purpose.lower(),
@@ -291,8 +338,8 @@ def calculate_analysis_cost(
         Cost in USD
     """
     config = get_model_config(model)
-    input_cost = (input_tokens / 1000) * config["cost_per_1k_input"]
-    output_cost = (output_tokens / 1000) * config["cost_per_1k_output"]
+    input_cost = (input_tokens / 1000) * config.cost_per_1k_input
+    output_cost = (output_tokens / 1000) * config.cost_per_1k_output
     return input_cost + output_cost
 
 
@@ -334,6 +381,16 @@ def get_anthropic_api_key() -> str:
     return api_key
 
 
+def get_redis_url() -> str:
+    """
+    Get Redis URL used for LLM and analysis caching
+
+    Returns:
+        Redis connection URL
+    """
+    return settings.redis_url
+
+
 # ============================================================================
 # Export
 # ============================================================================
@@ -343,6 +400,8 @@ __all__ = [
     "SubscriptionTier",
     "AnalysisConfig",
     "TIER_MODEL_MAP",
+    "ModelConfig",
+    "PurposeConfig",
     "MODEL_CONFIG",
     "PURPOSE_CONFIG",
     "get_model_for_tier",
@@ -351,4 +410,5 @@ __all__ = [
     "calculate_analysis_cost",
     "is_tier_valid",
     "get_anthropic_api_key",
+    "get_redis_url",
 ]
@@ -3,34 +3,519 @@ LangChain-based Twitter Analysis System
 Tier-based AI routing with structured output generation
 """
 
+import asyncio
+import bisect
+import copy
+import hashlib
 import json
 import logging
+import sys
+import threading
 import time
-from typing import Dict, Any, Optional, List
-from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, AsyncIterator, Tuple
 
 from langchain_anthropic import ChatAnthropic
-from langchain_core.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
+from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
 from langchain_core.output_parsers import JsonOutputParser
-from langchain_core.runnables import RunnablePassthrough, RunnableParallel
-from langchain.callbacks import get_openai_callback
+from langchain_core.outputs import Generation
+from langchain_core.runnables import RunnableParallel, RunnableLambda
+from langchain_core.globals import set_llm_cache
+from langchain_community.cache import RedisCache
+from redis import Redis
+from cachetools import TTLCache
+from anthropic import RateLimitError, APIConnectionError, InternalServerError
+from langchain_core.exceptions import OutputParserException
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    before_sleep_log,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential_jitter
+)
+import orjson
 
 from .config import (
     AIModel,
     get_model_for_tier,
     get_model_config,
     get_anthropic_api_key,
+    get_redis_url,
     AnalysisConfig
 )
-from .schemas import AnalysisResult, PurposeCategory
+from .schemas import PurposeCategory
 from .prompts.analysis_prompt import (
     SYSTEM_PROMPT,
+    ASPECT_SECTIONS,
+    SHARED_SECTIONS,
+    PURPOSE_SECTIONS,
     get_analysis_prompt,
+    get_aspect_prompts,
+    build_static_prefix,
+    build_shared_prefix,
+    build_purpose_prefix,
+    format_analysis_context,
+    get_json_schema,
     get_retry_prompt
 )
 
 logger = logging.getLogger(__name__)
 
+# Top-level keys every analysis result must contain
+_REQUIRED_RESULT_KEYS = frozenset({
+    "sentiment",
+    "themes",
+    "engagement",
+    "risk_assessment",
+    "bias_indicators",
+    "recommendations",
+    "executive_summary",
+    "key_findings",
+    "confidence_level",
+    "human_review_required"
+})
+
+# Profile fields required to run an analysis
+_REQUIRED_PROFILE_FIELDS = frozenset({"username"})
+
+# Anthropic beta enabling cache_control markers on prompt content blocks
+PROMPT_CACHING_BETA = "prompt-caching-2024-07-31"
+
+# Anthropic usage fields that together make up a request's billed tokens
+_USAGE_TOKEN_KEYS = (
+    "input_tokens",
+    "cache_creation_input_tokens",
+    "cache_read_input_tokens",
+    "output_tokens"
+)
+
+# Seconds before retrying the LLM cache after Redis was unreachable
+_LLM_CACHE_RETRY_SECONDS = 60
+
+_llm_cache_enabled = False
+_llm_cache_retry_at = 0.0
+_llm_cache_lock = threading.Lock()
+
+# In-process cache of final analysis results, shared by all analyzers
+_result_cache: TTLCache = TTLCache(
+    maxsize=AnalysisConfig.RESULT_CACHE_SIZE,
+    ttl=AnalysisConfig.ANALYSIS_CACHE_TTL
+)
+_result_cache_lock = threading.Lock()
+
+
+# ============================================================================
+# Output Parsing
+# ============================================================================
+
+class OrjsonOutputParser(JsonOutputParser):
+    """
+    JsonOutputParser that decodes complete responses strictly with orjson
+
+    Full responses (optionally wrapped in a ```json fence or surrounded by
+    prose) must be a complete JSON object; truncated or malformed output
+    raises OutputParserException instead of being patched up, so it is
+    retried with a repair prompt. Partial streaming chunks use LangChain's
+    lenient parser. While streaming, a response that opens with anything
+    but a JSON object or code fence (e.g. prose before the ``{``) is
+    rejected on its first characters, which aborts the stream instead of
+    paying for the rest of the generation.
+    """
+
+    def parse_result(self, result: List[Generation], *, partial: bool = False) -> Any:
+        if not partial:
+            return self._parse_full(result[0].text)
+
+        head = result[0].text.lstrip()[:1]
+        if head and head not in "{`":
+            raise OutputParserException(
+                f"Response does not start with a JSON object: {result[0].text[:80]!r}"
+            )
+        return super().parse_result(result, partial=True)
+
+    def _parse_full(self, text: str) -> Any:
+        """Decode a complete response, raising OutputParserException if it isn't valid JSON"""
+        body = text.strip()
+        if body.startswith("```"):
+            body = body.split("\n", 1)[-1].rstrip("`").strip()
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError as e:
+            error = e
+
+        start, end = body.find("{"), body.rfind("}")
+        if 0 <= start < end:
+            try:
+                return orjson.loads(body[start:end + 1])
+            except orjson.JSONDecodeError as e:
+                error = e
+
+        raise OutputParserException(f"Invalid json output: {error}", llm_output=text)
+
+
+# ============================================================================
+# Prompt Caching
+# ============================================================================
+
+def _cached_text_block(text: str) -> Dict[str, Any]:
+    """Text content block marked as an ephemeral prompt-cache breakpoint"""
+    return {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+
+
+_SYSTEM_MESSAGE = SystemMessage(content=[_cached_text_block(SYSTEM_PROMPT)])
+
+
+@lru_cache(maxsize=16)
+def _compile_prompt(schema: str, prefix_key: str = "static_prefix") -> RunnableLambda:
+    """
+    Build the chat prompt step with prompt-cached static blocks
+
+    Messages are laid out static-first: the system prompt, the output
+    schema and the purpose's static prefix are content blocks marked
+    with ``cache_control``, and only the trailing ``dynamic_suffix``
+    block changes between calls, so Claude reuses the cached prefix.
+    The step holds no per-analyzer state, so one instance per
+    (schema, prefix key) is shared by every analyzer in the process.
+
+    Args:
+        schema: Output schema block for this prompt
+        prefix_key: Input key holding the static prefix
+    """
+    schema_block = _cached_text_block(schema)
+
+    def format_messages(inputs: Dict[str, str]) -> List[BaseMessage]:
+        return [
+            _SYSTEM_MESSAGE,
+            HumanMessage(content=[
+                schema_block,
+                _cached_text_block(inputs[prefix_key]),
+                {"type": "text", "text": inputs["dynamic_suffix"]}
+            ])
+        ]
+
+    return RunnableLambda(format_messages)
+
+
+_ANALYSIS_PROMPT = _compile_prompt(get_json_schema())
+_ASPECT_PROMPTS = {
+    aspect: _compile_prompt(get_json_schema(keys), aspect)
+    for aspect, (_, keys) in ASPECT_SECTIONS.items()
+}
+_SHARED_PROMPT = _compile_prompt(get_json_schema(SHARED_SECTIONS[1]))
+_PURPOSE_PROMPT = _compile_prompt(get_json_schema(PURPOSE_SECTIONS[1]))
+
+
+def _dumps(obj: Any) -> str:
+    """Serialize an LLM output with orjson (for token estimates and retries)"""
+    return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _merge_usage(*usages: Dict[str, int]) -> Dict[str, int]:
+    """Sum Anthropic usage counters from several calls"""
+    merged: Dict[str, int] = {}
+    for usage in usages:
+        for key, value in usage.items():
+            merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def _merge_sections(shared: Any, purpose: Any) -> Optional[Dict[str, Any]]:
+    """Combine shared and purpose-specific section outputs, or None if either failed"""
+    if not isinstance(shared, dict) or not isinstance(purpose, dict):
+        return None
+
+    result = {key: shared[key] for key in SHARED_SECTIONS[1] if key in shared}
+    result.update((key, purpose[key]) for key in PURPOSE_SECTIONS[1] if key in purpose)
+    return result
+
+
+# Purposes with dedicated prompt guidance; others get the generic focus
+_KNOWN_PURPOSES = frozenset(purpose.value for purpose in PurposeCategory)
+
+
+def _normalize_purpose(purpose: str) -> str:
+    """Canonical purpose key (stripped, lowercased, interned) for prompts and caches"""
+    purpose = sys.intern(getattr(purpose, "value", purpose).strip().lower())
+    if purpose not in _KNOWN_PURPOSES:
+        logger.warning(f"Unknown analysis purpose {purpose!r}, using generic guidance")
+    return purpose
+
+
+def _prompt_input(analysis_prompt: Tuple[str, str]) -> Dict[str, str]:
+    """Map a (static prefix, dynamic suffix) prompt to analysis chain input"""
+    static_prefix, dynamic_suffix = analysis_prompt
+    return {"static_prefix": static_prefix, "dynamic_suffix": dynamic_suffix}
+
+
+class UsageCallbackHandler(BaseCallbackHandler):
+    """
+    Collect Anthropic token usage and the generated text of one chain call
+
+    Sums the ``usage`` reported for each run, so cache creation and cache
+    read tokens are reported alongside regular input/output tokens. Usage is
+    read from the message's ``response_metadata`` or the generation's
+    ``generation_info`` when present, otherwise from the run's
+    ``llm_output`` (where langchain-anthropic 0.1.x reports it).
+
+    ``text`` holds the full text of the last generation, which the streaming
+    paths parse once more without the partial-JSON leniency.
+    """
+
+    run_inline = True
+
+    def __init__(self):
+        self.usage: Dict[str, int] = {}
+        self.text: Optional[str] = None
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        if response.generations and response.generations[-1]:
+            self.text = response.generations[-1][-1].text
+
+        usages = [
+            _generation_usage(generation)
+            for generations in response.generations
+            for generation in generations
+        ]
+        usages = [usage for usage in usages if usage]
+        if not usages and response.llm_output:
+            usages = [response.llm_output.get("usage") or {}]
+
+        for usage in usages:
+            for key in _USAGE_TOKEN_KEYS:
+                self.usage[key] = self.usage.get(key, 0) + (usage.get(key) or 0)
+
+
+def _generation_usage(generation: Generation) -> Optional[Dict[str, Any]]:
+    """Usage dict attached to a single generation, if the integration sets one"""
+    message = getattr(generation, "message", None)
+    metadata = getattr(message, "response_metadata", None) or {}
+    return metadata.get("usage") or (generation.generation_info or {}).get("usage")
+
+
+def init_llm_cache() -> bool:
+    """
+    Share identical LLM responses across workers via Redis
+
+    Called on first analyzer construction rather than at import, so importing
+    this module does no network I/O. If Redis is unreachable the cache stays
+    off and is retried after _LLM_CACHE_RETRY_SECONDS.
+
+    LangChain's LLM cache only covers generate calls, i.e. the ``abatch``
+    paths (analyze_many and analyze_chunks). Single analyses and retries
+    stream with ``astream`` and bypass it; repeated single analyses are
+    served by the in-process result cache instead.
+
+    Returns:
+        True if the LLM cache is enabled
+    """
+    global _llm_cache_enabled, _llm_cache_retry_at
+
+    with _llm_cache_lock:
+        if _llm_cache_enabled or time.monotonic() < _llm_cache_retry_at:
+            return _llm_cache_enabled
+
+        try:
+            client = Redis.from_url(
+                get_redis_url(),
+                socket_connect_timeout=1,
+                socket_timeout=1
+            )
+            client.ping()
+            set_llm_cache(
+                RedisCache(client, ttl=AnalysisConfig.ANALYSIS_CACHE_TTL)
+            )
+            _llm_cache_enabled = True
+        except Exception as e:
+            _llm_cache_retry_at = time.monotonic() + _LLM_CACHE_RETRY_SECONDS
+            logger.warning(f"LLM cache disabled: {e}")
+
+        return _llm_cache_enabled
+
+
+# ============================================================================
+# Retry Policy
+# ============================================================================
+
+class InvalidResultError(ValueError):
+    """Raised when a parsed response is missing required result keys"""
+
+
+# Errors worth retrying with backoff (rate limits, dropped connections, 5xx)
+_TRANSIENT_ERRORS = (RateLimitError, APIConnectionError, InternalServerError)
+
+# Errors retried immediately with a corrected prompt
+_SEMANTIC_ERRORS = (json.JSONDecodeError, OutputParserException, InvalidResultError)
+
+_exponential_backoff = wait_exponential_jitter(
+    initial=AnalysisConfig.RETRY_DELAY,
+    max=AnalysisConfig.MAX_RETRY_DELAY
+)
+
+
+def _wait_for_retry(retry_state: RetryCallState) -> float:
+    """
+    Backoff delay before the next attempt
+
+    Uses jittered exponential backoff, stretched to Anthropic's
+    ``retry-after`` header when the error response carries one. Invalid
+    responses are retried immediately.
+    """
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    if isinstance(error, _SEMANTIC_ERRORS):
+        return 0
+
+    delay = _exponential_backoff(retry_state)
+
+    response = getattr(error, "response", None)
+    if response is None:
+        return delay
+
+    try:
+        retry_after = float(response.headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return delay
+
+    return max(delay, min(retry_after, AnalysisConfig.MAX_RETRY_DELAY))
+
+
+def _retry_policy(max_retries: int) -> Dict[str, Any]:
+    """Tenacity settings for analysis calls (one attempt budget for all retryable errors)"""
+    return {
+        "retry": retry_if_exception_type(_TRANSIENT_ERRORS + _SEMANTIC_ERRORS),
+        "wait": _wait_for_retry,
+        "stop": stop_after_attempt(max_retries),
+        "before_sleep": before_sleep_log(logger, logging.INFO),
+        "reraise": True
+    }
+
+
+# ============================================================================
+# Rate Limiting
+# ============================================================================
+
+class RequestRateLimiter:
+    """
+    Token-bucket limiter for outgoing LLM requests
+
+    Requests reserve tokens up front and wait out any deficit before they
+    are sent, so bursts are smoothed locally instead of turning into 429s
+    and retries. Reservations go through a lock, so one limiter paces
+    callers on any event loop or thread.
+    """
+
+    def __init__(self, requests_per_minute: int, burst: int):
+        self.interval = 60.0 / requests_per_minute
+        self.capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, count: int) -> float:
+        """Reserve tokens for count requests, returning the seconds to wait"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated) / self.interval
+            )
+            self._updated = now
+            self._tokens -= count
+            return max(0.0, -self._tokens * self.interval)
+
+    async def acquire(self, count: int = 1):
+        """Wait (without blocking the loop) until count requests may be sent"""
+        wait_time = self._reserve(count)
+        if wait_time > 0:
+            logger.debug(f"Rate limiter delaying {count} requests by {wait_time:.2f}s")
+            await asyncio.sleep(wait_time)
+
+
+# One limiter per model, shared by every analyzer in the process
+_rate_limiters: Dict[AIModel, RequestRateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(model_enum: AIModel) -> RequestRateLimiter:
+    """Get the process-wide request limiter for a model"""
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(model_enum)
+        if limiter is None:
+            limiter = RequestRateLimiter(
+                get_model_config(model_enum).requests_per_minute,
+                AnalysisConfig.RATE_LIMIT_BURST
+            )
+            _rate_limiters[model_enum] = limiter
+        return limiter
+
+
+# ============================================================================
+# Client Pool
+# ============================================================================
+
+# One ChatAnthropic (and HTTP connection pool) per model and API key,
+# shared by every analyzer in the process. The pinned langchain-anthropic
+# builds its own Anthropic clients and takes no http_client, so connection
+# limits are the SDK defaults (up to 1000 connections, 100 kept alive);
+# concurrency is bounded by the per-model rate limiters instead.
+_llm_pool: Dict[Tuple[AIModel, str], ChatAnthropic] = {}
+_llm_pool_lock = threading.Lock()
+
+
+def get_llm(model_enum: AIModel, api_key: str) -> ChatAnthropic:
+    """
+    Get the process-wide ChatAnthropic instance for a model
+
+    Generation settings come from the model's config, so one instance per
+    (model, API key) serves every tier routed to that model and keeps its
+    HTTP connections warm across analyzers.
+
+    Args:
+        model_enum: Model to use
+        api_key: Anthropic API key
+    """
+    with _llm_pool_lock:
+        llm = _llm_pool.get((model_enum, api_key))
+        if llm is None:
+            model_config = get_model_config(model_enum)
+            llm = ChatAnthropic(
+                model=model_enum.value,
+                anthropic_api_key=api_key,
+                max_tokens=model_config.max_tokens,
+                temperature=model_config.temperature,
+                top_p=model_config.top_p,
+                timeout=model_config.timeout,
+                max_retries=model_config.max_retries,
+                model_kwargs={
+                    "extra_headers": {"anthropic-beta": PROMPT_CACHING_BETA}
+                },
+            )
+            _llm_pool[(model_enum, api_key)] = llm
+        return llm
+
+
+# Event loop that runs analyze_sync calls, so the pooled async clients are
+# reused across sync calls instead of being rebuilt on a fresh loop each time
+_sync_loop: Optional[asyncio.AbstractEventLoop] = None
+_sync_loop_lock = threading.Lock()
+
+
+def _get_sync_loop() -> asyncio.AbstractEventLoop:
+    """Get the background event loop for sync callers, starting it on first use"""
+    global _sync_loop
+
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_sync_loop.run_forever,
+                name="langchain-analyzer-sync",
+                daemon=True
+            ).start()
+        return _sync_loop
+
 
 # ============================================================================
 # LangChain Analyzer
@@ -53,45 +538,113 @@ class LangChainAnalyzer:
         self.model_config = get_model_config(self.model_enum)
         self.api_key = get_anthropic_api_key()
 
-        # Initialize LangChain model
+        # Tweet tokens kept per prompt (most engaging tweets first)
+        self.tweet_token_budget = AnalysisConfig.MAX_PROMPT_TWEET_TOKENS.get(self.tier)
+
+        # Tweet tokens per chunk: what fits in one prompt alongside
+        # instructions and output, capped at the tier's tweet budget so every
+        # chunked tweet reaches the model and chunk weights stay accurate
+        self.chunk_token_budget = (
+            self.model_config.context_window
+            - self.model_config.max_tokens
+            - AnalysisConfig.PROMPT_OVERHEAD_TOKENS
+        )
+        if self.tweet_token_budget is not None:
+            self.chunk_token_budget = min(self.chunk_token_budget, self.tweet_token_budget)
+
+        # Initialize LangChain model (and the shared LLM cache on first use)
+        init_llm_cache()
         self.llm = self._create_llm()
+        self.rate_limiter = get_rate_limiter(self.model_enum)
 
         # Initialize output parser
-        self.output_parser = JsonOutputParser()
+        self.output_parser = OrjsonOutputParser()
+
+        # Warm the static prompt prefix cache for the known purposes
+        for purpose in PurposeCategory:
+            build_static_prefix(purpose.value)
 
         # Create analysis chain
         self.analysis_chain = self._create_analysis_chain()
 
+        # Per-aspect fan-out chain (None when aspects share one prompt)
+        self.aspect_chain = None
+        if AnalysisConfig.PARALLEL_ASPECTS:
+            self.aspect_chain = self._create_aspect_chain()
+
+        # Multi-purpose chains: purpose-agnostic sections once, the rest per purpose
+        self.shared_chain = self._create_analysis_chain(prompt=_SHARED_PROMPT)
+        self.purpose_chain = self._create_analysis_chain(prompt=_PURPOSE_PROMPT)
+
+        # Cheap screening chain for cascade routing (None when the tier
+        # model is already the cheapest)
+        self.screening_model: Optional[AIModel] = None
+        self.screening_chain = None
+        if AnalysisConfig.CASCADE_ENABLED and self.model_enum != AIModel.HAIKU:
+            self.screening_model = AIModel.HAIKU
+            self.screening_chain = self._create_analysis_chain(
+                self._create_llm(self.screening_model)
+            )
+
+        # Cheaper chain for small single analyses (None when the tier is
+        # not routed or already runs on Haiku)
+        self.small_input_model: Optional[AIModel] = None
+        self.small_input_chain = None
+        if self.tier in AnalysisConfig.SMALL_INPUT_TIERS and self.model_enum != AIModel.HAIKU:
+            self.small_input_model = AIModel.HAIKU
+            self.small_input_chain = self._create_analysis_chain(
+                self._create_llm(self.small_input_model)
+            )
+
         logger.info(
             f"Initialized LangChain analyzer for tier '{self.tier}' "
             f"using model '{self.model_enum.value}'"
         )
 
-    def _create_llm(self) -> ChatAnthropic:
-        """Create ChatAnthropic instance with tier-specific configuration"""
-        return ChatAnthropic(
-            model=self.model_enum.value,
-            anthropic_api_key=self.api_key,
-            max_tokens=self.model_config["max_tokens"],
-            temperature=self.model_config["temperature"],
-            top_p=self.model_config["top_p"],
-            timeout=self.model_config["timeout"],
-            max_retries=self.model_config["max_retries"],
-        )
+    def _create_llm(self, model_enum: Optional[AIModel] = None) -> ChatAnthropic:
+        """
+        Get the pooled ChatAnthropic instance for a model
+
+        Args:
+            model_enum: Model to use (defaults to the tier model)
+        """
+        return get_llm(model_enum or self.model_enum, self.api_key)
 
-    def _create_analysis_chain(self):
-        """Create LangChain analysis chain"""
-        # Create prompt template
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessagePromptTemplate.from_template(SYSTEM_PROMPT),
-            HumanMessagePromptTemplate.from_template("{analysis_prompt}")
-        ])
+    def _create_analysis_chain(
+        self,
+        llm: Optional[ChatAnthropic] = None,
+        prompt: Optional[RunnableLambda] = None
+    ):
+        """
+        Create LangChain analysis chain
 
-        # Create chain: prompt -> llm -> parse
-        chain = prompt | self.llm | self.output_parser
+        Args:
+            llm: Model to run the chain on (defaults to the tier model)
+            prompt: Prompt step (defaults to the comprehensive prompt)
+        """
+        # Create chain: shared prompt -> llm -> parse
+        chain = (prompt or _ANALYSIS_PROMPT) | (llm or self.llm) | self.output_parser
 
         return chain
 
+    def _create_aspect_chain(self, llm: Optional[ChatAnthropic] = None):
+        """
+        Create per-aspect analysis chains fanned out with RunnableParallel
+
+        The chain input maps each aspect name to its static prefix plus the
+        shared ``dynamic_suffix`` (see ``get_aspect_prompts``); the output
+        maps each aspect name to its
+        parsed JSON sections. All aspects are decoded concurrently, so
+        latency follows the longest section instead of their sum.
+
+        Args:
+            llm: Model to run the chains on (defaults to the tier model)
+        """
+        return RunnableParallel({
+            aspect: prompt | (llm or self.llm) | self.output_parser
+            for aspect, prompt in _ASPECT_PROMPTS.items()
+        })
+
     async def analyze(
         self,
         tweet_data: Dict[str, Any],
@@ -116,27 +669,42 @@ class LangChainAnalyzer:
             RuntimeError: If analysis fails after retries
         """
         start_time = time.time()
+        purpose = _normalize_purpose(purpose)
 
         # Validate inputs
         self._validate_inputs(tweet_data, user_profile)
 
+        # Reuse a recent identical analysis
+        cache_key = self._result_cache_key(
+            tweet_data,
+            user_profile,
+            purpose,
+            analysis_config
+        )
+        cached = self._get_cached_result(cache_key, start_time)
+        if cached is not None:
+            return cached
+
         # Generate analysis prompt
         analysis_prompt = get_analysis_prompt(
             purpose=purpose,
             tweet_data=tweet_data,
             user_profile=user_profile,
-            analysis_config=analysis_config or {}
+            analysis_config=self._prompt_config(analysis_config)
         )
 
-        # Execute analysis with retries
+        # Execute analysis with retries (small inputs on the cheaper model)
+        model_enum, chain = self._route_by_size(analysis_prompt)
         result = await self._execute_with_retry(
             analysis_prompt=analysis_prompt,
-            max_retries=AnalysisConfig.MAX_RETRIES
+            max_retries=AnalysisConfig.MAX_RETRIES,
+            chain=chain,
+            model_enum=model_enum
         )
 
         # Add metadata
         result["processing_time_ms"] = int((time.time() - start_time) * 1000)
-        result["model_used"] = self.model_enum.value
+        result["model_used"] = model_enum.value
         result["tier"] = self.tier
 
         logger.info(
@@ -144,17 +712,442 @@ class LangChainAnalyzer:
             f"using {result.get('token_count', 0)} tokens"
         )
 
+        self._cache_result(cache_key, result)
+
         return result
 
-    def analyze_sync(
+    async def analyze_chunks(
+        self,
+        tweet_chunks: List[Dict[str, Any]],
+        user_profile: Dict[str, Any],
+        purpose: str = "personal_reputation",
+        analysis_config: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several tweet chunks concurrently
+
+        Chunks are sent through the analysis chain with ``abatch`` so the
+        LLM round-trips overlap (one batch per prompt length bin, see
+        ``_abatch_by_length``). Chunks that error out or fail validation
+        are re-run through the regular retry path.
+
+        When a screening chain is configured (cascade routing), every chunk
+        is first analyzed by Haiku and only uncertain or risky chunks are
+        re-sent to the tier model. With ``PARALLEL_ASPECTS`` enabled each
+        chunk is instead split into concurrent per-aspect prompts on the
+        tier model.
+
+        Args:
+            tweet_chunks: Tweet data split into chunks (same shape as tweet_data)
+            user_profile: Twitter profile information
+            purpose: Analysis purpose
+            analysis_config: Analysis configuration overrides
+
+        Returns:
+            List of per-chunk analysis results, in chunk order
+
+        Raises:
+            ValueError: If input validation fails
+            RuntimeError: If a chunk fails after retries
+        """
+        start_time = time.time()
+        purpose = _normalize_purpose(purpose)
+
+        # Validate inputs across all chunks
+        all_tweets = [t for chunk in tweet_chunks for t in chunk.get("tweets", [])]
+        self._validate_inputs({"tweets": all_tweets}, user_profile)
+
+        # Generate one prompt per chunk
+        prompts = [
+            get_analysis_prompt(
+                purpose=purpose,
+                tweet_data=chunk,
+                user_profile=user_profile,
+                analysis_config=self._prompt_config(analysis_config)
+            )
+            for chunk in tweet_chunks
+        ]
+
+        # Fan out over the chain (screening model first when cascading)
+        inputs = [_prompt_input(prompt) for prompt in prompts]
+        models = [self.model_enum.value] * len(prompts)
+
+        if self.aspect_chain is not None:
+            aspect_inputs = []
+            for chunk in tweet_chunks:
+                static_prefixes, dynamic_suffix = get_aspect_prompts(
+                    purpose=purpose,
+                    tweet_data=chunk,
+                    user_profile=user_profile,
+                    analysis_config=self._prompt_config(analysis_config)
+                )
+                aspect_inputs.append({**static_prefixes, "dynamic_suffix": dynamic_suffix})
+            aspect_outputs, usages = await self._abatch_by_length(
+                self.aspect_chain,
+                aspect_inputs,
+                calls_per_input=len(ASPECT_SECTIONS)
+            )
+            outputs = [
+                self._merge_aspects(aspect_prompts, output, usage)
+                for aspect_prompts, output, usage
+                in zip(aspect_inputs, aspect_outputs, usages)
+            ]
+        elif self.screening_chain is not None:
+            outputs, usages = await self._abatch_by_length(
+                self.screening_chain,
+                inputs,
+                model_enum=self.screening_model
+            )
+            models = [self.screening_model.value] * len(prompts)
+
+            # Escalate uncertain, risky or failed chunks to the tier model
+            escalate = [
+                i for i, output in enumerate(outputs)
+                if self._needs_escalation(output)
+            ]
+            if escalate:
+                logger.info(
+                    f"Escalating {len(escalate)}/{len(prompts)} chunks "
+                    f"to {self.model_enum.value}"
+                )
+                escalated, escalated_usages = await self._abatch_by_length(
+                    self.analysis_chain,
+                    [inputs[i] for i in escalate]
+                )
+                for i, output, usage in zip(escalate, escalated, escalated_usages):
+                    outputs[i] = output
+                    usages[i] = _merge_usage(usages[i], usage)
+                    models[i] = self.model_enum.value
+        else:
+            outputs, usages = await self._abatch_by_length(self.analysis_chain, inputs)
+
+        # Retry failed chunks individually
+        failed = [
+            i for i, output in enumerate(outputs)
+            if isinstance(output, Exception) or not self._validate_result(output)
+        ]
+        if failed:
+            logger.warning(
+                f"{len(failed)}/{len(prompts)} chunks failed in batch, "
+                f"retrying individually"
+            )
+            retried = await asyncio.gather(*[
+                self._execute_with_retry(
+                    analysis_prompt=prompts[i],
+                    max_retries=AnalysisConfig.MAX_RETRIES
+                )
+                for i in failed
+            ])
+            for i, result in zip(failed, retried):
+                outputs[i] = result
+                models[i] = self.model_enum.value
+
+        # Add metadata
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        for prompt, result, model, usage in zip(prompts, outputs, models, usages):
+            if "token_count" not in result:
+                self._record_tokens(result, "".join(prompt), usage)
+            result["processing_time_ms"] = processing_time_ms
+            result["model_used"] = model
+            result["tier"] = self.tier
+
+        logger.info(
+            f"Chunked analysis of {len(prompts)} chunks completed "
+            f"in {processing_time_ms}ms"
+        )
+
+        return outputs
+
+    async def analyze_multi_purpose(
+        self,
+        tweet_chunks: List[Dict[str, Any]],
+        user_profile: Dict[str, Any],
+        purposes: List[str],
+        analysis_config: Optional[Dict[str, Any]] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Analyze tweet chunks for several purposes, sharing the purpose-agnostic sections
+
+        Sentiment, themes and engagement don't depend on the purpose, so
+        they come from one call per chunk for all purposes (see
+        ``SHARED_SECTIONS``); risk, bias, recommendations and the summary
+        sections come from one call per purpose and chunk. Both sets go out
+        concurrently through ``abatch``. Where a shared or purpose call fails
+        or the merged result is incomplete, that chunk is re-run for the
+        purpose with the comprehensive prompt through the regular retry
+        path.
+
+        The shared calls' tokens are counted on the first purpose's results,
+        so token counts summed over the purposes match what was billed.
+
+        Args:
+            tweet_chunks: Tweet data split into chunks (same shape as tweet_data)
+            user_profile: Twitter profile information
+            purposes: Analysis purposes
+            analysis_config: Analysis configuration overrides
+
+        Returns:
+            Per-chunk analysis results for each purpose, in purposes order
+
+        Raises:
+            ValueError: If input validation fails
+            RuntimeError: If a chunk fails after retries
+        """
+        start_time = time.time()
+        purposes = [_normalize_purpose(purpose) for purpose in purposes]
+
+        # Validate inputs across all chunks
+        all_tweets = [t for chunk in tweet_chunks for t in chunk.get("tweets", [])]
+        self._validate_inputs({"tweets": all_tweets}, user_profile)
+
+        # The dynamic suffix is the same for every prompt over a chunk
+        tweet_token_budget = self._prompt_config(analysis_config).get("max_prompt_tweet_tokens")
+        contexts = [
+            format_analysis_context(chunk, user_profile, tweet_token_budget)
+            for chunk in tweet_chunks
+        ]
+        shared_prompts = [(build_shared_prefix(), context) for context in contexts]
+        purpose_prompts = [
+            [(build_purpose_prefix(purpose), context) for context in contexts]
+            for purpose in purposes
+        ]
+
+        (shared_outputs, shared_usages), (purpose_outputs, purpose_usages) = await asyncio.gather(
+            self._abatch_by_length(
+                self.shared_chain,
+                [_prompt_input(prompt) for prompt in shared_prompts]
+            ),
+            self._abatch_by_length(
+                self.purpose_chain,
+                [_prompt_input(prompt) for prompts in purpose_prompts for prompt in prompts]
+            )
+        )
+
+        # Merge each purpose's sections with the shared ones
+        results: List[List[Any]] = []
+        failed: List[Tuple[int, int]] = []
+        for p, prompts in enumerate(purpose_prompts):
+            results.append([])
+            for c, purpose_prompt in enumerate(prompts):
+                i = p * len(contexts) + c
+                result = _merge_sections(shared_outputs[c], purpose_outputs[i])
+                if result is None or not self._validate_result(result):
+                    failed.append((p, c))
+                    results[p].append(None)
+                    continue
+
+                prompt_text = "".join(purpose_prompt)
+                usage = purpose_usages[i]
+                if p == 0:
+                    prompt_text += "".join(shared_prompts[c])
+                    usage = _merge_usage(usage, shared_usages[c])
+                self._record_tokens(result, prompt_text, usage)
+                results[p].append(result)
+
+        # Re-run failed chunks with the purpose's comprehensive prompt
+        if failed:
+            logger.warning(
+                f"{len(failed)}/{len(purposes) * len(contexts)} purpose chunks "
+                f"failed in batch, retrying individually"
+            )
+            retried = await asyncio.gather(*[
+                self._execute_with_retry(
+                    analysis_prompt=(build_static_prefix(purposes[p]), contexts[c]),
+                    max_retries=AnalysisConfig.MAX_RETRIES
+                )
+                for p, c in failed
+            ])
+            for (p, c), result in zip(failed, retried):
+                results[p][c] = result
+
+        # Add metadata
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        for chunk_results in results:
+            for result in chunk_results:
+                result["processing_time_ms"] = processing_time_ms
+                result["model_used"] = self.model_enum.value
+                result["tier"] = self.tier
+
+        logger.info(
+            f"Multi-purpose analysis of {len(contexts)} chunks for "
+            f"{len(purposes)} purposes completed in {processing_time_ms}ms"
+        )
+
+        return results
+
+    async def analyze_many(
+        self,
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyze several independent requests concurrently
+
+        Requests are served from the result cache where possible; the rest
+        go out together through ``abatch`` (see ``_abatch_by_length``), so
+        they share the warm prompt-cache prefix instead of paying for one
+        round-trip after another. Requests that error out or fail
+        validation are re-run through the regular retry path.
+
+        Args:
+            items: Requests, each a dict with ``tweet_data`` and
+                ``user_profile`` plus optional ``purpose`` and
+                ``analysis_config``
+
+        Returns:
+            List of analysis results, in request order
+
+        Raises:
+            ValueError: If input validation fails
+            RuntimeError: If a request fails after retries
+        """
+        start_time = time.time()
+
+        requests = [
+            (
+                item["tweet_data"],
+                item["user_profile"],
+                _normalize_purpose(item.get("purpose", "personal_reputation")),
+                item.get("analysis_config") or {}
+            )
+            for item in items
+        ]
+
+        # Validate inputs for every request up front
+        for tweet_data, user_profile, _, _ in requests:
+            self._validate_inputs(tweet_data, user_profile)
+
+        # Reuse recent identical analyses
+        cache_keys = [self._result_cache_key(*request) for request in requests]
+        results: List[Optional[Dict[str, Any]]] = [
+            self._get_cached_result(cache_key, start_time)
+            for cache_key in cache_keys
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+
+        # Generate prompts and fan out over the chain
+        prompts = {
+            i: get_analysis_prompt(
+                purpose=requests[i][2],
+                tweet_data=requests[i][0],
+                user_profile=requests[i][1],
+                analysis_config=self._prompt_config(requests[i][3])
+            )
+            for i in pending
+        }
+        outputs, usages = await self._abatch_by_length(
+            self.analysis_chain,
+            [_prompt_input(prompts[i]) for i in pending]
+        )
+
+        failed = []
+        for i, output, usage in zip(pending, outputs, usages):
+            if isinstance(output, Exception) or not self._validate_result(output):
+                failed.append(i)
+                continue
+            self._record_tokens(output, "".join(prompts[i]), usage)
+            results[i] = output
+
+        # Retry failed requests individually
+        if failed:
+            logger.warning(
+                f"{len(failed)}/{len(pending)} requests failed in batch, "
+                f"retrying individually"
+            )
+            retried = await asyncio.gather(*[
+                self._execute_with_retry(
+                    analysis_prompt=prompts[i],
+                    max_retries=AnalysisConfig.MAX_RETRIES
+                )
+                for i in failed
+            ])
+            for i, result in zip(failed, retried):
+                results[i] = result
+
+        # Add metadata
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        for i in pending:
+            result = results[i]
+            result["processing_time_ms"] = processing_time_ms
+            result["model_used"] = self.model_enum.value
+            result["tier"] = self.tier
+            self._cache_result(cache_keys[i], result)
+
+        logger.info(
+            f"Batched analysis of {len(items)} requests "
+            f"({len(items) - len(pending)} cached) completed in {processing_time_ms}ms"
+        )
+
+        return results
+
+    async def _abatch_by_length(
+        self,
+        chain: Any,
+        inputs: List[Dict[str, Any]],
+        model_enum: Optional[AIModel] = None,
+        calls_per_input: int = 1
+    ) -> Tuple[List[Any], List[Dict[str, int]]]:
+        """
+        Run chain.abatch with inputs grouped into prompt length bins
+
+        Each bin goes out as its own concurrent batch so short prompts are
+        not held behind long ones; the concurrency limit is split across
+        bins by size. Each bin waits on the model's rate limiter before it
+        goes out. Failures are returned in place as exceptions.
+
+        Args:
+            chain: Runnable to batch
+            inputs: Chain inputs (dicts of prompt strings)
+            model_enum: Model the chain runs on (defaults to the tier model)
+            calls_per_input: LLM requests the chain makes per input
+
+        Returns:
+            Tuple of (chain outputs, Anthropic usage per input), in input order
+        """
+        bins: Dict[int, List[int]] = {}
+        for i, chain_input in enumerate(inputs):
+            tokens = sum(len(v) for v in chain_input.values() if isinstance(v, str)) // 4
+            bins.setdefault(bisect.bisect(AnalysisConfig.LENGTH_BIN_TOKENS, tokens), []).append(i)
+
+        rate_limiter = get_rate_limiter(model_enum or self.model_enum)
+
+        async def run_bin(indices: List[int]) -> List[Any]:
+            await rate_limiter.acquire(len(indices) * calls_per_input)
+            max_concurrency = max(
+                1,
+                AnalysisConfig.MAX_PARALLEL_ANALYSES * len(indices) // len(inputs)
+            )
+            return await chain.abatch(
+                [inputs[i] for i in indices],
+                config=[
+                    {"max_concurrency": max_concurrency, "callbacks": [usage_handlers[i]]}
+                    for i in indices
+                ],
+                return_exceptions=True
+            )
+
+        usage_handlers = [UsageCallbackHandler() for _ in inputs]
+        outputs: List[Any] = [None] * len(inputs)
+        binned = list(bins.values())
+        for indices, bin_outputs in zip(binned, await asyncio.gather(*map(run_bin, binned))):
+            for i, output in zip(indices, bin_outputs):
+                outputs[i] = output
+
+        return outputs, [handler.usage for handler in usage_handlers]
+
+    async def analyze_stream(
         self,
         tweet_data: Dict[str, Any],
         user_profile: Dict[str, Any],
         purpose: str = "personal_reputation",
         analysis_config: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Synchronous version of analyze method
+        Stream analysis results as the model generates them
+
+        The chain is consumed with ``astream`` so the JSON output parser
+        yields progressively more complete partial dicts (sentiment and
+        themes typically arrive first). The last item yielded is always
+        the complete, validated result with metadata attached.
 
         Args:
             tweet_data: Aggregated tweet data
@@ -162,27 +1155,63 @@ class LangChainAnalyzer:
             purpose: Analysis purpose
             analysis_config: Analysis configuration overrides
 
-        Returns:
-            Analysis results as dictionary
+        Yields:
+            Partial analysis dicts, followed by the final result
+
+        Raises:
+            ValueError: If input validation fails
+            RuntimeError: If analysis fails after retries
         """
         start_time = time.time()
+        purpose = _normalize_purpose(purpose)
 
         # Validate inputs
         self._validate_inputs(tweet_data, user_profile)
 
+        # Reuse a recent identical analysis
+        cache_key = self._result_cache_key(
+            tweet_data,
+            user_profile,
+            purpose,
+            analysis_config
+        )
+        cached = self._get_cached_result(cache_key, start_time)
+        if cached is not None:
+            yield cached
+            return
+
         # Generate analysis prompt
         analysis_prompt = get_analysis_prompt(
             purpose=purpose,
             tweet_data=tweet_data,
             user_profile=user_profile,
-            analysis_config=analysis_config or {}
+            analysis_config=self._prompt_config(analysis_config)
         )
 
-        # Execute analysis with retries
-        result = self._execute_with_retry_sync(
-            analysis_prompt=analysis_prompt,
-            max_retries=AnalysisConfig.MAX_RETRIES
-        )
+        # Stream partial JSON from the chain
+        result: Optional[Dict[str, Any]] = None
+        usage_handler = UsageCallbackHandler()
+        try:
+            await self.rate_limiter.acquire()
+            async for partial in self.analysis_chain.astream(
+                _prompt_input(analysis_prompt),
+                config={"callbacks": [usage_handler]}
+            ):
+                result = partial
+                yield partial
+            result = self._parse_streamed(result, usage_handler)
+        except Exception as e:
+            logger.warning(f"Streaming analysis failed, falling back: {e}")
+            result = None
+
+        if result and self._validate_result(result):
+            self._record_tokens(result, "".join(analysis_prompt), usage_handler.usage)
+        else:
+            # Incomplete stream, fall back to the regular retry path
+            result = await self._execute_with_retry(
+                analysis_prompt=analysis_prompt,
+                max_retries=AnalysisConfig.MAX_RETRIES
+            )
 
         # Add metadata
         result["processing_time_ms"] = int((time.time() - start_time) * 1000)
@@ -190,121 +1219,269 @@ class LangChainAnalyzer:
         result["tier"] = self.tier
 
         logger.info(
-            f"Analysis completed in {result['processing_time_ms']}ms "
+            f"Streamed analysis completed in {result['processing_time_ms']}ms "
             f"using {result.get('token_count', 0)} tokens"
         )
 
-        return result
+        self._cache_result(cache_key, result)
+
+        yield result
+
+    def analyze_sync(
+        self,
+        tweet_data: Dict[str, Any],
+        user_profile: Dict[str, Any],
+        purpose: str = "personal_reputation",
+        analysis_config: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Synchronous version of analyze method
+
+        Runs ``analyze`` on the shared background event loop, so sync
+        callers get the same retry, rate-limiting and caching behaviour
+        and the pooled async clients stay bound to a single loop.
+
+        Args:
+            tweet_data: Aggregated tweet data
+            user_profile: Twitter profile information
+            purpose: Analysis purpose
+            analysis_config: Analysis configuration overrides
+
+        Returns:
+            Analysis results as dictionary
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.analyze(
+                tweet_data=tweet_data,
+                user_profile=user_profile,
+                purpose=purpose,
+                analysis_config=analysis_config
+            ),
+            _get_sync_loop()
+        ).result()
+
+    def _route_by_size(self, analysis_prompt: Tuple[str, str]) -> Tuple[AIModel, Any]:
+        """
+        Pick the model and chain for a single analysis by prompt size
+
+        Prompts estimated under ``SMALL_INPUT_TOKENS`` go to the small-input
+        model when the tier has one; everything else uses the tier model.
+        """
+        if self.small_input_chain is not None:
+            prompt_tokens = sum(len(part) for part in analysis_prompt) // 4
+            if prompt_tokens < AnalysisConfig.SMALL_INPUT_TOKENS:
+                logger.debug(
+                    f"Routing {prompt_tokens}-token prompt to "
+                    f"{self.small_input_model.value}"
+                )
+                return self.small_input_model, self.small_input_chain
+
+        return self.model_enum, self.analysis_chain
 
     async def _execute_with_retry(
         self,
-        analysis_prompt: str,
-        max_retries: int
+        analysis_prompt: Tuple[str, str],
+        max_retries: int,
+        chain: Optional[Any] = None,
+        model_enum: Optional[AIModel] = None
     ) -> Dict[str, Any]:
-        """Execute analysis with retry logic"""
-        last_error = None
+        """
+        Execute analysis with retry logic
 
-        for attempt in range(max_retries):
-            try:
-                logger.debug(f"Analysis attempt {attempt + 1}/{max_retries}")
-
-                # Invoke chain
-                result = await self.analysis_chain.ainvoke({
-                    "analysis_prompt": analysis_prompt
-                })
-
-                # Validate result
-                if self._validate_result(result):
-                    # Estimate token count (Claude returns usage in metadata)
-                    result["token_count"] = self._estimate_tokens(
-                        analysis_prompt,
-                        str(result)
-                    )
-                    return result
-
-                raise ValueError("Result validation failed")
-
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON parsing error on attempt {attempt + 1}: {e}")
-                last_error = e
-
-                # If not last attempt, try with clarification prompt
-                if attempt < max_retries - 1:
-                    analysis_prompt = get_retry_prompt(
-                        str(result) if 'result' in locals() else "",
-                        str(e)
-                    )
-
-            except Exception as e:
-                logger.error(f"Analysis error on attempt {attempt + 1}: {e}")
-                last_error = e
-
-                # Exponential backoff
-                if attempt < max_retries - 1:
-                    wait_time = AnalysisConfig.RETRY_DELAY * (2 ** attempt)
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-
-        # All retries failed
-        raise RuntimeError(
-            f"Analysis failed after {max_retries} attempts. "
-            f"Last error: {last_error}"
+        Transient API errors (rate limits, connection errors, 5xx) are
+        retried with backoff; unparseable or incomplete responses are
+        retried without backoff, rewriting the prompt for JSON errors. Both
+        draw on the same ``max_retries`` attempts, so one analysis makes at
+        most ``max_retries`` requests. Other errors fail immediately.
+
+        Args:
+            analysis_prompt: (static prefix, dynamic suffix) prompt
+            max_retries: Maximum attempts (requests) for the analysis
+            chain: Analysis chain to run (defaults to the tier chain)
+            model_enum: Model behind ``chain``, for rate limiting
+        """
+        attempts = 0
+
+        try:
+            async for attempt in AsyncRetrying(**_retry_policy(max_retries)):
+                with attempt:
+                    attempts += 1
+                    logger.debug(f"Analysis attempt {attempts}/{max_retries}")
+                    try:
+                        return await self._invoke_once(
+                            analysis_prompt,
+                            chain=chain,
+                            model_enum=model_enum
+                        )
+                    except _SEMANTIC_ERRORS as e:
+                        logger.warning(f"Invalid response on attempt {attempts}: {e}")
+                        analysis_prompt = self._retry_prompt(analysis_prompt, e)
+                        raise
+
+        except Exception as e:
+            logger.error(f"Analysis error on attempt {attempts}: {e}")
+            raise RuntimeError(
+                f"Analysis failed after {attempts} attempts. "
+                f"Last error: {e}"
+            ) from e
+
+    async def _invoke_once(
+        self,
+        analysis_prompt: Tuple[str, str],
+        chain: Optional[Any] = None,
+        model_enum: Optional[AIModel] = None
+    ) -> Dict[str, Any]:
+        """
+        Stream the analysis chain once and validate the result
+
+        The response is parsed incrementally as it streams, so a malformed
+        opening aborts generation early and surfaces as a semantic error.
+        The complete text is then parsed strictly (see ``_parse_streamed``).
+        """
+        chain = chain or self.analysis_chain
+        rate_limiter = get_rate_limiter(model_enum) if model_enum else self.rate_limiter
+
+        await rate_limiter.acquire()
+        usage_handler = UsageCallbackHandler()
+        result = None
+        async for result in chain.astream(
+            _prompt_input(analysis_prompt),
+            config={"callbacks": [usage_handler]}
+        ):
+            pass
+
+        result = self._parse_streamed(result, usage_handler)
+        return self._finalize_result(analysis_prompt, result, usage_handler)
+
+    def _parse_streamed(
+        self,
+        result: Any,
+        usage_handler: UsageCallbackHandler
+    ) -> Any:
+        """
+        Strictly parse the full text of a streamed response
+
+        langchain-core's cumulative JSON parser only ever parses partially,
+        so the last streamed value of a truncated or malformed response is a
+        patched-up dict. Re-parsing the complete text raises
+        OutputParserException for it instead. Returns the streamed value
+        unchanged when no generation text was reported.
+        """
+        if usage_handler.text is None:
+            return result
+        return self.output_parser.parse_result(
+            [Generation(text=usage_handler.text)],
+            partial=False
         )
 
-    def _execute_with_retry_sync(
+    def _finalize_result(
         self,
-        analysis_prompt: str,
-        max_retries: int
+        analysis_prompt: Tuple[str, str],
+        result: Any,
+        usage_handler: UsageCallbackHandler
     ) -> Dict[str, Any]:
-        """Synchronous version of execute with retry"""
-        last_error = None
+        """
+        Validate a chain result and attach its token count
 
-        for attempt in range(max_retries):
-            try:
-                logger.debug(f"Analysis attempt {attempt + 1}/{max_retries}")
-
-                # Invoke chain
-                result = self.analysis_chain.invoke({
-                    "analysis_prompt": analysis_prompt
-                })
-
-                # Validate result
-                if self._validate_result(result):
-                    # Estimate token count
-                    result["token_count"] = self._estimate_tokens(
-                        analysis_prompt,
-                        str(result)
-                    )
-                    return result
-
-                raise ValueError("Result validation failed")
-
-            except json.JSONDecodeError as e:
-                logger.warning(f"JSON parsing error on attempt {attempt + 1}: {e}")
-                last_error = e
-
-                # If not last attempt, try with clarification prompt
-                if attempt < max_retries - 1:
-                    analysis_prompt = get_retry_prompt(
-                        str(result) if 'result' in locals() else "",
-                        str(e)
-                    )
-
-            except Exception as e:
-                logger.error(f"Analysis error on attempt {attempt + 1}: {e}")
-                last_error = e
-
-                # Exponential backoff
-                if attempt < max_retries - 1:
-                    wait_time = AnalysisConfig.RETRY_DELAY * (2 ** attempt)
-                    logger.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-
-        # All retries failed
-        raise RuntimeError(
-            f"Analysis failed after {max_retries} attempts. "
-            f"Last error: {last_error}"
+        Raises:
+            InvalidResultError: If the result is missing required keys
+        """
+        if not self._validate_result(result):
+            raise InvalidResultError("Result validation failed")
+
+        self._record_tokens(result, "".join(analysis_prompt), usage_handler.usage)
+        return result
+
+    def _retry_prompt(
+        self,
+        analysis_prompt: Tuple[str, str],
+        error: Exception
+    ) -> Tuple[str, str]:
+        """
+        Get the prompt for a retry after an invalid response
+
+        JSON errors swap the dynamic suffix for a clarification prompt
+        quoting the bad output; incomplete results reuse the same prompt.
+        """
+        if isinstance(error, InvalidResultError):
+            return analysis_prompt
+
+        original_response = (
+            getattr(error, "llm_output", None) or getattr(error, "doc", "") or ""
         )
+        return (analysis_prompt[0], get_retry_prompt(original_response, str(error)))
+
+    def _prompt_config(
+        self,
+        analysis_config: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Analysis config for prompt generation, with the tier's tweet budget as default"""
+        return {
+            "max_prompt_tweet_tokens": self.tweet_token_budget,
+            **(analysis_config or {})
+        }
+
+    def _result_cache_key(
+        self,
+        tweet_data: Dict[str, Any],
+        user_profile: Dict[str, Any],
+        purpose: str,
+        analysis_config: Optional[Dict[str, Any]]
+    ) -> Optional[bytes]:
+        """
+        Build the in-process result cache key for an analysis request
+
+        Hashes the canonical JSON of the request together with the tier,
+        model, prompt version and the effective prompt config (tiers sharing
+        a model still differ in tweet budget). Returns None when the inputs
+        cannot be serialized, which disables caching for the request.
+        """
+        try:
+            payload = orjson.dumps(
+                (
+                    self.tier,
+                    self.model_enum.value,
+                    AnalysisConfig.PROMPT_VERSION,
+                    purpose,
+                    tweet_data,
+                    user_profile,
+                    self._prompt_config(analysis_config)
+                ),
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError as e:
+            logger.debug(f"Result cache disabled for request: {e}")
+            return None
+
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _get_cached_result(
+        self,
+        cache_key: Optional[bytes],
+        start_time: float
+    ) -> Optional[Dict[str, Any]]:
+        """Return a copy of a cached result with fresh timing, or None on miss"""
+        if cache_key is None:
+            return None
+
+        with _result_cache_lock:
+            cached = _result_cache.get(cache_key)
+        if cached is None:
+            return None
+
+        result = copy.deepcopy(cached)
+        result["processing_time_ms"] = int((time.time() - start_time) * 1000)
+        result["tier"] = self.tier
+        logger.info(f"Result cache hit for tier '{self.tier}'")
+        return result
+
+    def _cache_result(self, cache_key: Optional[bytes], result: Dict[str, Any]):
+        """Store a copy of a final result in the in-process result cache"""
+        if cache_key is None:
+            return
+
+        with _result_cache_lock:
+            _result_cache[cache_key] = copy.deepcopy(result)
 
     def _validate_inputs(
         self,
@@ -327,38 +1504,134 @@ class LangChainAnalyzer:
         if not user_profile:
             raise ValueError("User profile is required")
 
-        required_fields = ["username"]
-        missing = [f for f in required_fields if f not in user_profile]
+        missing = _REQUIRED_PROFILE_FIELDS - user_profile.keys()
         if missing:
-            raise ValueError(f"Missing required profile fields: {missing}")
+            raise ValueError(f"Missing required profile fields: {sorted(missing)}")
 
     def _validate_result(self, result: Dict[str, Any]) -> bool:
         """Validate analysis result structure"""
-        required_keys = [
-            "sentiment",
-            "themes",
-            "engagement",
-            "risk_assessment",
-            "bias_indicators",
-            "recommendations",
-            "executive_summary",
-            "key_findings",
-            "confidence_level",
-            "human_review_required"
-        ]
+        if not isinstance(result, dict):
+            logger.warning(f"Result is not a JSON object: {type(result).__name__}")
+            return False
 
-        for key in required_keys:
-            if key not in result:
-                logger.warning(f"Missing required key in result: {key}")
-                return False
+        missing = _REQUIRED_RESULT_KEYS - result.keys()
+        if missing:
+            logger.warning(f"Missing required keys in result: {sorted(missing)}")
+            return False
 
         return True
 
-    def _estimate_tokens(self, input_text: str, output_text: str) -> int:
+    def _merge_aspects(
+        self,
+        aspect_prompts: Dict[str, str],
+        output: Any,
+        usage: Optional[Dict[str, int]] = None
+    ) -> Any:
+        """
+        Merge per-aspect outputs into a single analysis result
+
+        Args:
+            aspect_prompts: Aspect chain input (static prefixes and dynamic suffix)
+            output: Aspect chain output (or the exception it raised)
+            usage: Anthropic usage summed over the aspect calls
+
+        Returns:
+            Combined result dict, or the exception unchanged
+        """
+        if isinstance(output, Exception):
+            return output
+
+        result: Dict[str, Any] = {}
+        for aspect, (_, keys) in ASPECT_SECTIONS.items():
+            section = output.get(aspect)
+            if not isinstance(section, dict):
+                continue
+            result.update((key, section[key]) for key in keys if key in section)
+
+        self._record_tokens(
+            result,
+            "".join(aspect_prompts.values()),
+            usage,
+            output=output
+        )
+        return result
+
+    def _needs_escalation(self, result: Any) -> bool:
+        """
+        Check whether a screening result should be re-run on the tier model
+
+        Escalates failed or invalid results, low-confidence results and
+        results that look risky.
+        """
+        if isinstance(result, Exception) or not self._validate_result(result):
+            return True
+
+        try:
+            confidence = float(result.get("confidence_level", 0))
+            risk_score = float(
+                result["risk_assessment"].get("overall_risk_score", 0)
+            )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return True
+
+        return (
+            confidence < AnalysisConfig.HIGH_CONFIDENCE_THRESHOLD
+            or risk_score > AnalysisConfig.MEDIUM_RISK_THRESHOLD
+            or bool(result["risk_assessment"].get("escalation_required"))
+        )
+
+    def _record_tokens(
+        self,
+        result: Dict[str, Any],
+        input_text: str,
+        usage: Optional[Dict[str, int]] = None,
+        output: Any = None
+    ):
+        """
+        Attach token accounting to a result
+
+        Sets ``token_count`` from Claude's usage metadata and keeps the raw
+        counters (including prompt cache writes and reads) under
+        ``token_usage``; without usage the count falls back to the
+        character estimate.
+
+        Args:
+            result: Result dict to update
+            input_text: Prompt text (used for the estimate)
+            usage: Anthropic ``usage`` counters, if reported
+            output: Raw output to estimate from (defaults to result)
+        """
+        if usage:
+            result["token_usage"] = dict(usage)
+        result["token_count"] = self._estimate_tokens(
+            input_text,
+            _dumps(result if output is None else output),
+            usage
+        )
+
+    def _estimate_tokens(
+        self,
+        input_text: str,
+        output_text: str,
+        usage: Optional[Dict[str, int]] = None
+    ) -> int:
         """
-        Estimate token count (rough approximation)
-        Claude's actual token count would come from API metadata
+        Count tokens from Claude's usage metadata, or estimate them
+
+        Args:
+            input_text: Prompt text (used for the estimate)
+            output_text: Response text (used for the estimate)
+            usage: Anthropic ``usage`` counters (see UsageCallbackHandler);
+                cache creation and cache read tokens count as input tokens
         """
+        if usage:
+            if usage.get("cache_read_input_tokens"):
+                logger.debug(
+                    f"Prompt cache hit: {usage['cache_read_input_tokens']} "
+                    f"input tokens read from cache"
+                )
+            return sum(usage.get(key, 0) for key in _USAGE_TOKEN_KEYS)
+
         # Rough estimate: ~4 characters per token
         input_tokens = len(input_text) // 4
         output_tokens = len(output_text) // 4
@@ -406,6 +1679,11 @@ def get_model_for_tier_name(tier: str) -> str:
 
 __all__ = [
     "LangChainAnalyzer",
+    "OrjsonOutputParser",
+    "UsageCallbackHandler",
+    "RequestRateLimiter",
+    "get_rate_limiter",
+    "get_llm",
     "create_analyzer",
     "get_model_for_tier_name"
 ]
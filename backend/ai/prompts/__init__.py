@@ -6,6 +6,8 @@ from .analysis_prompt import SYSTEM_PROMPT, get_analysis_prompt, get_retry_promp
 from .risk_prompts import (
     RISK_DETECTION_SYSTEM_PROMPT,
     get_risk_analysis_prompt,
+    get_risk_prompt_parts,
+    get_batched_risk_prompt,
     get_composite_risk_prompt
 )
 
@@ -15,5 +17,7 @@ __all__ = [
     "get_retry_prompt",
     "RISK_DETECTION_SYSTEM_PROMPT",
     "get_risk_analysis_prompt",
+    "get_risk_prompt_parts",
+    "get_batched_risk_prompt",
     "get_composite_risk_prompt"
 ]
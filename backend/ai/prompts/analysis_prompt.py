@@ -3,8 +3,11 @@ Analysis Prompt Templates
 Comprehensive prompts for Twitter reputation analysis
 """
 
-from typing import Dict, Any, List
-from datetime import datetime
+import hashlib
+import re
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+from datetime import date
+from functools import lru_cache
 
 
 # ============================================================================
@@ -23,6 +26,29 @@ SYSTEM_PROMPT = """You are an elite Reputation Risk & Bias Assessment Specialist
 You MUST return ONLY valid JSON in the exact schema provided. Do not include any explanatory text before or after the JSON."""
 
 
+# Tweet text is cut to this many characters in the prompt
+MAX_PROMPT_TWEET_CHARS = 280
+
+# Characters _format_tweets adds around each tweet's text
+_TWEET_FORMAT_OVERHEAD_CHARS = 80
+
+# Tweets whose SimHashes differ in at most this many bits are near duplicates
+_SIMHASH_MAX_DISTANCE = 3
+
+# Fingerprints are split into MAX_DISTANCE + 1 bands; two fingerprints within
+# the distance agree on at least one whole band, so only tweets sharing a
+# band with a kept tweet need a full comparison
+_SIMHASH_BAND_BITS = 64 // (_SIMHASH_MAX_DISTANCE + 1)
+_SIMHASH_BAND_SHIFTS = range(0, 64, _SIMHASH_BAND_BITS)
+_SIMHASH_BAND_MASK = (1 << _SIMHASH_BAND_BITS) - 1
+
+# Width of the per-bit counters simhash sums word hashes into
+_SIMHASH_LANE_BITS = 32
+_SIMHASH_LANE_MASK = (1 << _SIMHASH_LANE_BITS) - 1
+
+_WORD_RE = re.compile(r"\w+")
+
+
 # ============================================================================
 # Base Analysis Prompt
 # ============================================================================
@@ -32,10 +58,166 @@ def get_analysis_prompt(
     tweet_data: Dict[str, Any],
     user_profile: Dict[str, Any],
     analysis_config: Dict[str, Any]
-) -> str:
+) -> Tuple[str, str]:
     """
     Generate comprehensive analysis prompt
 
+    The prompt is split into a static prefix (purpose, requirements and
+    instructions) and a dynamic suffix (date, profile and tweets), so the
+    prefix stays byte-identical across calls for a purpose and can be
+    prompt-cached. The output schema is not included; the analyzer sends
+    ``get_json_schema()`` as its own cached content block.
+
+    Args:
+        purpose: User's stated purpose for analysis
+        tweet_data: Aggregated tweet data
+        user_profile: Twitter profile information
+        analysis_config: Analysis configuration parameters
+
+    Returns:
+        Tuple of (static prefix, dynamic suffix)
+    """
+    return (
+        build_static_prefix(purpose),
+        format_analysis_context(
+            tweet_data,
+            user_profile,
+            analysis_config.get("max_prompt_tweet_tokens")
+        )
+    )
+
+
+@lru_cache(maxsize=16)
+def build_static_prefix(purpose: str) -> str:
+    """
+    Build (and memoize) the static prefix of the comprehensive prompt
+
+    Cached per purpose, so every call returns the same byte-identical
+    string without re-rendering the requirement sections.
+
+    Args:
+        purpose: User's stated purpose for analysis
+
+    Returns:
+        Static prompt prefix
+    """
+    return _format_instructions(
+        purpose,
+        "comprehensive",
+        _get_requirement_sections(purpose).values()
+    )
+
+
+def format_analysis_context(
+    tweet_data: Dict[str, Any],
+    user_profile: Dict[str, Any],
+    tweet_token_budget: Optional[int] = None
+) -> str:
+    """
+    Format the date, profile and tweet data shared by all analysis prompts
+
+    This is the dynamic part of every prompt and goes after the static
+    instructions.
+
+    Args:
+        tweet_data: Aggregated tweet data
+        user_profile: Twitter profile information
+        tweet_token_budget: Maximum estimated tokens of tweets to include
+
+    Returns:
+        Formatted context block
+    """
+    return "".join((
+        "Analyze the following Twitter data.\n\n**ANALYSIS DATE**: ",
+        date.today().isoformat(),
+        "\n\n",
+        _format_profile(
+            user_profile.get('username', 'unknown'),
+            user_profile.get('display_name', 'N/A'),
+            user_profile.get('follower_count', 0),
+            user_profile.get('following_count', 0),
+            user_profile.get('created_at', 'N/A'),
+            user_profile.get('verified', False),
+            user_profile.get('bio', 'N/A')
+        ),
+        "\n\n**TWEET DATA:**\n- Total Tweets Analyzed: ",
+        str(tweet_data.get('total_count', 0)),
+        "\n- Date Range: ",
+        str(tweet_data.get('date_range', 'N/A')),
+        "\n- Average Engagement: ",
+        format(tweet_data.get('avg_engagement', 0), '.2f'),
+        "\n\n**RECENT TWEETS:**\n",
+        _format_tweets(tweet_data.get('tweets', []), tweet_token_budget),
+        "\n\n**ENGAGEMENT SUMMARY:**\n- Total Likes: ",
+        format(tweet_data.get('total_likes', 0), ','),
+        "\n- Total Retweets: ",
+        format(tweet_data.get('total_retweets', 0), ','),
+        "\n- Total Replies: ",
+        format(tweet_data.get('total_replies', 0), ',')
+    ))
+
+
+@lru_cache(maxsize=256)
+def _format_profile(
+    username: str,
+    display_name: str,
+    follower_count: int,
+    following_count: int,
+    created_at: Any,
+    verified: bool,
+    bio: str
+) -> str:
+    """Format (and memoize) the profile block, reused across a user's chunks"""
+    return f"""**PROFILE INFORMATION:**
+- Username: @{username}
+- Display Name: {display_name}
+- Follower Count: {follower_count:,}
+- Following Count: {following_count:,}
+- Account Created: {created_at}
+- Verified: {verified}
+- Bio: {bio}"""
+
+
+# ============================================================================
+# Aspect Prompts
+# ============================================================================
+
+# Aspect -> (requirement sections, result keys) for split analysis; together
+# the aspects cover every key of the comprehensive schema
+ASPECT_SECTIONS: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "sentiment": (
+        ("sentiment", "engagement"),
+        ("sentiment", "engagement")
+    ),
+    "themes": (
+        ("themes",),
+        ("themes", "key_findings")
+    ),
+    "risk": (
+        ("risk",),
+        ("risk_assessment", "executive_summary", "confidence_level", "human_review_required")
+    ),
+    "bias": (
+        ("bias", "recommendations"),
+        ("bias_indicators", "recommendations")
+    )
+}
+
+
+def get_aspect_prompts(
+    purpose: str,
+    tweet_data: Dict[str, Any],
+    user_profile: Dict[str, Any],
+    analysis_config: Dict[str, Any]
+) -> Tuple[Dict[str, str], str]:
+    """
+    Generate one focused prompt per analysis aspect
+
+    Each aspect gets its own static prefix asking for only its sections,
+    followed by the same dynamic suffix, so the aspects can be generated
+    concurrently. As with ``get_analysis_prompt`` the aspect's schema is
+    sent separately.
+
     Args:
         purpose: User's stated purpose for analysis
         tweet_data: Aggregated tweet data
@@ -43,108 +225,210 @@ def get_analysis_prompt(
         analysis_config: Analysis configuration parameters
 
     Returns:
-        Formatted prompt string
+        Tuple of (dict mapping aspect name to static prefix, dynamic suffix)
     """
+    return (
+        dict(_build_aspect_prefixes(purpose)),
+        format_analysis_context(
+            tweet_data,
+            user_profile,
+            analysis_config.get("max_prompt_tweet_tokens")
+        )
+    )
+
+
+@lru_cache(maxsize=16)
+def _build_aspect_prefixes(purpose: str) -> Tuple[Tuple[str, str], ...]:
+    """Build (and memoize) the (aspect, static prefix) pairs for a purpose"""
+    requirements = _get_requirement_sections(purpose)
+
+    return tuple(
+        (aspect, _format_instructions(
+            purpose,
+            "focused",
+            (requirements[name] for name in sections)
+        ))
+        for aspect, (sections, _) in ASPECT_SECTIONS.items()
+    )
 
-    prompt = f"""Analyze the following Twitter data for reputation and sentiment insights.
 
-**USER'S PURPOSE**: {purpose}
-**ANALYSIS DATE**: {datetime.now().strftime('%Y-%m-%d')}
+# ============================================================================
+# Multi-Purpose Prompts
+# ============================================================================
 
-**PROFILE INFORMATION:**
-- Username: @{user_profile.get('username', 'unknown')}
-- Display Name: {user_profile.get('display_name', 'N/A')}
-- Follower Count: {user_profile.get('follower_count', 0):,}
-- Following Count: {user_profile.get('following_count', 0):,}
-- Account Created: {user_profile.get('created_at', 'N/A')}
-- Verified: {user_profile.get('verified', False)}
-- Bio: {user_profile.get('bio', 'N/A')}
+# (requirement sections, result keys) that don't depend on the purpose;
+# generated once when several purposes are analyzed over the same tweets
+SHARED_SECTIONS: Tuple[Tuple[str, ...], Tuple[str, ...]] = (
+    ("sentiment", "themes", "engagement"),
+    ("sentiment", "themes", "engagement")
+)
+
+# (requirement sections, result keys) generated separately for each purpose;
+# together with SHARED_SECTIONS they cover every required result key
+PURPOSE_SECTIONS: Tuple[Tuple[str, ...], Tuple[str, ...]] = (
+    ("risk", "bias", "recommendations"),
+    (
+        "risk_assessment",
+        "bias_indicators",
+        "recommendations",
+        "executive_summary",
+        "key_findings",
+        "confidence_level",
+        "human_review_required"
+    )
+)
+
+
+@lru_cache(maxsize=1)
+def build_shared_prefix() -> str:
+    """
+    Build (and memoize) the purpose-agnostic static prefix
 
-**TWEET DATA:**
-- Total Tweets Analyzed: {tweet_data.get('total_count', 0)}
-- Date Range: {tweet_data.get('date_range', 'N/A')}
-- Average Engagement: {tweet_data.get('avg_engagement', 0):.2f}
+    Asks only for the SHARED_SECTIONS and names no purpose, so one response
+    serves every purpose analyzed over the same tweets.
+    """
+    requirements = _get_requirement_sections("")
 
-**RECENT TWEETS:**
-{_format_tweets(tweet_data.get('tweets', []))}
+    return _format_instructions(
+        None,
+        "focused",
+        (requirements[name] for name in SHARED_SECTIONS[0])
+    )
 
-**ENGAGEMENT SUMMARY:**
-- Total Likes: {tweet_data.get('total_likes', 0):,}
-- Total Retweets: {tweet_data.get('total_retweets', 0):,}
-- Total Replies: {tweet_data.get('total_replies', 0):,}
 
-**ANALYSIS REQUIREMENTS:**
+@lru_cache(maxsize=16)
+def build_purpose_prefix(purpose: str) -> str:
+    """
+    Build (and memoize) the static prefix for a purpose's own sections
 
-Perform a comprehensive analysis covering:
+    Args:
+        purpose: User's stated purpose for analysis
+
+    Returns:
+        Static prompt prefix asking only for the PURPOSE_SECTIONS
+    """
+    requirements = _get_requirement_sections(purpose)
+
+    return _format_instructions(
+        purpose,
+        "focused",
+        (requirements[name] for name in PURPOSE_SECTIONS[0])
+    )
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
 
-1. **Sentiment Analysis**:
+def _get_requirement_sections(purpose: str) -> Dict[str, str]:
+    """Get analysis requirement sections, keyed by aspect (in prompt order)"""
+    return {
+        "sentiment": """**Sentiment Analysis**:
    - Overall sentiment score (-1.0 to 1.0)
    - Positive/negative/neutral ratio
    - Concerning patterns or language
-   - Representative quotes
-
-2. **Theme Extraction**:
+   - Representative quotes""",
+        "themes": """**Theme Extraction**:
    - Top 5-7 themes or topics
    - Frequency and relevance of each theme
    - Sentiment toward each theme
-   - Flag controversial themes
-
-3. **Engagement Analysis**:
+   - Flag controversial themes""",
+        "engagement": """**Engagement Analysis**:
    - Engagement patterns and trends
    - Peak engagement times/content types
    - Most/least engaging content
-   - Engagement rate trends
-
-4. **Risk Assessment**:
+   - Engagement rate trends""",
+        "risk": f"""**Risk Assessment**:
    - Overall risk score (0-100)
    - Specific risk flags with severity levels
    - Controversial topics or associations
    - Misinformation indicators
    - Brand safety concerns
    - Professional conduct issues
-   - {_get_purpose_specific_risks(purpose)}
-
-5. **Bias Detection**:
+   - {_get_purpose_specific_risks(purpose)}""",
+        "bias": """**Bias Detection**:
    - Political bias indicators (left/center/right)
    - Demographic or cultural bias patterns
    - Geopolitical alignment assessment
    - Controversial affiliations
-   - Neutrality score
-
-6. **Personalized Recommendations**:
+   - Neutrality score""",
+        "recommendations": f"""**Personalized Recommendations**:
    Based on purpose "{purpose}", provide:
    - {_get_purpose_specific_recommendations(purpose)}
    - Priority-ranked action items
    - Risk mitigation strategies
-   - Reputation improvement suggestions
+   - Reputation improvement suggestions"""
+    }
 
-**CRITICAL INSTRUCTIONS:**
-- For purpose "{purpose}", pay special attention to: {_get_focus_areas(purpose)}
-- Use the provided evidence (tweet IDs/quotes) to support all findings
-- Flag any content requiring human review
-- Calculate confidence levels for all assessments
-- Consider cultural and temporal context
-- Distinguish between genuine concerns and acceptable variation
 
-{_get_json_schema()}
+def _format_instructions(
+    purpose: Optional[str],
+    scope: str,
+    sections: Iterable[str]
+) -> str:
+    """Format the static instruction block that opens an analysis prompt (purpose None: purpose-agnostic)"""
+    purpose_line = f"**USER'S PURPOSE**: {purpose}\n\n" if purpose else ""
+    return f"""You will analyze Twitter data for reputation and sentiment insights.
 
-Return ONLY the JSON object with no additional text."""
+{purpose_line}**ANALYSIS REQUIREMENTS:**
 
-    return prompt
+Perform a {scope} analysis covering:
 
+{_format_requirements(sections)}
+
+{_get_critical_instructions(purpose)}
+
+Return ONLY a JSON object matching the REQUIRED JSON OUTPUT SCHEMA, with no additional text."""
+
+
+def _format_requirements(sections: Iterable[str]) -> str:
+    """Number requirement sections for the prompt"""
+    return "\n\n".join(
+        f"{i}. {section}" for i, section in enumerate(sections, 1)
+    )
 
-# ============================================================================
-# Helper Functions
-# ============================================================================
 
-def _format_tweets(tweets: List[Dict[str, Any]]) -> str:
-    """Format tweets for prompt"""
+def _get_critical_instructions(purpose: Optional[str]) -> str:
+    """Get critical instructions block for purpose (None: no purpose focus)"""
+    focus = (
+        f'- For purpose "{purpose}", pay special attention to: {_get_focus_areas(purpose)}\n'
+        if purpose else ""
+    )
+    return f"""**CRITICAL INSTRUCTIONS:**
+{focus}- Use the provided evidence (tweet IDs/quotes) to support all findings
+- Flag any content requiring human review
+- Calculate confidence levels for all assessments
+- Consider cultural and temporal context
+- Distinguish between genuine concerns and acceptable variation"""
+
+
+def _format_tweets(
+    tweets: List[Dict[str, Any]],
+    token_budget: Optional[int] = None
+) -> str:
+    """
+    Format tweets for prompt (callers size chunks with estimate_tweet_tokens)
+
+    When the tweets exceed the token budget, near-duplicate tweets are
+    dropped and only the most engaging tweets that fit the budget are kept
+    (in their original order), behind a note telling the model the set is
+    a selection. Tweets within the budget are all sent as they are.
+    """
     if not tweets:
         return "No tweets provided"
 
+    selected = tweets
+    if token_budget is not None and sum(map(estimate_tweet_tokens, tweets)) > token_budget:
+        selected = _select_tweets(tweets, token_budget)
+
     formatted = []
-    for i, tweet in enumerate(tweets[:50], 1):  # Limit to 50 tweets
-        text = tweet.get('text', '')[:280]  # Truncate if needed
+    if len(selected) < len(tweets):
+        formatted.append(
+            f"(Showing top {len(selected)} of {len(tweets)} tweets by engagement)\n"
+        )
+
+    for i, tweet in enumerate(selected, 1):
+        text = tweet.get('text', '')[:MAX_PROMPT_TWEET_CHARS]  # Truncate if needed
         likes = tweet.get('likes', 0)
         retweets = tweet.get('retweets', 0)
         date = tweet.get('created_at', 'N/A')
@@ -158,58 +442,157 @@ def _format_tweets(tweets: List[Dict[str, Any]]) -> str:
     return "\n".join(formatted)
 
 
+def _select_tweets(
+    tweets: List[Dict[str, Any]],
+    token_budget: int
+) -> List[Dict[str, Any]]:
+    """
+    Pick the most engaging distinct tweets that fit a token budget
+
+    Tweets are ranked by likes + retweets + replies; a tweet whose SimHash
+    is within _SIMHASH_MAX_DISTANCE bits of an already kept tweet is
+    skipped as a near duplicate. At least one tweet is always kept.
+
+    Uses the tweet's precomputed ``simhash`` (set by the pipeline's
+    sanitization) when present.
+
+    Returns:
+        Selected tweets, in their original order
+    """
+    ranked = sorted(
+        range(len(tweets)),
+        key=lambda i: -(
+            (tweets[i].get('likes') or 0)
+            + (tweets[i].get('retweets') or 0)
+            + (tweets[i].get('replies') or 0)
+        )
+    )
+
+    kept: List[int] = []
+    band_tables: List[Dict[int, List[int]]] = [{} for _ in _SIMHASH_BAND_SHIFTS]
+    used = 0
+    for i in ranked:
+        tokens = estimate_tweet_tokens(tweets[i])
+        if kept and used + tokens > token_budget:
+            continue
+
+        fingerprint = tweets[i].get('simhash')
+        if fingerprint is None:
+            fingerprint = simhash(tweets[i].get('text', ''))
+        bands = [
+            fingerprint >> shift & _SIMHASH_BAND_MASK
+            for shift in _SIMHASH_BAND_SHIFTS
+        ]
+        if any(
+            (fingerprint ^ other).bit_count() <= _SIMHASH_MAX_DISTANCE
+            for table, band in zip(band_tables, bands)
+            for other in table.get(band, ())
+        ):
+            continue
+
+        kept.append(i)
+        for table, band in zip(band_tables, bands):
+            table.setdefault(band, []).append(fingerprint)
+        used += tokens
+
+    return [tweets[i] for i in sorted(kept)]
+
+
+def simhash(text: str) -> int:
+    """64-bit SimHash of a text's lowercased words (punctuation ignored)"""
+    words = _WORD_RE.findall(text.lower())
+
+    # Summing the words' lane-spread hashes counts the set bits per position
+    # in one pass; a bit is kept when it is set in more than half the words
+    counts = sum(map(_spread_word_hash, words))
+    return sum(
+        1 << bit for bit in range(64)
+        if 2 * (counts >> bit * _SIMHASH_LANE_BITS & _SIMHASH_LANE_MASK) > len(words)
+    )
+
+
+@lru_cache(maxsize=65536)
+def _spread_word_hash(word: str) -> int:
+    """A word's 64-bit hash with each bit moved into its own counter lane"""
+    word_hash = int.from_bytes(
+        hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest(),
+        "big"
+    )
+    return sum(
+        1 << bit * _SIMHASH_LANE_BITS for bit in range(64)
+        if word_hash >> bit & 1
+    )
+
+
+def estimate_tweet_tokens(tweet: Dict[str, Any]) -> int:
+    """
+    Estimate prompt tokens for one tweet as formatted by _format_tweets
+
+    Uses the same ~4 characters per token approximation as the analyzer,
+    plus the per-tweet header and engagement line.
+    """
+    text = tweet.get('text', '')[:MAX_PROMPT_TWEET_CHARS]
+    return (len(text) + _TWEET_FORMAT_OVERHEAD_CHARS) // 4
+
+
+# Purpose -> risk areas to focus on
+_RISK_FOCUS: Dict[str, str] = {
+    "job_search": "Professional conduct issues, controversial statements, inappropriate content for employers",
+    "visa_application": "Extremism indicators, geopolitical sensitivities, controversial associations, security concerns",
+    "brand_building": "Brand safety issues, controversial topics that could alienate audience, reputation risks",
+    "political_campaign": "Misinformation, controversial statements, inconsistent messaging, opponent attack vectors",
+    "security_clearance": "Extremism, foreign associations, trustworthiness indicators, security risks",
+    "personal_reputation": "Brand safety, controversial topics, negative sentiment patterns, professional conduct",
+    "career_development": "Professional conduct, skill endorsements, thought leadership credibility",
+    "influencer": "Brand safety, controversial content, audience sentiment, engagement authenticity"
+}
+
+# Purpose -> recommendation focus
+_RECOMMENDATION_FOCUS: Dict[str, str] = {
+    "job_search": "Content that could concern employers, professional tone improvements, skill highlight opportunities",
+    "visa_application": "Content to review before application, potential red flags to address, supporting evidence to emphasize",
+    "brand_building": "Content strategy improvements, engagement optimization, audience growth tactics",
+    "political_campaign": "Messaging consistency, voter sentiment insights, opponent differentiation strategies",
+    "security_clearance": "Content to address or explain, risk mitigation strategies, trustworthiness enhancements",
+    "personal_reputation": "Reputation improvement tactics, content strategy refinements, risk mitigation",
+    "career_development": "Thought leadership opportunities, professional branding improvements, network growth strategies",
+    "influencer": "Content optimization, engagement strategies, brand partnership readiness"
+}
+
+# Purpose -> focus areas for the critical instructions
+_FOCUS_AREAS: Dict[str, str] = {
+    "job_search": "professional conduct, controversial content, brand safety, skill demonstrations",
+    "visa_application": "extremism indicators, geopolitical alignment, controversial associations, security concerns",
+    "brand_building": "engagement patterns, audience sentiment, brand safety, content consistency",
+    "political_campaign": "political messaging, misinformation, controversy management, public sentiment",
+    "security_clearance": "extremism, foreign associations, trustworthiness, security risks",
+    "personal_reputation": "overall sentiment, brand safety, controversial topics, professional conduct",
+    "career_development": "professional expertise, thought leadership, industry engagement",
+    "influencer": "engagement authenticity, brand safety, audience sentiment, content quality"
+}
+
+
+@lru_cache(maxsize=32)
 def _get_purpose_specific_risks(purpose: str) -> str:
     """Get purpose-specific risk areas to focus on"""
-    risk_focus = {
-        "job_search": "Professional conduct issues, controversial statements, inappropriate content for employers",
-        "visa_application": "Extremism indicators, geopolitical sensitivities, controversial associations, security concerns",
-        "brand_building": "Brand safety issues, controversial topics that could alienate audience, reputation risks",
-        "political_campaign": "Misinformation, controversial statements, inconsistent messaging, opponent attack vectors",
-        "security_clearance": "Extremism, foreign associations, trustworthiness indicators, security risks",
-        "personal_reputation": "Brand safety, controversial topics, negative sentiment patterns, professional conduct",
-        "career_development": "Professional conduct, skill endorsements, thought leadership credibility",
-        "influencer": "Brand safety, controversial content, audience sentiment, engagement authenticity"
-    }
-    return risk_focus.get(purpose.lower(), "General reputation risks")
+    return _RISK_FOCUS.get(purpose, "General reputation risks")
 
 
+@lru_cache(maxsize=32)
 def _get_purpose_specific_recommendations(purpose: str) -> str:
     """Get purpose-specific recommendation focus"""
-    rec_focus = {
-        "job_search": "Content that could concern employers, professional tone improvements, skill highlight opportunities",
-        "visa_application": "Content to review before application, potential red flags to address, supporting evidence to emphasize",
-        "brand_building": "Content strategy improvements, engagement optimization, audience growth tactics",
-        "political_campaign": "Messaging consistency, voter sentiment insights, opponent differentiation strategies",
-        "security_clearance": "Content to address or explain, risk mitigation strategies, trustworthiness enhancements",
-        "personal_reputation": "Reputation improvement tactics, content strategy refinements, risk mitigation",
-        "career_development": "Thought leadership opportunities, professional branding improvements, network growth strategies",
-        "influencer": "Content optimization, engagement strategies, brand partnership readiness"
-    }
-    return rec_focus.get(purpose.lower(), "General reputation management recommendations")
+    return _RECOMMENDATION_FOCUS.get(purpose, "General reputation management recommendations")
 
 
+@lru_cache(maxsize=32)
 def _get_focus_areas(purpose: str) -> str:
     """Get focus areas for purpose"""
-    focus_areas = {
-        "job_search": "professional conduct, controversial content, brand safety, skill demonstrations",
-        "visa_application": "extremism indicators, geopolitical alignment, controversial associations, security concerns",
-        "brand_building": "engagement patterns, audience sentiment, brand safety, content consistency",
-        "political_campaign": "political messaging, misinformation, controversy management, public sentiment",
-        "security_clearance": "extremism, foreign associations, trustworthiness, security risks",
-        "personal_reputation": "overall sentiment, brand safety, controversial topics, professional conduct",
-        "career_development": "professional expertise, thought leadership, industry engagement",
-        "influencer": "engagement authenticity, brand safety, audience sentiment, content quality"
-    }
-    return focus_areas.get(purpose.lower(), "overall reputation and sentiment")
+    return _FOCUS_AREAS.get(purpose, "overall reputation and sentiment")
 
 
-def _get_json_schema() -> str:
-    """Get JSON schema for output"""
-    return """
-**REQUIRED JSON OUTPUT SCHEMA:**
-```json
-{
-  "sentiment": {
+# Output schema fragments, one per top-level result key (in output order)
+_SCHEMA_SECTIONS: Dict[str, str] = {
+    "sentiment": """  "sentiment": {
     "overall_sentiment": "positive|neutral|negative|mixed",
     "sentiment_score": -1.0 to 1.0,
     "positive_ratio": 0.0 to 1.0,
@@ -218,8 +601,8 @@ def _get_json_schema() -> str:
     "confidence": 0.0 to 1.0,
     "concerning_patterns": ["list of patterns"],
     "sample_quotes": ["representative quotes"]
-  },
-  "themes": [
+  }""",
+    "themes": """  "themes": [
     {
       "name": "theme name",
       "frequency": count,
@@ -228,8 +611,8 @@ def _get_json_schema() -> str:
       "example_tweets": ["tweet IDs or indices"],
       "is_controversial": true|false
     }
-  ],
-  "engagement": {
+  ]""",
+    "engagement": """  "engagement": {
     "total_tweets": count,
     "average_likes": float,
     "average_retweets": float,
@@ -238,8 +621,8 @@ def _get_json_schema() -> str:
     "peak_engagement_times": ["times or patterns"],
     "engagement_trend": "increasing|stable|decreasing",
     "most_engaging_content_types": ["types"]
-  },
-  "risk_assessment": {
+  }""",
+    "risk_assessment": """  "risk_assessment": {
     "overall_risk_score": 0.0 to 100.0,
     "risk_level": "low|medium|high|critical",
     "flags": [
@@ -276,8 +659,8 @@ def _get_json_schema() -> str:
     ],
     "timeline_analysis": "risk patterns over time",
     "escalation_required": true|false
-  },
-  "bias_indicators": {
+  }""",
+    "bias_indicators": """  "bias_indicators": {
     "overall_bias_score": -1.0 to 1.0,
     "bias_indicators": [
       {
@@ -299,8 +682,8 @@ def _get_json_schema() -> str:
     },
     "neutrality_score": 0.0 to 1.0,
     "recommendations": ["how to improve balance"]
-  },
-  "recommendations": [
+  }""",
+    "recommendations": """  "recommendations": [
     {
       "category": "category",
       "priority": "low|medium|high|critical",
@@ -310,17 +693,83 @@ def _get_json_schema() -> str:
       "expected_impact": "expected positive impact",
       "effort_level": "low|medium|high"
     }
-  ],
-  "executive_summary": "2-3 sentence high-level summary",
-  "key_findings": ["top 5 key findings"],
-  "confidence_level": 0.0 to 1.0,
-  "human_review_required": true|false,
-  "notes": "additional context or caveats (optional)"
+  ]""",
+    "executive_summary": '  "executive_summary": "2-3 sentence high-level summary"',
+    "key_findings": '  "key_findings": ["top 5 key findings"]',
+    "confidence_level": '  "confidence_level": 0.0 to 1.0',
+    "human_review_required": '  "human_review_required": true|false',
+    "notes": '  "notes": "additional context or caveats (optional)"'
+}
+
+
+# Legend for the compact type shorthand used in the schema block
+_SCHEMA_LEGEND = (
+    "Types: f=float, i=integer, b=boolean, f[a,b]=float from a to b, "
+    "\"x|y\"=one of the listed values, [...]=list"
+)
+
+# Filler phrases dropped from schema value descriptions
+_SCHEMA_FILLER = ("list of ", "detailed ", "specific ")
+
+
+def _compact_schema_section(section: str) -> str:
+    """
+    Minify one schema fragment into the compact type shorthand
+
+    Drops indentation and newlines, rewrites numeric ranges, floats, counts
+    and booleans to the legend's shorthand and removes filler words.
+    """
+    compact = re.sub(r"\n\s*", "", section.strip())
+    compact = re.sub(r'":\s+', '":', compact)
+    compact = re.sub(r"(-?\d+)\.0 to (\d+)\.0", r"f[\1,\2]", compact)
+    compact = re.sub(r":float\b", ":f", compact)
+    compact = re.sub(r":count\b", ":i", compact)
+    compact = compact.replace(":true|false", ":b")
+    for filler in _SCHEMA_FILLER:
+        compact = compact.replace(filler, "")
+    return compact
+
+
+# Compact schema fragments, minified once at import
+_COMPACT_SCHEMA_SECTIONS: Dict[str, str] = {
+    key: _compact_schema_section(section)
+    for key, section in _SCHEMA_SECTIONS.items()
 }
-```
+
+
+def _format_schema_block(keys: Iterable[str]) -> str:
+    """Format the schema block for the given top-level result keys"""
+    sections = ",".join(_COMPACT_SCHEMA_SECTIONS[key] for key in keys)
+    return f"""
+**REQUIRED JSON OUTPUT SCHEMA:**
+{_SCHEMA_LEGEND}
+{{{sections}}}
 """
 
 
+# Full output schema block, built once at import
+_COMPACT_SCHEMA = _format_schema_block(_SCHEMA_SECTIONS)
+
+
+def get_json_schema(keys: Optional[Iterable[str]] = None) -> str:
+    """
+    Get JSON schema for output
+
+    The block is static for a given set of keys, so it is sent ahead of the
+    dynamic prompt as a prompt-cached prefix. Sections are minified with a
+    compact type shorthand to keep the prefix small.
+
+    Args:
+        keys: Top-level result keys to include (defaults to all)
+
+    Returns:
+        Schema block for the prompt
+    """
+    if keys is None:
+        return _COMPACT_SCHEMA
+    return _format_schema_block(keys)
+
+
 # ============================================================================
 # Retry Prompt
 # ============================================================================
@@ -351,5 +800,15 @@ Return ONLY the JSON object with no additional text or explanation."""
 __all__ = [
     "SYSTEM_PROMPT",
     "get_analysis_prompt",
+    "build_static_prefix",
+    "format_analysis_context",
+    "ASPECT_SECTIONS",
+    "get_aspect_prompts",
+    "SHARED_SECTIONS",
+    "PURPOSE_SECTIONS",
+    "build_shared_prefix",
+    "build_purpose_prefix",
+    "get_json_schema",
+    "estimate_tweet_tokens",
     "get_retry_prompt"
 ]
@@ -3,7 +3,10 @@ Risk Assessment Prompt Templates
 Specialized prompts for deep risk and bias analysis
 """
 
-from typing import List, Dict, Any
+import json
+from functools import lru_cache
+from string import Formatter
+from typing import Callable, List, Dict, Any, Tuple
 
 
 # ============================================================================
@@ -20,15 +23,20 @@ RISK_DETECTION_SYSTEM_PROMPT = """You are a specialized Risk Detection AI with e
 
 Your role is to identify, categorize, and assess reputation risks with precision and cultural awareness. Base all assessments on observable evidence and provide clear justifications."""
 
+# Scaffolding that opens every risk prompt, so all risk types share one
+# byte-identical (cacheable) prefix ahead of their own instructions
+_SHARED_PREFIX = f"""{RISK_DETECTION_SYSTEM_PROMPT}
+
+Return ONLY valid JSON as specified below, with no text before or after it. Quote specific content as evidence for every flagged item, and treat quoted, satirical or reporting content on its own merits.
+
+"""
+
 
 # ============================================================================
 # Extremism Detection
 # ============================================================================
 
-EXTREMISM_DETECTION_PROMPT = """Analyze the following content for extremism indicators:
-
-**CONTENT:**
-{content}
+EXTREMISM_DETECTION_PROMPT = _SHARED_PREFIX + """Analyze the content below for extremism indicators:
 
 **DETECTION CRITERIA:**
 1. Violent rhetoric or calls to action
@@ -61,17 +69,17 @@ Return JSON:
   "context": "cultural or temporal context",
   "false_positive_risk": "low|medium|high",
   "recommendations": ["actions to take"]
-}}"""
+}}
+
+**CONTENT:**
+{content}"""
 
 
 # ============================================================================
 # Hate Speech Detection
 # ============================================================================
 
-HATE_SPEECH_DETECTION_PROMPT = """Analyze the following content for hate speech indicators:
-
-**CONTENT:**
-{content}
+HATE_SPEECH_DETECTION_PROMPT = _SHARED_PREFIX + """Analyze the content below for hate speech indicators:
 
 **DETECTION CRITERIA:**
 1. Slurs or derogatory terms
@@ -106,17 +114,17 @@ Return JSON:
   "context_considerations": "relevant context",
   "satire_or_quote_consideration": "assessment if content is quoted or satirical",
   "recommendations": ["actions to take"]
-}}"""
+}}
+
+**CONTENT:**
+{content}"""
 
 
 # ============================================================================
 # Misinformation Detection
 # ============================================================================
 
-MISINFORMATION_DETECTION_PROMPT = """Analyze the following content for misinformation indicators:
-
-**CONTENT:**
-{content}
+MISINFORMATION_DETECTION_PROMPT = _SHARED_PREFIX + """Analyze the content below for misinformation indicators:
 
 **DETECTION CRITERIA:**
 1. Factually incorrect claims
@@ -151,19 +159,17 @@ Return JSON:
   ],
   "fact_check_urls": ["relevant fact-check links if known"],
   "recommendations": ["actions to take"]
-}}"""
+}}
+
+**CONTENT:**
+{content}"""
 
 
 # ============================================================================
 # Geopolitical Risk Assessment
 # ============================================================================
 
-GEOPOLITICAL_RISK_PROMPT = """Analyze the following content for geopolitical sensitivities:
-
-**CONTENT:**
-{content}
-
-**CONTEXT:** Analysis for {purpose} in {region}
+GEOPOLITICAL_RISK_PROMPT = _SHARED_PREFIX + """Analyze the content below for geopolitical sensitivities:
 
 **ASSESSMENT CRITERIA:**
 1. International relations sensitivities
@@ -203,19 +209,19 @@ Return JSON:
     }}
   ],
   "recommendations": ["actions to take"]
-}}"""
+}}
+
+**CONTEXT:** Analysis for {purpose} in {region}
+
+**CONTENT:**
+{content}"""
 
 
 # ============================================================================
 # Brand Safety Assessment
 # ============================================================================
 
-BRAND_SAFETY_PROMPT = """Analyze the following content for brand safety:
-
-**CONTENT:**
-{content}
-
-**CONTEXT:** {context}
+BRAND_SAFETY_PROMPT = _SHARED_PREFIX + """Analyze the content below for brand safety:
 
 **BRAND SAFETY CATEGORIES:**
 - Adult/sexual content
@@ -243,19 +249,19 @@ Return JSON:
   "suitable_for": ["professional", "family", "general_audience", "mature_audience"],
   "unsuitable_for": ["list of audiences"],
   "recommendations": ["actions to improve brand safety"]
-}}"""
+}}
+
+**CONTEXT:** {context}
+
+**CONTENT:**
+{content}"""
 
 
 # ============================================================================
 # Professional Conduct Assessment
 # ============================================================================
 
-PROFESSIONAL_CONDUCT_PROMPT = """Analyze the following content for professional conduct:
-
-**CONTENT:**
-{content}
-
-**CONTEXT:** {purpose}
+PROFESSIONAL_CONDUCT_PROMPT = _SHARED_PREFIX + """Analyze the content below for professional conduct:
 
 **ASSESSMENT CRITERIA:**
 1. Professional tone and language
@@ -289,17 +295,19 @@ Return JSON:
   ],
   "strengths": ["positive professional indicators"],
   "recommendations": ["actions to improve professional presence"]
-}}"""
+}}
+
+**CONTEXT:** {purpose}
+
+**CONTENT:**
+{content}"""
 
 
 # ============================================================================
 # Bias Detection Deep Analysis
 # ============================================================================
 
-BIAS_DEEP_ANALYSIS_PROMPT = """Perform deep bias analysis on the following content:
-
-**CONTENT:**
-{content}
+BIAS_DEEP_ANALYSIS_PROMPT = _SHARED_PREFIX + """Perform deep bias analysis on the content below:
 
 **ANALYSIS DIMENSIONS:**
 
@@ -345,13 +353,118 @@ Return JSON:
   "diversity_score": 0.0 to 1.0,
   "neutrality_score": 0.0 to 1.0,
   "recommendations": ["how to increase balance and diversity"]
-}}"""
+}}
+
+**CONTENT:**
+{content}"""
 
 
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
+# Risk type -> prompt template (static instructions first, content last)
+_RISK_PROMPTS: Dict[str, str] = {
+    "extremism": EXTREMISM_DETECTION_PROMPT,
+    "hate_speech": HATE_SPEECH_DETECTION_PROMPT,
+    "misinformation": MISINFORMATION_DETECTION_PROMPT,
+    "geopolitical": GEOPOLITICAL_RISK_PROMPT,
+    "brand_safety": BRAND_SAFETY_PROMPT,
+    "professional_conduct": PROFESSIONAL_CONDUCT_PROMPT,
+    "bias": BIAS_DEEP_ANALYSIS_PROMPT
+}
+
+# Markers opening the per-request tail of a risk prompt
+_DYNAMIC_MARKERS = ("**CONTEXT:**", "**CONTENT:**")
+
+
+# Template field -> value drawn from the request context (content is
+# passed separately)
+_CONTEXT_FIELDS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "purpose": lambda context: str(context.get("purpose", "general analysis")),
+    "region": lambda context: str(context.get("region", "global")),
+    "context": lambda context: json.dumps(
+        context, default=str, separators=(",", ":")
+    )
+}
+
+# Builds the dynamic tail of a prompt from (content, context)
+TailBuilder = Callable[[str, Dict[str, Any]], str]
+
+
+def _compile_tail(template: str) -> TailBuilder:
+    """
+    Compile a dynamic tail template into a builder function
+
+    The template is parsed once; the builder only joins its literal text
+    with the fields it actually uses, so e.g. the context is only serialized
+    for templates containing ``{context}``.
+    """
+    pieces = [
+        (literal, field)
+        for literal, field, _, _ in Formatter().parse(template)
+    ]
+
+    def build(content: str, context: Dict[str, Any]) -> str:
+        parts = []
+        for literal, field in pieces:
+            parts.append(literal)
+            if field == "content":
+                parts.append(content)
+            elif field is not None:
+                parts.append(_CONTEXT_FIELDS[field](context))
+        return "".join(parts)
+
+    return build
+
+
+def _split_template(template: str) -> Tuple[str, TailBuilder]:
+    """Split a risk template into its rendered static prefix and a dynamic tail builder"""
+    split_at = min(
+        template.index(marker)
+        for marker in _DYNAMIC_MARKERS
+        if marker in template
+    )
+    return template[:split_at].format(), _compile_tail(template[split_at:])
+
+
+# Risk type -> (static prefix, dynamic tail builder), compiled once at import
+_RISK_PROMPT_PARTS: Dict[str, Tuple[str, TailBuilder]] = {
+    risk_type: _split_template(template)
+    for risk_type, template in _RISK_PROMPTS.items()
+}
+
+
+def get_risk_prompt_parts(
+    content: str,
+    risk_type: str,
+    context: Dict[str, Any]
+) -> Tuple[str, str]:
+    """
+    Get a specialized risk analysis prompt as (static prefix, dynamic suffix)
+
+    The static prefix (criteria, categories and JSON schema) is
+    byte-identical for every call of a risk type, so it can be sent as a
+    prompt-cached block; the content and context only appear in the
+    dynamic suffix.
+
+    Args:
+        content: Content to analyze
+        risk_type: Type of risk analysis
+        context: Additional context
+
+    Returns:
+        Tuple of (static prefix, dynamic suffix)
+    """
+    static_prefix, build_tail = _RISK_PROMPT_PARTS.get(
+        risk_type,
+        _RISK_PROMPT_PARTS["brand_safety"]
+    )
+
+    # Fill in content and context
+    return static_prefix, build_tail(content, context)
+
+
 def get_risk_analysis_prompt(
     content: str,
     risk_type: str,
@@ -368,73 +481,123 @@ def get_risk_analysis_prompt(
     Returns:
         Formatted prompt
     """
-    prompts = {
-        "extremism": EXTREMISM_DETECTION_PROMPT,
-        "hate_speech": HATE_SPEECH_DETECTION_PROMPT,
-        "misinformation": MISINFORMATION_DETECTION_PROMPT,
-        "geopolitical": GEOPOLITICAL_RISK_PROMPT,
-        "brand_safety": BRAND_SAFETY_PROMPT,
-        "professional_conduct": PROFESSIONAL_CONDUCT_PROMPT,
-        "bias": BIAS_DEEP_ANALYSIS_PROMPT
-    }
-
-    prompt_template = prompts.get(risk_type, BRAND_SAFETY_PROMPT)
-
-    # Format with context
-    return prompt_template.format(
-        content=content,
-        purpose=context.get("purpose", "general analysis"),
-        region=context.get("region", "global"),
-        context=str(context)
-    )
+    return "".join(get_risk_prompt_parts(content, risk_type, context))
 
 
 # ============================================================================
 # Composite Risk Analysis
 # ============================================================================
 
-def get_composite_risk_prompt(
-    content: str,
-    focus_areas: List[str],
-    context: Dict[str, Any]
-) -> str:
-    """Generate composite risk analysis prompt covering multiple areas"""
+# Focus area -> description for composite analysis
+_FOCUS_DESCRIPTIONS: Dict[str, str] = {
+    "extremism": "violent or extreme ideological content",
+    "hate_speech": "discriminatory or hateful language",
+    "misinformation": "false or misleading claims",
+    "geopolitical": "international relations sensitivities",
+    "brand_safety": "content suitable for professional/brand contexts",
+    "professional_conduct": "workplace and professional behavior",
+    "bias": "political, demographic, or ideological bias"
+}
 
-    focus_descriptions = {
-        "extremism": "violent or extreme ideological content",
-        "hate_speech": "discriminatory or hateful language",
-        "misinformation": "false or misleading claims",
-        "geopolitical": "international relations sensitivities",
-        "brand_safety": "content suitable for professional/brand contexts",
-        "professional_conduct": "workplace and professional behavior",
-        "bias": "political, demographic, or ideological bias"
-    }
 
-    focus_list = "\n".join([
-        f"- {focus_descriptions.get(area, area)}"
-        for area in focus_areas
-    ])
+# Fallback section for focus areas without a dedicated risk prompt
+_GENERIC_RISK_BODY = """Analyze the content below for {description}:
 
-    return f"""{RISK_DETECTION_SYSTEM_PROMPT}
+Return JSON:
+{{
+  "detected": true|false,
+  "severity": "low|medium|high|critical",
+  "evidence": ["specific content"],
+  "confidence": 0.0 to 1.0,
+  "recommendations": ["actions to take"]
+}}
 
-Perform comprehensive risk analysis on the following content:
+"""
 
-**CONTENT:**
-{content}
+# Shared tail of a batched prompt: context, then the content once
+_build_batched_tail = _compile_tail(
+    "**CONTEXT:** Analysis for {purpose} in {region}\n\n**CONTENT:**\n{content}"
+)
+
+
+def _risk_body(risk_type: str) -> str:
+    """Instructions and schema for one risk type, without the shared prefix"""
+    parts = _RISK_PROMPT_PARTS.get(risk_type)
+    if parts is None:
+        description = _FOCUS_DESCRIPTIONS.get(risk_type, f"{risk_type} risks")
+        return _GENERIC_RISK_BODY.format(description=description)
+    return parts[0][len(_SHARED_PREFIX):]
+
+
+@lru_cache(maxsize=64)
+def _batched_static_prefix(risk_types: Tuple[str, ...]) -> str:
+    """
+    Build (and memoize) the static prefix of a batched risk prompt
 
-**CONTEXT:** {context.get('purpose', 'general analysis')}
+    Callers pass a small set of recurring focus-area combinations (e.g.
+    a purpose's focus areas), so most calls are cache hits.
+    """
+    focus_list = "\n".join(
+        f"- {_FOCUS_DESCRIPTIONS.get(risk_type, risk_type)}"
+        for risk_type in risk_types
+    )
+    sections = "".join(
+        f"=== {risk_type} ===\n{_risk_body(risk_type)}"
+        for risk_type in risk_types
+    )
+    keys = ", ".join(f'"{risk_type}"' for risk_type in risk_types)
+
+    return f"""{_SHARED_PREFIX}Perform comprehensive risk analysis on the content below.
 
 **FOCUS AREAS:**
 {focus_list}
 
-Analyze each focus area and provide:
-1. Risk presence (detected/not detected)
-2. Severity level if detected
-3. Specific evidence
-4. Confidence level
-5. Recommendations
+Run every analysis section below on the same content. Return ONE JSON object with exactly these keys: {keys}. Each key holds the JSON that its section asks for.
+
+{sections}"""
+
+
+def get_batched_risk_prompt_parts(
+    content: str,
+    risk_types: List[str],
+    context: Dict[str, Any]
+) -> Tuple[str, str]:
+    """
+    Get one prompt covering several risk types as (static prefix, dynamic suffix)
+
+    Each risk type's instructions and schema become a ``=== <type> ===``
+    section after the shared prefix, and the model returns one JSON
+    object keyed by risk type, so N single-type calls collapse into one
+    and the content is sent once.
+
+    Args:
+        content: Content to analyze
+        risk_types: Risk types (or focus areas) to cover
+        context: Additional context
+
+    Returns:
+        Tuple of (static prefix, dynamic suffix)
+    """
+    static_prefix = _batched_static_prefix(tuple(risk_types))
+    return static_prefix, _build_batched_tail(content, context)
+
+
+def get_batched_risk_prompt(
+    content: str,
+    risk_types: List[str],
+    context: Dict[str, Any]
+) -> str:
+    """Generate a single prompt covering several risk types (see get_batched_risk_prompt_parts)"""
+    return "".join(get_batched_risk_prompt_parts(content, risk_types, context))
 
-Return comprehensive JSON covering all focus areas with the combined schema from individual risk prompts."""
+
+def get_composite_risk_prompt(
+    content: str,
+    focus_areas: List[str],
+    context: Dict[str, Any]
+) -> str:
+    """Generate composite risk analysis prompt covering multiple areas"""
+    return get_batched_risk_prompt(content, focus_areas, context)
 
 
 # ============================================================================
@@ -451,5 +614,8 @@ __all__ = [
     "PROFESSIONAL_CONDUCT_PROMPT",
     "BIAS_DEEP_ANALYSIS_PROMPT",
     "get_risk_analysis_prompt",
+    "get_risk_prompt_parts",
+    "get_batched_risk_prompt",
+    "get_batched_risk_prompt_parts",
     "get_composite_risk_prompt"
 ]
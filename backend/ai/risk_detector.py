@@ -4,15 +4,18 @@ Advanced risk assessment and bias detection capabilities
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Tuple
-from enum import Enum
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+import ahocorasick
 
 from .schemas import (
     RiskLevel,
     RiskCategory,
     RiskFlag,
     AssociationRisk,
-    ContentIntegrityIssue,
     BiasCategory,
     BiasIndicator
 )
@@ -81,6 +84,33 @@ class RiskKeywords:
         "north korea", "iran nuclear", "sanctions"
     ]
 
+    DEHUMANIZING_PATTERNS = [
+        "they are animals", "subhuman", "vermin", "infestation"
+    ]
+
+    PROFANITY_INDICATORS = [
+        "fuck", "shit", "damn", "ass", "bitch"
+    ]
+
+    CONTROVERSIAL_INDICATORS = [
+        "abortion", "gun control", "religion", "politics",
+        "trump", "biden", "conservative", "liberal"
+    ]
+
+    WORKPLACE_COMPLAINT_PATTERNS = [
+        "hate my job", "my boss is", "work sucks", "fired", "quit today"
+    ]
+
+    POLITICAL_LEFT = [
+        "progressive", "liberal", "democrat", "socialism",
+        "social justice", "equity", "inclusive", "diversity"
+    ]
+
+    POLITICAL_RIGHT = [
+        "conservative", "republican", "libertarian", "freedom",
+        "traditional values", "law and order", "patriot"
+    ]
+
 
 class KnownEntities:
     """Known extremist groups and controversial entities"""
@@ -100,6 +130,206 @@ class KnownEntities:
     ]
 
 
+# ============================================================================
+# Keyword Scanner
+# ============================================================================
+
+class KeywordHits(dict):
+    """Category name -> keywords found (categories without hits are empty)"""
+
+    def __missing__(self, category: str) -> tuple:
+        return ()
+
+
+# Shared result for texts with no keyword hits
+_NO_HITS = KeywordHits()
+
+# Joins tweet texts for a batch scan (ASCII record separator)
+_TEXT_SEPARATOR = "\x1e"
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _is_whole_word(text: str, start: int, end: int) -> bool:
+    """Whether text[start:end] is bounded by non-word characters (regex ``\\b``)"""
+    return (
+        (start == 0 or not _is_word_char(text[start - 1])) and
+        (end == len(text) or not _is_word_char(text[end]))
+    )
+
+
+class KeywordScanner:
+    """
+    Single-pass multi-keyword matcher
+
+    All keywords are compiled into one Aho-Corasick automaton, so each
+    tweet is scanned once for every category at once, and the per-tweet
+    hits are computed once and reused by every detector. Keywords only
+    match as whole words, so "kill" is not found in "skill".
+    """
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        """
+        Index keywords by category
+
+        Args:
+            categories: Category name -> keyword list (lowercase)
+        """
+        self.categories = categories
+        self._rank = {
+            category: {kw: i for i, kw in enumerate(keywords)}
+            for category, keywords in categories.items()
+        }
+        self._memberships: Dict[str, List[str]] = {}
+        for category, keywords in categories.items():
+            for kw in keywords:
+                self._memberships.setdefault(kw, []).append(category)
+
+        self._automaton = ahocorasick.Automaton()
+        for kw in self._memberships:
+            self._automaton.add_word(kw, kw)
+        self._automaton.make_automaton()
+
+    def scan(self, text: str) -> KeywordHits:
+        """
+        Find keywords in lowercased text
+
+        Args:
+            text: Lowercased text
+
+        Returns:
+            Category name -> keywords found, in keyword list order
+        """
+        if not self._memberships:
+            return _NO_HITS
+
+        # A keyword counts once however often it occurs
+        return self._group({
+            kw for end, kw in self._automaton.iter(text)
+            if _is_whole_word(text, end - len(kw) + 1, end + 1)
+        })
+
+    def scan_tweets(self, tweets: List[Dict[str, Any]]) -> List[KeywordHits]:
+        """
+        Scan each tweet's text, returning per-tweet hits
+
+        All texts are scanned as one string in a single automaton pass, and
+        each hit is mapped back to its tweet by offset.
+        """
+        texts = [tweet.get("text", "").lower() for tweet in tweets]
+        if not texts or not self._memberships:
+            return [_NO_HITS] * len(texts)
+
+        # The separator is a non-word character no keyword contains, so
+        # matches never span two tweets
+        joined = _TEXT_SEPARATOR.join(texts)
+        starts = list(accumulate((len(text) + 1 for text in texts[:-1]), initial=0))
+
+        found: Dict[int, set] = {}
+        for end, kw in self._automaton.iter(joined):
+            start = end - len(kw) + 1
+            if _is_whole_word(joined, start, end + 1):
+                found.setdefault(bisect_right(starts, start) - 1, set()).add(kw)
+
+        hits = [_NO_HITS] * len(texts)
+        for index, keywords in found.items():
+            hits[index] = self._group(keywords)
+        return hits
+
+    def _group(self, found: Set[str]) -> KeywordHits:
+        """Group found keywords by category, in keyword list order"""
+        if not found:
+            return _NO_HITS
+
+        hits = KeywordHits()
+        for kw in found:
+            for category in self._memberships[kw]:
+                hits.setdefault(category, []).append(kw)
+
+        for category, keywords in hits.items():
+            if len(keywords) > 1:
+                keywords.sort(key=self._rank[category].__getitem__)
+
+        return hits
+
+
+# Shared scanner for all rule-based risk and bias checks, so one scan per
+# tweet serves both detectors
+RISK_SCANNER = KeywordScanner({
+    "extremism": RiskKeywords.EXTREMISM_KEYWORDS,
+    "violence": RiskKeywords.VIOLENCE_KEYWORDS,
+    "dehumanizing": RiskKeywords.DEHUMANIZING_PATTERNS,
+    "conspiracy": RiskKeywords.CONSPIRACY_PATTERNS,
+    "geopolitical": RiskKeywords.GEOPOLITICAL_SENSITIVE,
+    "profanity": RiskKeywords.PROFANITY_INDICATORS,
+    "controversial": RiskKeywords.CONTROVERSIAL_INDICATORS,
+    "workplace_complaint": RiskKeywords.WORKPLACE_COMPLAINT_PATTERNS,
+    "extremist_groups": KnownEntities.EXTREMIST_GROUPS,
+    "left": RiskKeywords.POLITICAL_LEFT,
+    "right": RiskKeywords.POLITICAL_RIGHT
+})
+
+
+# ============================================================================
+# Risk Weights
+# ============================================================================
+
+# Different purposes prioritize different risks (keyed by RiskCategory value)
+_WEIGHT_MAP: Dict[str, Dict[str, float]] = {
+    "visa_application": {
+        "extremism": 2.5,
+        "hate_speech": 2.0,
+        "geopolitical": 2.5,
+        "misinformation": 1.5,
+        "brand_safety": 1.0,
+        "professional_conduct": 1.2
+    },
+    "security_clearance": {
+        "extremism": 3.0,
+        "hate_speech": 2.5,
+        "geopolitical": 3.0,
+        "misinformation": 2.0,
+        "brand_safety": 1.0,
+        "professional_conduct": 1.5
+    },
+    "job_search": {
+        "extremism": 1.5,
+        "hate_speech": 2.0,
+        "geopolitical": 1.0,
+        "misinformation": 1.2,
+        "brand_safety": 2.0,
+        "professional_conduct": 2.5
+    },
+    "brand_building": {
+        "extremism": 1.5,
+        "hate_speech": 1.8,
+        "geopolitical": 0.8,
+        "misinformation": 1.5,
+        "brand_safety": 2.5,
+        "professional_conduct": 1.5
+    }
+}
+
+_DEFAULT_WEIGHTS: Dict[str, float] = {
+    "extremism": 1.0,
+    "hate_speech": 1.0,
+    "geopolitical": 1.0,
+    "misinformation": 1.0,
+    "brand_safety": 1.0,
+    "professional_conduct": 1.0
+}
+
+# Severity -> base risk score
+_SEVERITY_SCORES: Dict[RiskLevel, int] = {
+    RiskLevel.LOW: 20,
+    RiskLevel.MEDIUM: 50,
+    RiskLevel.HIGH: 80,
+    RiskLevel.CRITICAL: 100
+}
+
+
 # ============================================================================
 # Risk Detector
 # ============================================================================
@@ -107,6 +337,10 @@ class KnownEntities:
 class RiskDetector:
     """
     Advanced risk detection and assessment system
+
+    Flags are built with ``RiskFlag.model_construct``: every field comes
+    from detector literals, and the pipeline validates them when it builds
+    the RiskAssessment.
     """
 
     def __init__(self, purpose: str = "personal_reputation"):
@@ -119,57 +353,21 @@ class RiskDetector:
         self.purpose = purpose.lower()
         self.risk_weights = self._get_risk_weights()
 
-    def _get_risk_weights(self) -> Dict[str, float]:
-        """Get risk category weights based on purpose"""
-        # Different purposes prioritize different risks
-        weight_map = {
-            "visa_application": {
-                "extremism": 2.5,
-                "hate_speech": 2.0,
-                "geopolitical": 2.5,
-                "misinformation": 1.5,
-                "brand_safety": 1.0,
-                "professional_conduct": 1.2
-            },
-            "security_clearance": {
-                "extremism": 3.0,
-                "hate_speech": 2.5,
-                "geopolitical": 3.0,
-                "misinformation": 2.0,
-                "brand_safety": 1.0,
-                "professional_conduct": 1.5
-            },
-            "job_search": {
-                "extremism": 1.5,
-                "hate_speech": 2.0,
-                "geopolitical": 1.0,
-                "misinformation": 1.2,
-                "brand_safety": 2.0,
-                "professional_conduct": 2.5
-            },
-            "brand_building": {
-                "extremism": 1.5,
-                "hate_speech": 1.8,
-                "geopolitical": 0.8,
-                "misinformation": 1.5,
-                "brand_safety": 2.5,
-                "professional_conduct": 1.5
-            }
+        # Weight per category, resolved once for flag scoring
+        self._category_weights = {
+            category: self.risk_weights.get(category.value, 1.0)
+            for category in RiskCategory
         }
 
-        return weight_map.get(self.purpose, {
-            "extremism": 1.0,
-            "hate_speech": 1.0,
-            "geopolitical": 1.0,
-            "misinformation": 1.0,
-            "brand_safety": 1.0,
-            "professional_conduct": 1.0
-        })
+    def _get_risk_weights(self) -> Dict[str, float]:
+        """Get risk category weights based on purpose"""
+        return _WEIGHT_MAP.get(self.purpose, _DEFAULT_WEIGHTS)
 
     def detect_risks(
         self,
         tweet_data: Dict[str, Any],
-        ai_analysis: Optional[Dict[str, Any]] = None
+        ai_analysis: Optional[Dict[str, Any]] = None,
+        hits: Optional[List[KeywordHits]] = None
     ) -> Tuple[float, RiskLevel, List[RiskFlag]]:
         """
         Detect and assess risks in tweet data
@@ -177,26 +375,33 @@ class RiskDetector:
         Args:
             tweet_data: Tweet content and metadata
             ai_analysis: Optional AI-generated analysis to enhance
+            hits: Per-tweet RISK_SCANNER hits, if already computed
 
         Returns:
             Tuple of (risk_score, risk_level, risk_flags)
         """
-        risk_flags = []
-        risk_scores = []
-
-        # Extract tweets
+        # Extract tweets and scan them once for every keyword category
         tweets = tweet_data.get("tweets", [])
+        hits = hits or RISK_SCANNER.scan_tweets(tweets)
+
+        # Only tweets with keyword hits can be flagged, so the detectors get
+        # parallel tweet/hits columns holding just those
+        flagged = [i for i, tweet_hits in enumerate(hits) if tweet_hits]
+        flagged_tweets = [tweets[i] for i in flagged]
+        flagged_hits = [hits[i] for i in flagged]
 
         # Run detection methods
-        extremism_risks = self._detect_extremism(tweets)
-        hate_speech_risks = self._detect_hate_speech(tweets)
-        misinformation_risks = self._detect_misinformation(tweets)
-        geopolitical_risks = self._detect_geopolitical_risks(tweets)
-        brand_safety_risks = self._detect_brand_safety_issues(tweets)
-        professional_risks = self._detect_professional_conduct_issues(tweets)
+        extremism_risks = self._detect_extremism(flagged_tweets, flagged_hits)
+        hate_speech_risks = self._detect_hate_speech(flagged_tweets, flagged_hits)
+        misinformation_risks = self._detect_misinformation(flagged_tweets, flagged_hits)
+        geopolitical_risks = self._detect_geopolitical_risks(flagged_tweets, flagged_hits)
+        brand_safety_risks = self._detect_brand_safety_issues(
+            flagged_tweets, flagged_hits, total_tweets=len(tweets)
+        )
+        professional_risks = self._detect_professional_conduct_issues(flagged_tweets, flagged_hits)
 
         # Combine all risks
-        all_risks = (
+        risk_flags = (
             extremism_risks +
             hate_speech_risks +
             misinformation_risks +
@@ -205,25 +410,14 @@ class RiskDetector:
             professional_risks
         )
 
-        # Apply weights and calculate overall score
-        for risk in all_risks:
-            category_key = risk.category.value.replace("_", " ").split()[0]
-            weight = self.risk_weights.get(category_key, 1.0)
-
-            # Convert severity to score
-            severity_scores = {
-                RiskLevel.LOW: 20,
-                RiskLevel.MEDIUM: 50,
-                RiskLevel.HIGH: 80,
-                RiskLevel.CRITICAL: 100
-            }
-            base_score = severity_scores.get(risk.severity, 20)
-
-            # Apply weight and confidence
-            weighted_score = base_score * weight * risk.confidence
-
-            risk_scores.append(weighted_score)
-            risk_flags.append(risk)
+        # Score each flag by severity, then apply weight and confidence
+        category_weights = self._category_weights
+        risk_scores = [
+            _SEVERITY_SCORES[risk.severity]
+            * category_weights[risk.category]
+            * risk.confidence
+            for risk in risk_flags
+        ]
 
         # Calculate overall risk score (0-100)
         if risk_scores:
@@ -244,42 +438,41 @@ class RiskDetector:
 
         return overall_score, risk_level, risk_flags
 
-    def _detect_extremism(self, tweets: List[Dict[str, Any]]) -> List[RiskFlag]:
+    def _detect_extremism(
+        self,
+        tweets: List[Dict[str, Any]],
+        hits: Optional[List[KeywordHits]] = None
+    ) -> List[RiskFlag]:
         """Detect extremism indicators"""
         flags = []
 
-        for tweet in tweets:
-            text = tweet.get("text", "").lower()
+        for tweet, tweet_hits in zip(tweets, hits or RISK_SCANNER.scan_tweets(tweets)):
+            found_keywords = tweet_hits["extremism"]
+            violent_keywords = tweet_hits["violence"]
+            if not found_keywords and len(violent_keywords) < 2:
+                continue
 
-            # Check for extremist keywords
-            found_keywords = [
-                kw for kw in RiskKeywords.EXTREMISM_KEYWORDS
-                if kw in text
-            ]
+            tweet_id = tweet.get("id", "unknown")
 
+            # Check for extremist keywords
             if found_keywords:
-                flags.append(RiskFlag(
+                flags.append(RiskFlag.model_construct(
                     category=RiskCategory.EXTREMISM,
                     severity=RiskLevel.HIGH,
                     description=f"Detected extremism-related keywords: {', '.join(found_keywords)}",
-                    evidence=[tweet.get("id", "unknown")],
+                    evidence=[tweet_id],
                     impact_assessment="Potential association with extremist ideologies",
                     mitigation_recommendation="Review and remove concerning content; distance from extremist rhetoric",
                     confidence=0.7
                 ))
 
             # Check for violent rhetoric
-            violent_keywords = [
-                kw for kw in RiskKeywords.VIOLENCE_KEYWORDS
-                if kw in text
-            ]
-
             if len(violent_keywords) >= 2:  # Multiple violent keywords
-                flags.append(RiskFlag(
+                flags.append(RiskFlag.model_construct(
                     category=RiskCategory.EXTREMISM,
                     severity=RiskLevel.CRITICAL,
                     description="Multiple violent keywords detected",
-                    evidence=[tweet.get("id", "unknown")],
+                    evidence=[tweet_id],
                     impact_assessment="Severe reputation risk; potential legal concerns",
                     mitigation_recommendation="Immediate content review required; consider professional consultation",
                     confidence=0.8
@@ -287,50 +480,48 @@ class RiskDetector:
 
         return flags
 
-    def _detect_hate_speech(self, tweets: List[Dict[str, Any]]) -> List[RiskFlag]:
+    def _detect_hate_speech(
+        self,
+        tweets: List[Dict[str, Any]],
+        hits: Optional[List[KeywordHits]] = None
+    ) -> List[RiskFlag]:
         """Detect hate speech indicators"""
         flags = []
 
-        for tweet in tweets:
-            text = tweet.get("text", "").lower()
-
+        for tweet, tweet_hits in zip(tweets, hits or RISK_SCANNER.scan_tweets(tweets)):
             # Check for dehumanizing language patterns
-            dehumanizing_patterns = [
-                "they are animals",
-                "subhuman",
-                "vermin",
-                "infestation"
-            ]
-
-            for pattern in dehumanizing_patterns:
-                if pattern in text:
-                    flags.append(RiskFlag(
-                        category=RiskCategory.HATE_SPEECH,
-                        severity=RiskLevel.CRITICAL,
-                        description=f"Dehumanizing language detected: '{pattern}'",
-                        evidence=[tweet.get("id", "unknown")],
-                        impact_assessment="Severe reputation damage; violates platform policies",
-                        mitigation_recommendation="Remove content immediately; issue clarification if needed",
-                        confidence=0.85
-                    ))
+            patterns = tweet_hits["dehumanizing"]
+            if not patterns:
+                continue
+
+            tweet_id = tweet.get("id", "unknown")
+            for pattern in patterns:
+                flags.append(RiskFlag.model_construct(
+                    category=RiskCategory.HATE_SPEECH,
+                    severity=RiskLevel.CRITICAL,
+                    description=f"Dehumanizing language detected: '{pattern}'",
+                    evidence=[tweet_id],
+                    impact_assessment="Severe reputation damage; violates platform policies",
+                    mitigation_recommendation="Remove content immediately; issue clarification if needed",
+                    confidence=0.85
+                ))
 
         return flags
 
-    def _detect_misinformation(self, tweets: List[Dict[str, Any]]) -> List[RiskFlag]:
+    def _detect_misinformation(
+        self,
+        tweets: List[Dict[str, Any]],
+        hits: Optional[List[KeywordHits]] = None
+    ) -> List[RiskFlag]:
         """Detect misinformation indicators"""
         flags = []
 
-        for tweet in tweets:
-            text = tweet.get("text", "").lower()
-
+        for tweet, tweet_hits in zip(tweets, hits or RISK_SCANNER.scan_tweets(tweets)):
             # Check for conspiracy theory keywords
-            conspiracy_found = [
-                kw for kw in RiskKeywords.CONSPIRACY_PATTERNS
-                if kw in text
-            ]
+            conspiracy_found = tweet_hits["conspiracy"]
 
             if conspiracy_found:
-                flags.append(RiskFlag(
+                flags.append(RiskFlag.model_construct(
                     category=RiskCategory.MISINFORMATION,
                     severity=RiskLevel.MEDIUM,
                     description=f"Potential conspiracy theory content: {', '.join(conspiracy_found)}",
@@ -342,24 +533,23 @@ class RiskDetector:
 
         return flags
 
-    def _detect_geopolitical_risks(self, tweets: List[Dict[str, Any]]) -> List[RiskFlag]:
+    def _detect_geopolitical_risks(
+        self,
+        tweets: List[Dict[str, Any]],
+        hits: Optional[List[KeywordHits]] = None
+    ) -> List[RiskFlag]:
         """Detect geopolitical sensitivity risks"""
         flags = []
 
-        for tweet in tweets:
-            text = tweet.get("text", "").lower()
-
+        for tweet, tweet_hits in zip(tweets, hits or RISK_SCANNER.scan_tweets(tweets)):
             # Check for sensitive geopolitical topics
-            sensitive_found = [
-                topic for topic in RiskKeywords.GEOPOLITICAL_SENSITIVE
-                if topic in text
-            ]
+            sensitive_found = tweet_hits["geopolitical"]
 
             if sensitive_found:
                 # Severity depends on purpose
                 severity = RiskLevel.HIGH if self.purpose in ["visa_application", "security_clearance"] else RiskLevel.MEDIUM
 
-                flags.append(RiskFlag(
+                flags.append(RiskFlag.model_construct(
                     category=RiskCategory.GEOPOLITICAL,
                     severity=severity,
                     description=f"Sensitive geopolitical topics: {', '.join(sensitive_found)}",
@@ -371,36 +561,36 @@ class RiskDetector:
 
         return flags
 
-    def _detect_brand_safety_issues(self, tweets: List[Dict[str, Any]]) -> List[RiskFlag]:
-        """Detect brand safety concerns"""
-        flags = []
+    def _detect_brand_safety_issues(
+        self,
+        tweets: List[Dict[str, Any]],
+        hits: Optional[List[KeywordHits]] = None,
+        total_tweets: Optional[int] = None
+    ) -> List[RiskFlag]:
+        """
+        Detect brand safety concerns
 
-        profanity_count = 0
-        controversial_count = 0
+        ``total_tweets`` is the ratio denominator when ``tweets`` is only
+        the subset with keyword hits (defaults to ``len(tweets)``).
+        """
+        flags = []
 
-        for tweet in tweets:
-            text = tweet.get("text", "").lower()
+        hits = hits or RISK_SCANNER.scan_tweets(tweets)
 
-            # Check for excessive profanity (simplified check)
-            profanity_indicators = ["fuck", "shit", "damn", "ass", "bitch"]
-            if any(word in text for word in profanity_indicators):
-                profanity_count += 1
+        # Check for excessive profanity (simplified check)
+        profanity_count = sum(1 for tweet_hits in hits if tweet_hits["profanity"])
 
-            # Check for controversial political/religious topics
-            controversial_indicators = [
-                "abortion", "gun control", "religion", "politics",
-                "trump", "biden", "conservative", "liberal"
-            ]
-            if any(word in text for word in controversial_indicators):
-                controversial_count += 1
+        # Check for controversial political/religious topics
+        controversial_count = sum(1 for tweet_hits in hits if tweet_hits["controversial"])
 
         # Flag if excessive
-        total_tweets = len(tweets)
+        if total_tweets is None:
+            total_tweets = len(tweets)
         if total_tweets > 0:
             profanity_ratio = profanity_count / total_tweets
 
             if profanity_ratio > 0.3:  # More than 30% contain profanity
-                flags.append(RiskFlag(
+                flags.append(RiskFlag.model_construct(
                     category=RiskCategory.BRAND_SAFETY,
                     severity=RiskLevel.MEDIUM,
                     description=f"Frequent profanity usage ({profanity_ratio:.0%} of tweets)",
@@ -412,7 +602,7 @@ class RiskDetector:
 
             controversial_ratio = controversial_count / total_tweets
             if controversial_ratio > 0.5:  # More than 50% controversial
-                flags.append(RiskFlag(
+                flags.append(RiskFlag.model_construct(
                     category=RiskCategory.CONTROVERSIAL_TOPICS,
                     severity=RiskLevel.MEDIUM,
                     description=f"Frequent controversial topic engagement ({controversial_ratio:.0%})",
@@ -424,34 +614,26 @@ class RiskDetector:
 
         return flags
 
-    def _detect_professional_conduct_issues(self, tweets: List[Dict[str, Any]]) -> List[RiskFlag]:
+    def _detect_professional_conduct_issues(
+        self,
+        tweets: List[Dict[str, Any]],
+        hits: Optional[List[KeywordHits]] = None
+    ) -> List[RiskFlag]:
         """Detect professional conduct concerns"""
         flags = []
 
-        for tweet in tweets:
-            text = tweet.get("text", "").lower()
-
-            # Check for workplace complaints
-            complaint_patterns = [
-                "hate my job",
-                "my boss is",
-                "work sucks",
-                "fired",
-                "quit today"
-            ]
-
-            for pattern in complaint_patterns:
-                if pattern in text:
-                    flags.append(RiskFlag(
-                        category=RiskCategory.PROFESSIONAL_CONDUCT,
-                        severity=RiskLevel.MEDIUM,
-                        description="Public workplace complaints detected",
-                        evidence=[tweet.get("id", "unknown")],
-                        impact_assessment="May concern potential employers",
-                        mitigation_recommendation="Remove or make private workplace-related complaints",
-                        confidence=0.75
-                    ))
-                    break  # One flag per tweet
+        for tweet, tweet_hits in zip(tweets, hits or RISK_SCANNER.scan_tweets(tweets)):
+            # Check for workplace complaints (one flag per tweet)
+            if tweet_hits["workplace_complaint"]:
+                flags.append(RiskFlag.model_construct(
+                    category=RiskCategory.PROFESSIONAL_CONDUCT,
+                    severity=RiskLevel.MEDIUM,
+                    description="Public workplace complaints detected",
+                    evidence=[tweet.get("id", "unknown")],
+                    impact_assessment="May concern potential employers",
+                    mitigation_recommendation="Remove or make private workplace-related complaints",
+                    confidence=0.75
+                ))
 
         return flags
 
@@ -468,13 +650,15 @@ class RiskDetector:
 
     def detect_associations(
         self,
-        tweet_data: Dict[str, Any]
+        tweet_data: Dict[str, Any],
+        hits: Optional[List[KeywordHits]] = None
     ) -> List[AssociationRisk]:
         """
         Detect risky associations with entities or groups
 
         Args:
             tweet_data: Tweet content and metadata
+            hits: Per-tweet RISK_SCANNER hits, if already computed
 
         Returns:
             List of association risks
@@ -482,25 +666,45 @@ class RiskDetector:
         associations = []
         tweets = tweet_data.get("tweets", [])
 
-        for tweet in tweets:
-            text = tweet.get("text", "").lower()
-
+        for tweet, tweet_hits in zip(tweets, hits or RISK_SCANNER.scan_tweets(tweets)):
             # Check for extremist group mentions
-            for group in KnownEntities.EXTREMIST_GROUPS:
-                if group in text:
-                    associations.append(AssociationRisk(
-                        entity_name=group.title(),
-                        association_type="mention",
-                        risk_category=RiskCategory.EXTREMISM,
-                        severity=RiskLevel.CRITICAL,
-                        evidence=f"Tweet ID: {tweet.get('id', 'unknown')}",
-                        justification=f"Mention of known extremist group '{group}'",
-                        context="Requires review of context - may be condemning or reporting"
-                    ))
+            groups = tweet_hits["extremist_groups"]
+            if not groups:
+                continue
+
+            evidence = f"Tweet ID: {tweet.get('id', 'unknown')}"
+            for group in groups:
+                associations.append(AssociationRisk(
+                    entity_name=group.title(),
+                    association_type="mention",
+                    risk_category=RiskCategory.EXTREMISM,
+                    severity=RiskLevel.CRITICAL,
+                    evidence=evidence,
+                    justification=f"Mention of known extremist group '{group}'",
+                    context="Requires review of context - may be condemning or reporting"
+                ))
 
         return associations
 
 
+@lru_cache(maxsize=16)
+def get_risk_detector(purpose: str) -> RiskDetector:
+    """
+    Get the shared RiskDetector for a purpose
+
+    Detectors are cached per purpose string and shared across requests and
+    threads, so they must be treated as immutable: never modify a
+    detector's attributes or its weights.
+
+    Args:
+        purpose: Analysis purpose
+
+    Returns:
+        Cached RiskDetector instance
+    """
+    return RiskDetector(purpose)
+
+
 # ============================================================================
 # Bias Detector
 # ============================================================================
@@ -512,30 +716,23 @@ class BiasDetector:
 
     def __init__(self):
         """Initialize bias detector"""
-        self.political_keywords = self._load_political_keywords()
-
-    def _load_political_keywords(self) -> Dict[str, List[str]]:
-        """Load political bias keyword indicators"""
-        return {
-            "left": [
-                "progressive", "liberal", "democrat", "socialism",
-                "social justice", "equity", "inclusive", "diversity"
-            ],
-            "right": [
-                "conservative", "republican", "libertarian", "freedom",
-                "traditional values", "law and order", "patriot"
-            ]
+        self.political_keywords = {
+            "left": RiskKeywords.POLITICAL_LEFT,
+            "right": RiskKeywords.POLITICAL_RIGHT
         }
+        self.scanner = RISK_SCANNER
 
     def detect_political_bias(
         self,
-        tweets: List[Dict[str, Any]]
+        tweets: List[Dict[str, Any]],
+        hits: Optional[List[KeywordHits]] = None
     ) -> Tuple[float, str, List[BiasIndicator]]:
         """
         Detect political bias in tweets
 
         Args:
             tweets: List of tweet dictionaries
+            hits: Per-tweet RISK_SCANNER hits, if already computed
 
         Returns:
             Tuple of (bias_score, leaning, indicators)
@@ -545,15 +742,13 @@ class BiasDetector:
         right_count = 0
         indicators = []
 
-        for tweet in tweets:
-            text = tweet.get("text", "").lower()
-
+        for tweet, tweet_hits in zip(tweets, hits or self.scanner.scan_tweets(tweets)):
             # Count left-leaning keywords
-            left_found = [kw for kw in self.political_keywords["left"] if kw in text]
+            left_found = tweet_hits["left"]
             left_count += len(left_found)
 
             # Count right-leaning keywords
-            right_found = [kw for kw in self.political_keywords["right"] if kw in text]
+            right_found = tweet_hits["right"]
             right_count += len(right_found)
 
             # Create indicators for tweets with clear bias
@@ -606,6 +801,9 @@ class BiasDetector:
 __all__ = [
     "RiskDetector",
     "BiasDetector",
+    "get_risk_detector",
+    "KeywordScanner",
+    "RISK_SCANNER",
     "RiskThresholds",
     "RiskKeywords",
     "KnownEntities"
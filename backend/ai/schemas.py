@@ -6,7 +6,7 @@ Pydantic models for structured AI analysis outputs
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 from enum import Enum
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 # ============================================================================
@@ -66,6 +66,31 @@ class PurposeCategory(str, Enum):
     SECURITY_CLEARANCE = "security_clearance"
 
 
+class RecommendationCategory(str, Enum):
+    """Categories of personalized recommendations"""
+    CONTENT_CLEANUP = "content_cleanup"
+    SENTIMENT_IMPROVEMENT = "sentiment_improvement"
+    SKILL_ENDORSEMENT = "skill_endorsement"
+    RISK_MITIGATION = "risk_mitigation"
+    GEOPOLITICAL_RISK = "geopolitical_risk"
+    ENGAGEMENT_OPTIMIZATION = "engagement_optimization"
+    CONTENT_TONE = "content_tone"
+    BRAND_SAFETY = "brand_safety"
+    MESSAGE_CONSISTENCY = "message_consistency"
+    VOTER_ENGAGEMENT = "voter_engagement"
+    SECURITY_RISK = "security_risk"
+    FOREIGN_ASSOCIATIONS = "foreign_associations"
+    SENTIMENT = "sentiment"
+    RISK_REDUCTION = "risk_reduction"
+
+
+class EffortLevel(str, Enum):
+    """Effort required to act on a recommendation"""
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+
+
 # ============================================================================
 # Sentiment Models
 # ============================================================================
@@ -126,7 +151,7 @@ class Theme(BaseModel):
     sentiment: SentimentType = Field(description="Sentiment toward theme")
     example_tweets: List[str] = Field(
         default_factory=list,
-        max_items=3,
+        max_length=3,
         description="Example tweet IDs"
     )
     is_controversial: bool = Field(
@@ -166,7 +191,10 @@ class EngagementMetrics(BaseModel):
 # ============================================================================
 
 class RiskFlag(BaseModel):
-    """Individual risk flag"""
+    """Individual risk flag (immutable, so instances can be shared)"""
+
+    model_config = ConfigDict(frozen=True)
+
     category: RiskCategory = Field(description="Risk category")
     severity: RiskLevel = Field(description="Severity level")
     description: str = Field(description="Detailed description")
@@ -248,7 +276,10 @@ class RiskAssessment(BaseModel):
 # ============================================================================
 
 class BiasIndicator(BaseModel):
-    """Individual bias indicator"""
+    """Individual bias indicator (immutable, so instances can be shared)"""
+
+    model_config = ConfigDict(frozen=True)
+
     category: BiasCategory = Field(description="Bias category")
     strength: float = Field(
         ge=0.0,
@@ -328,14 +359,17 @@ class BiasAnalysis(BaseModel):
 # ============================================================================
 
 class Recommendation(BaseModel):
-    """Actionable recommendation"""
-    category: str = Field(description="Recommendation category")
+    """Actionable recommendation (immutable, so instances can be shared)"""
+
+    model_config = ConfigDict(frozen=True)
+
+    category: RecommendationCategory = Field(description="Recommendation category")
     priority: RiskLevel = Field(description="Priority level")
     title: str = Field(description="Short title")
     description: str = Field(description="Detailed recommendation")
     rationale: str = Field(description="Why this is recommended")
     expected_impact: str = Field(description="Expected positive impact")
-    effort_level: str = Field(
+    effort_level: EffortLevel = Field(
         description="low, medium, or high effort required"
     )
 
@@ -373,7 +407,7 @@ class AnalysisResult(BaseModel):
     )
     key_findings: List[str] = Field(
         default_factory=list,
-        max_items=5,
+        max_length=5,
         description="Top 5 key findings"
     )
 
@@ -400,14 +434,15 @@ class AnalysisResult(BaseModel):
         description="Additional context or caveats"
     )
 
-    @validator("confidence_level")
-    def check_confidence_threshold(cls, v, values):
+    @model_validator(mode="after")
+    def check_confidence_threshold(self) -> "AnalysisResult":
         """Flag for human review if confidence is low on high severity items"""
-        if v < 0.7 and "risk_assessment" in values:
-            risk = values["risk_assessment"]
-            if any(f.severity in [RiskLevel.HIGH, RiskLevel.CRITICAL] for f in risk.flags):
-                values["human_review_required"] = True
-        return v
+        if self.confidence_level < 0.7 and any(
+            f.severity in (RiskLevel.HIGH, RiskLevel.CRITICAL)
+            for f in self.risk_assessment.flags
+        ):
+            self.human_review_required = True
+        return self
 
 
 # ============================================================================
@@ -416,6 +451,11 @@ class AnalysisResult(BaseModel):
 
 class AnalysisResultDB(BaseModel):
     """Analysis result for database storage"""
+
+    # Only used on the stored-result read path, so its validator is built
+    # on first use rather than at import
+    model_config = ConfigDict(defer_build=True)
+
     id: str
     user_id: str
     twitter_account_id: Optional[str]
@@ -445,26 +485,27 @@ class AnalysisResultDB(BaseModel):
 
     def to_analysis_result(self) -> AnalysisResult:
         """Convert database model to analysis result"""
-        return AnalysisResult(
-            analysis_id=self.id,
-            user_id=self.user_id,
-            timestamp=self.created_at,
-            tier=self.tier,
-            purpose=PurposeCategory(self.purpose),
-            model_used=self.model_used,
-            sentiment=SentimentScore(**self.sentiment_data),
-            themes=[Theme(**t) for t in self.themes_data],
-            engagement=EngagementMetrics(**self.engagement_data),
-            risk_assessment=RiskAssessment(**self.risk_data),
-            bias_indicators=BiasAnalysis(**self.bias_data),
-            recommendations=[Recommendation(**r) for r in self.recommendations_data],
-            executive_summary=self.executive_summary,
-            key_findings=self.key_findings,
-            processing_time_ms=self.processing_time_ms,
-            token_count=self.token_count,
-            confidence_level=self.confidence_level,
-            human_review_required=self.human_review_required
-        )
+        # Validated in one pass; nested models are built from the JSON columns
+        return AnalysisResult.model_validate({
+            "analysis_id": self.id,
+            "user_id": self.user_id,
+            "timestamp": self.created_at,
+            "tier": self.tier,
+            "purpose": self.purpose,
+            "model_used": self.model_used,
+            "sentiment": self.sentiment_data,
+            "themes": self.themes_data,
+            "engagement": self.engagement_data,
+            "risk_assessment": self.risk_data,
+            "bias_indicators": self.bias_data,
+            "recommendations": self.recommendations_data,
+            "executive_summary": self.executive_summary,
+            "key_findings": self.key_findings,
+            "processing_time_ms": self.processing_time_ms,
+            "token_count": self.token_count,
+            "confidence_level": self.confidence_level,
+            "human_review_required": self.human_review_required
+        })
 
 
 # ============================================================================
@@ -477,6 +518,8 @@ __all__ = [
     "BiasCategory",
     "RiskCategory",
     "PurposeCategory",
+    "RecommendationCategory",
+    "EffortLevel",
     "SentimentScore",
     "Theme",
     "EngagementMetrics",
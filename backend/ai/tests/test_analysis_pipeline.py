@@ -0,0 +1,295 @@
+"""
+Tests for Analysis Pipeline helpers
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from ..analysis_pipeline import AnalysisPipeline, _chunk_tweets, _reduce_chunk_results, _unique, _uuid7
+from ..prompts.analysis_prompt import estimate_tweet_tokens, simhash
+
+
+@pytest.fixture
+def tweet_data():
+    """Sample sanitized tweet data"""
+    return {
+        "tweets": [
+            {"id": str(i), "text": f"Tweet number {i}", "likes": i, "retweets": 0}
+            for i in range(120)
+        ],
+        "total_count": 120,
+        "date_range": "2024-01-01 to 2024-03-01",
+        "total_likes": 7140,
+        "total_retweets": 0,
+        "total_replies": 0,
+        "avg_engagement": 59.5
+    }
+
+
+def _chunk_result(sentiment_score, risk_score, themes, findings):
+    """Build a minimal per-chunk analysis result"""
+    return {
+        "sentiment": {
+            "overall_sentiment": "positive" if sentiment_score > 0 else "negative",
+            "sentiment_score": sentiment_score,
+            "positive_ratio": 0.5,
+            "negative_ratio": 0.3,
+            "neutral_ratio": 0.2,
+            "confidence": 0.8,
+            "concerning_patterns": [],
+            "sample_quotes": []
+        },
+        "themes": themes,
+        "engagement": {
+            "total_tweets": 50,
+            "average_likes": 10.0,
+            "average_retweets": 2.0,
+            "average_replies": 1.0,
+            "engagement_rate": 3.0,
+            "peak_engagement_times": ["morning"],
+            "engagement_trend": "stable",
+            "most_engaging_content_types": []
+        },
+        "risk_assessment": {
+            "overall_risk_score": risk_score,
+            "risk_level": "high" if risk_score > 60 else "low",
+            "flags": [{"category": "brand_safety"}] if risk_score > 60 else [],
+            "association_risks": [],
+            "content_integrity_issues": [],
+            "timeline_analysis": "",
+            "escalation_required": risk_score > 60
+        },
+        "bias_indicators": {
+            "overall_bias_score": 0.0,
+            "bias_indicators": [],
+            "political_leaning": "center",
+            "demographic_patterns": [],
+            "geopolitical_alignment": {
+                "alignment_score": 90.0,
+                "primary_affiliations": [],
+                "sensitive_topics": [],
+                "regional_risk_factors": [],
+                "international_relations_concerns": []
+            },
+            "neutrality_score": 0.9,
+            "recommendations": []
+        },
+        "recommendations": [],
+        "executive_summary": f"Summary with risk {risk_score}",
+        "key_findings": findings,
+        "confidence_level": 0.8,
+        "human_review_required": False,
+        "token_count": 1000,
+        "processing_time_ms": 1500,
+        "model_used": "claude-3-5-sonnet-20241022",
+        "tier": "basic"
+    }
+
+
+class TestChunkTweets:
+    """Test tweet chunking"""
+
+    def test_chunks_keep_account_fields(self, tweet_data):
+        """Test each chunk counts its own tweets and keeps account-level fields"""
+        budget = sum(estimate_tweet_tokens(t) for t in tweet_data["tweets"][-40:])
+        chunks = _chunk_tweets(tweet_data, token_budget=budget)
+
+        assert [len(c["tweets"]) for c in chunks] == [40, 40, 40]
+        assert all(c["total_count"] == 40 for c in chunks)
+        assert all(c["date_range"] == tweet_data["date_range"] for c in chunks)
+
+    def test_oversized_tweet_gets_own_chunk(self, tweet_data):
+        """Test a tweet larger than the budget is still chunked, on its own"""
+        chunks = _chunk_tweets(tweet_data, token_budget=1)
+
+        assert len(chunks) == 120
+        assert all(len(c["tweets"]) == 1 for c in chunks)
+
+    def test_token_budget_packing(self, tweet_data):
+        """Test tweets are packed in order up to the token budget"""
+        budget = sum(estimate_tweet_tokens(t) for t in tweet_data["tweets"][:50])
+        chunks = _chunk_tweets(tweet_data, token_budget=budget)
+
+        assert [len(c["tweets"]) for c in chunks] == [50, 50, 20]
+        assert [t["id"] for c in chunks for t in c["tweets"]] == \
+            [t["id"] for t in tweet_data["tweets"]]
+
+    def test_token_budget_fits_all(self, tweet_data):
+        """Test a large budget keeps every tweet in one chunk"""
+        chunks = _chunk_tweets(tweet_data, token_budget=100000)
+        assert len(chunks) == 1
+        assert chunks[0]["total_count"] == 120
+
+
+class TestSanitizeData:
+    """Test tweet sanitization"""
+
+    @pytest.fixture
+    def pipeline(self):
+        """Pipeline without external clients (sanitization is pure)"""
+        return AnalysisPipeline.__new__(AnalysisPipeline)
+
+    def test_strips_urls_and_retweet_prefix(self, pipeline):
+        """Test URLs, RT prefixes and extra whitespace are removed"""
+        sanitized = pipeline._sanitize_data({
+            "tweets": [{"id": "1", "text": "RT @someone: Big   news https://t.co/abc123 today"}]
+        })
+
+        assert sanitized["tweets"][0]["text"] == "Big news today"
+
+    def test_drops_duplicates(self, pipeline):
+        """Test duplicate and retweeted tweets are only kept once"""
+        sanitized = pipeline._sanitize_data({
+            "tweets": [
+                {"id": "1", "text": "Check out my new post https://t.co/a"},
+                {"id": "2", "text": "check out my new post https://t.co/b"},
+                {"id": "3", "text": "RT @me: Check out my new post"},
+                {"id": "4", "text": "Something else entirely"}
+            ]
+        })
+
+        assert [t["id"] for t in sanitized["tweets"]] == ["1", "4"]
+
+    def test_keeps_tweets_sharing_long_opening(self, pipeline):
+        """Test distinct tweets with the same long opening are not merged"""
+        opening = "Thread on what I learned shipping our release this quarter " * 3
+        sanitized = pipeline._sanitize_data({
+            "tweets": [
+                {"id": "1", "text": opening + "part one"},
+                {"id": "2", "text": opening + "part two"}
+            ]
+        })
+
+        assert [t["id"] for t in sanitized["tweets"]] == ["1", "2"]
+
+    def test_does_not_mutate_input(self, pipeline):
+        """Test the raw tweet data is left untouched"""
+        tweet = {"id": "1", "text": "Hello https://t.co/x", "location": "Paris"}
+        pipeline._sanitize_data({"tweets": [tweet]})
+
+        assert tweet == {"id": "1", "text": "Hello https://t.co/x", "location": "Paris"}
+
+    def test_fingerprints_cleaned_text(self, pipeline):
+        """Test each kept tweet carries the SimHash of its cleaned text"""
+        sanitized = pipeline._sanitize_data({
+            "tweets": [{"id": "1", "text": "RT @someone: Big news https://t.co/abc123"}]
+        })
+
+        assert sanitized["tweets"][0]["simhash"] == simhash("Big news")
+
+
+class TestCacheKey:
+    """Test analysis cache keys"""
+
+    @pytest.fixture
+    def pipeline(self):
+        """Pipeline with just the attributes the cache key reads"""
+        pipeline = AnalysisPipeline.__new__(AnalysisPipeline)
+        pipeline.tier = "pro"
+        pipeline.analyzer = SimpleNamespace(tweet_token_budget=32000, chunk_token_budget=32000)
+        return pipeline
+
+    def test_key_changes_with_prompt_inputs(self, pipeline, tweet_data):
+        """Test changed engagement or profile data gets a new key"""
+        profile = {"username": "testuser", "follower_count": 100}
+        key = pipeline._cache_key(tweet_data, profile, "job_search")
+
+        assert pipeline._cache_key(tweet_data, dict(profile), "job_search") == key
+        assert pipeline._cache_key(tweet_data, dict(profile, follower_count=101), "job_search") != key
+
+        tweets = [dict(t) for t in tweet_data["tweets"]]
+        tweets[0]["likes"] += 1
+        assert pipeline._cache_key(dict(tweet_data, tweets=tweets), profile, "job_search") != key
+
+
+class TestReduceChunkResults:
+    """Test merging of per-chunk results"""
+
+    def test_single_result_passthrough(self):
+        """Test a single chunk result is returned unchanged"""
+        result = _chunk_result(0.5, 10.0, [], [])
+        assert _reduce_chunk_results([result], [50]) is result
+
+    def test_weighted_sentiment(self):
+        """Test sentiment is averaged weighted by chunk size"""
+        merged = _reduce_chunk_results(
+            [_chunk_result(1.0, 10.0, [], []), _chunk_result(-1.0, 10.0, [], [])],
+            [75, 25]
+        )
+
+        assert merged["sentiment"]["sentiment_score"] == pytest.approx(0.5)
+        assert merged["sentiment"]["overall_sentiment"] == "positive"
+
+    def test_risk_takes_worst_chunk(self):
+        """Test overall risk comes from the most severe chunk"""
+        merged = _reduce_chunk_results(
+            [_chunk_result(0.5, 10.0, [], []), _chunk_result(0.5, 80.0, [], [])],
+            [50, 50]
+        )
+
+        assert merged["risk_assessment"]["overall_risk_score"] == 80.0
+        assert merged["risk_assessment"]["escalation_required"] is True
+        assert len(merged["risk_assessment"]["flags"]) == 1
+        assert merged["executive_summary"] == "Summary with risk 80.0"
+
+    def test_themes_unioned_by_name(self):
+        """Test themes with the same name are merged"""
+        theme_a = {
+            "name": "Python",
+            "frequency": 3,
+            "relevance_score": 0.5,
+            "sentiment": "positive",
+            "example_tweets": ["1", "2"],
+            "is_controversial": False
+        }
+        theme_b = dict(theme_a, name="python", frequency=4, relevance_score=0.9,
+                       example_tweets=["3", "4"])
+
+        merged = _reduce_chunk_results(
+            [_chunk_result(0.5, 10.0, [theme_a], []), _chunk_result(0.5, 10.0, [theme_b], [])],
+            [50, 50]
+        )
+
+        assert len(merged["themes"]) == 1
+        assert merged["themes"][0]["frequency"] == 7
+        assert merged["themes"][0]["relevance_score"] == 0.9
+        assert merged["themes"][0]["example_tweets"] == ["1", "2", "3"]
+
+    def test_totals_and_findings(self):
+        """Test engagement totals are summed and findings capped at 5"""
+        merged = _reduce_chunk_results(
+            [
+                _chunk_result(0.5, 10.0, [], ["a", "b", "c"]),
+                _chunk_result(0.5, 10.0, [], ["d", "e", "f"])
+            ],
+            [50, 50]
+        )
+
+        assert merged["engagement"]["total_tweets"] == 100
+        assert merged["token_count"] == 2000
+        assert merged["key_findings"] == ["a", "d", "b", "e", "c"]
+
+    def test_unique_handles_unhashable_items(self):
+        """Test dedup keeps first-seen order, including for object items"""
+        assert _unique(["b", "a", "b"]) == ["b", "a"]
+        assert _unique([{"x": 1}, {"x": 1}, {"x": 2}]) == [{"x": 1}, {"x": 2}]
+
+
+class TestUuid7:
+    """Test time-ordered analysis IDs"""
+
+    def test_version_and_variant(self):
+        """Test IDs are RFC 9562 version 7 UUIDs"""
+        value = _uuid7(datetime.now(timezone.utc))
+
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_sorted_by_time(self):
+        """Test later timestamps produce larger IDs"""
+        now = datetime.now(timezone.utc)
+        ids = [_uuid7(now + timedelta(milliseconds=i)) for i in range(5)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == 5
@@ -2,12 +2,56 @@
 Tests for LangChain Analyzer
 """
 
+import asyncio
+
+import httpx
+import orjson
 import pytest
+from anthropic import APIConnectionError
 from unittest.mock import Mock, patch, AsyncMock
-from ..langchain_analyzer import LangChainAnalyzer, create_analyzer, get_model_for_tier_name
+from langchain_core.exceptions import OutputParserException
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, Generation, LLMResult
+from ..langchain_analyzer import (
+    _ANALYSIS_PROMPT,
+    LangChainAnalyzer,
+    OrjsonOutputParser,
+    UsageCallbackHandler,
+    RequestRateLimiter,
+    _compile_prompt,
+    _normalize_purpose,
+    _result_cache,
+    _wait_for_retry,
+    create_analyzer,
+    get_model_for_tier_name
+)
+from ..prompts.analysis_prompt import (
+    ASPECT_SECTIONS,
+    PURPOSE_SECTIONS,
+    SHARED_SECTIONS,
+    _format_tweets,
+    get_analysis_prompt,
+    get_json_schema
+)
+from ..config import AnalysisConfig
+from ..schemas import PurposeCategory
 from config import AIModel
 
 
+def stream_of(*outputs):
+    """Mock chain astream yielding each output (or raising it) in turn"""
+    outputs = iter(outputs)
+
+    async def astream(*args, **kwargs):
+        output = next(outputs)
+        if isinstance(output, Exception):
+            raise output
+        yield output
+
+    return Mock(side_effect=astream)
+
+
 @pytest.fixture
 def sample_tweet_data():
     """Sample tweet data for testing"""
@@ -156,6 +200,16 @@ class TestLangChainAnalyzer:
             assert analyzer.llm is not None
             assert analyzer.analysis_chain is not None
 
+    def test_llm_shared_across_analyzers(self):
+        """Test analyzers routed to the same model share one ChatAnthropic"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            pro = LangChainAnalyzer(tier="pro")
+            enterprise = LangChainAnalyzer(tier="enterprise")
+            basic = LangChainAnalyzer(tier="basic")
+
+            assert pro.llm is enterprise.llm
+            assert pro.llm is not basic.llm
+
     def test_validate_inputs_success(self, sample_tweet_data, sample_user_profile):
         """Test input validation with valid data"""
         with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
@@ -192,6 +246,49 @@ class TestLangChainAnalyzer:
             incomplete_result = {"sentiment": {}, "themes": []}
             assert analyzer._validate_result(incomplete_result) is False
 
+    def test_abatch_by_length_preserves_order(self):
+        """Test length-binned batches return outputs in input order"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            analyzer = LangChainAnalyzer(tier="basic")
+            chain = Mock()
+            chain.abatch = AsyncMock(side_effect=lambda inputs, **kwargs: [
+                len(i["analysis_prompt"]) for i in inputs
+            ])
+            inputs = [
+                {"analysis_prompt": "x" * size}
+                for size in (100, 200000, 50, 40000, 300)
+            ]
+
+            outputs, usages = asyncio.run(analyzer._abatch_by_length(chain, inputs))
+
+            assert outputs == [100, 200000, 50, 40000, 300]
+            assert usages == [{}] * 5
+            assert chain.abatch.await_count == 3
+
+    def test_orjson_output_parser(self):
+        """Test fenced and plain JSON responses parse to the same dict"""
+        parser = OrjsonOutputParser()
+        expected = {"risk_level": "low", "flags": []}
+
+        assert parser.parse('{"risk_level": "low", "flags": []}') == expected
+        assert parser.parse('```json\n{"risk_level": "low", "flags": []}\n```') == expected
+
+    def test_merge_aspects(self, mock_analysis_result):
+        """Test per-aspect outputs merge into a complete result"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            analyzer = LangChainAnalyzer(tier="basic")
+            output = {
+                aspect: {key: mock_analysis_result[key] for key in keys}
+                for aspect, (_, keys) in ASPECT_SECTIONS.items()
+            }
+            prompts = {aspect: "prompt" for aspect in ASPECT_SECTIONS}
+
+            merged = analyzer._merge_aspects(prompts, output)
+
+            assert analyzer._validate_result(merged) is True
+            assert merged["sentiment"] == mock_analysis_result["sentiment"]
+            assert merged["token_count"] > 0
+
     @pytest.mark.asyncio
     async def test_analyze_async(
         self,
@@ -203,11 +300,11 @@ class TestLangChainAnalyzer:
         with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
             analyzer = LangChainAnalyzer(tier="basic")
 
-            # Mock the chain invocation
+            # Mock the chain invocation (small inputs run on Haiku)
             with patch.object(
-                analyzer.analysis_chain,
-                'ainvoke',
-                new=AsyncMock(return_value=mock_analysis_result)
+                analyzer.small_input_chain,
+                'astream',
+                new=stream_of(mock_analysis_result)
             ):
                 result = await analyzer.analyze(
                     tweet_data=sample_tweet_data,
@@ -219,6 +316,157 @@ class TestLangChainAnalyzer:
                 assert "sentiment" in result
                 assert "processing_time_ms" in result
                 assert result["tier"] == "basic"
+                assert result["model_used"] == AIModel.HAIKU.value
+
+    @pytest.mark.asyncio
+    async def test_analyze_routes_large_input_to_tier_model(
+        self,
+        sample_tweet_data,
+        sample_user_profile,
+        mock_analysis_result
+    ):
+        """Test prompts over the small-input budget stay on the tier model"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            analyzer = LangChainAnalyzer(tier="basic")
+            _result_cache.clear()
+
+            astream = stream_of(dict(mock_analysis_result))
+            with patch.object(AnalysisConfig, 'SMALL_INPUT_TOKENS', 0), \
+                    patch.object(analyzer.analysis_chain, 'astream', new=astream):
+                result = await analyzer.analyze(
+                    tweet_data=sample_tweet_data,
+                    user_profile=sample_user_profile,
+                    purpose="influencer"
+                )
+
+            assert astream.call_count == 1
+            assert result["model_used"] == analyzer.model_enum.value
+
+    @pytest.mark.asyncio
+    async def test_analyze_reuses_cached_result(
+        self,
+        sample_tweet_data,
+        sample_user_profile,
+        mock_analysis_result
+    ):
+        """Test an identical request is served from the result cache"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            analyzer = LangChainAnalyzer(tier="basic")
+            analyzer.small_input_chain = None
+            _result_cache.clear()
+
+            astream = stream_of(dict(mock_analysis_result))
+            with patch.object(analyzer.analysis_chain, 'astream', new=astream):
+                first = await analyzer.analyze(
+                    tweet_data=sample_tweet_data,
+                    user_profile=sample_user_profile,
+                    purpose="brand_building"
+                )
+                second = await analyzer.analyze(
+                    tweet_data=sample_tweet_data,
+                    user_profile=sample_user_profile,
+                    purpose="brand_building"
+                )
+
+            assert astream.call_count == 1
+            assert second == first
+            assert second is not first
+            assert second["sentiment"] is not first["sentiment"]
+
+    @pytest.mark.asyncio
+    async def test_result_cache_not_shared_across_tiers(
+        self,
+        sample_tweet_data,
+        sample_user_profile,
+        mock_analysis_result
+    ):
+        """Test tiers on the same model don't share cached results"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            pro = LangChainAnalyzer(tier="pro")
+            enterprise = LangChainAnalyzer(tier="enterprise")
+
+            assert pro._result_cache_key(
+                sample_tweet_data, sample_user_profile, "job_search", None
+            ) != enterprise._result_cache_key(
+                sample_tweet_data, sample_user_profile, "job_search", None
+            )
+
+    def test_purpose_normalized_to_canonical_key(self):
+        """Test purpose spellings collapse to one interned cache key"""
+        purpose = _normalize_purpose(" Job_Search ")
+
+        assert purpose == "job_search"
+        assert purpose is _normalize_purpose("job_search")
+        assert _normalize_purpose(PurposeCategory.JOB_SEARCH) is purpose
+
+    @pytest.mark.asyncio
+    async def test_analyze_many(
+        self,
+        sample_tweet_data,
+        sample_user_profile,
+        mock_analysis_result
+    ):
+        """Test independent requests are batched and returned in order"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            analyzer = LangChainAnalyzer(tier="basic")
+            _result_cache.clear()
+            purposes = ["job_search", "influencer", "visa_application"]
+
+            abatch = AsyncMock(side_effect=lambda inputs, **kwargs: [
+                dict(mock_analysis_result, notes=i["static_prefix"]) for i in inputs
+            ])
+            with patch.object(analyzer.analysis_chain, 'abatch', new=abatch):
+                results = await analyzer.analyze_many([
+                    {
+                        "tweet_data": sample_tweet_data,
+                        "user_profile": sample_user_profile,
+                        "purpose": purpose
+                    }
+                    for purpose in purposes
+                ])
+
+            assert abatch.await_count == 1
+            for purpose, result in zip(purposes, results):
+                assert purpose in result["notes"]
+                assert result["tier"] == "basic"
+
+    @pytest.mark.asyncio
+    async def test_analyze_multi_purpose_shares_agnostic_sections(
+        self,
+        sample_tweet_data,
+        sample_user_profile,
+        mock_analysis_result
+    ):
+        """Test shared sections come from one call and purpose sections from one call per purpose"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            analyzer = LangChainAnalyzer(tier="basic")
+            purposes = ["job_search", "influencer"]
+
+            shared_abatch = AsyncMock(side_effect=lambda inputs, **kwargs: [
+                {key: mock_analysis_result[key] for key in SHARED_SECTIONS[1]}
+                for _ in inputs
+            ])
+            purpose_abatch = AsyncMock(side_effect=lambda inputs, **kwargs: [
+                dict(
+                    {key: mock_analysis_result[key] for key in PURPOSE_SECTIONS[1]},
+                    executive_summary=i["static_prefix"]
+                )
+                for i in inputs
+            ])
+            with patch.object(analyzer.shared_chain, 'abatch', new=shared_abatch), \
+                    patch.object(analyzer.purpose_chain, 'abatch', new=purpose_abatch):
+                results = await analyzer.analyze_multi_purpose(
+                    tweet_chunks=[sample_tweet_data],
+                    user_profile=sample_user_profile,
+                    purposes=purposes
+                )
+
+            assert sum(len(call.args[0]) for call in shared_abatch.await_args_list) == 1
+            assert sum(len(call.args[0]) for call in purpose_abatch.await_args_list) == 2
+            for purpose, (result,) in zip(purposes, results):
+                assert purpose in result["executive_summary"]
+                assert result["sentiment"] == mock_analysis_result["sentiment"]
+                assert result["tier"] == "basic"
 
     def test_analyze_sync(
         self,
@@ -229,12 +477,13 @@ class TestLangChainAnalyzer:
         """Test synchronous analysis execution"""
         with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
             analyzer = LangChainAnalyzer(tier="basic")
+            analyzer.small_input_chain = None
 
             # Mock the chain invocation
             with patch.object(
                 analyzer.analysis_chain,
-                'invoke',
-                return_value=mock_analysis_result
+                'astream',
+                new=stream_of(mock_analysis_result)
             ):
                 result = analyzer.analyze_sync(
                     tweet_data=sample_tweet_data,
@@ -247,6 +496,117 @@ class TestLangChainAnalyzer:
                 assert "processing_time_ms" in result
                 assert result["tier"] == "basic"
 
+    def test_retry_wait_honors_retry_after(self):
+        """Test backoff stretches to the retry-after header, capped"""
+        error = Exception("rate limited")
+        error.response = Mock(headers={"retry-after": "30"})
+        retry_state = Mock(attempt_number=1)
+        retry_state.outcome.exception.return_value = error
+
+        assert _wait_for_retry(retry_state) >= 30
+
+        error.response.headers["retry-after"] = "3600"
+        assert _wait_for_retry(retry_state) <= AnalysisConfig.MAX_RETRY_DELAY
+
+    def test_invalid_result_retries_without_backoff(
+        self,
+        sample_tweet_data,
+        sample_user_profile,
+        mock_analysis_result
+    ):
+        """Test an incomplete result is retried and a non-transient error is not"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            analyzer = LangChainAnalyzer(tier="basic")
+            prompt = ("prefix", "suffix")
+
+            astream = stream_of({"sentiment": {}}, dict(mock_analysis_result))
+            with patch.object(analyzer.analysis_chain, 'astream', new=astream):
+                result = asyncio.run(analyzer._execute_with_retry(prompt, max_retries=3))
+            assert astream.call_count == 2
+            assert result["executive_summary"] == mock_analysis_result["executive_summary"]
+
+            astream = stream_of(KeyError("bad request"))
+            with patch.object(analyzer.analysis_chain, 'astream', new=astream):
+                with pytest.raises(RuntimeError):
+                    asyncio.run(analyzer._execute_with_retry(prompt, max_retries=3))
+            assert astream.call_count == 1
+
+    def test_transient_and_invalid_retries_share_budget(self, mock_analysis_result):
+        """Test transient errors and invalid results draw on one attempt budget"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"), \
+                patch('backend.ai.langchain_analyzer._exponential_backoff', return_value=0):
+            analyzer = LangChainAnalyzer(tier="basic")
+            connection_error = APIConnectionError(
+                request=httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+            )
+
+            astream = stream_of(
+                connection_error,
+                {"sentiment": {}},
+                {"sentiment": {}},
+                dict(mock_analysis_result)
+            )
+            with patch.object(analyzer.analysis_chain, 'astream', new=astream):
+                with pytest.raises(RuntimeError):
+                    asyncio.run(analyzer._execute_with_retry(("prefix", "suffix"), max_retries=3))
+            assert astream.call_count == 3
+
+    def test_truncated_stream_is_retried(self, mock_analysis_result):
+        """Test a streamed response cut off mid-JSON fails the full parse and is retried"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            analyzer = LangChainAnalyzer(tier="basic")
+            truncated = orjson.dumps(mock_analysis_result).decode()[:-1]
+            complete = orjson.dumps(
+                dict(mock_analysis_result, executive_summary="Retried")
+            ).decode()
+            chain = (
+                _ANALYSIS_PROMPT
+                | FakeListChatModel(responses=[truncated, complete])
+                | analyzer.output_parser
+            )
+
+            result = asyncio.run(analyzer._execute_with_retry(
+                ("prefix", "suffix"),
+                max_retries=3,
+                chain=chain
+            ))
+
+            assert result["executive_summary"] == "Retried"
+
+    def test_parser_rejects_truncated_full_response(self):
+        """Test a complete parse does not patch up truncated JSON"""
+        parser = OrjsonOutputParser()
+
+        assert parser.parse_result([Generation(text='Result: {"a": 1}')]) == {"a": 1}
+        with pytest.raises(OutputParserException):
+            parser.parse_result([Generation(text='{"a": {"b": 1}, "c": [')])
+
+    def test_parser_rejects_prose_prefix_while_streaming(self):
+        """Test a streamed response is rejected as soon as it opens with prose"""
+        parser = OrjsonOutputParser()
+
+        assert parser.parse_result([Generation(text='{"sentiment": {}}')], partial=True) == {
+            "sentiment": {}
+        }
+        parser.parse_result([Generation(text="```json\n{")], partial=True)
+        with pytest.raises(OutputParserException):
+            parser.parse_result([Generation(text="Here is")], partial=True)
+
+    def test_rate_limiter_paces_beyond_burst(self):
+        """Test requests beyond the burst wait for the bucket to refill"""
+        limiter = RequestRateLimiter(requests_per_minute=600, burst=2)
+
+        assert limiter._reserve(2) == 0
+        assert limiter._reserve(1) == pytest.approx(0.1, abs=0.01)
+        assert limiter._reserve(3) == pytest.approx(0.4, abs=0.01)
+
+    def test_chunk_budget_capped_at_tweet_budget(self):
+        """Test chunks are no larger than the tweets one prompt keeps"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            analyzer = LangChainAnalyzer(tier="pro")
+
+            assert analyzer.chunk_token_budget == AnalysisConfig.MAX_PROMPT_TWEET_TOKENS["pro"]
+
     def test_estimate_tokens(self):
         """Test token estimation"""
         with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
@@ -257,6 +617,120 @@ class TestLangChainAnalyzer:
             assert tokens > 0
             assert isinstance(tokens, int)
 
+    def test_estimate_tokens_from_usage(self):
+        """Test usage metadata, including prompt cache counters, is summed"""
+        with patch('backend.ai.langchain_analyzer.get_anthropic_api_key', return_value="test-key"):
+            analyzer = LangChainAnalyzer(tier="basic")
+            handler = UsageCallbackHandler()
+            message = Mock(response_metadata={"usage": {
+                "input_tokens": 300,
+                "cache_creation_input_tokens": 0,
+                "cache_read_input_tokens": 1500,
+                "output_tokens": 700
+            }})
+            handler.on_llm_end(Mock(generations=[[Mock(message=message)]]))
+
+            assert analyzer._estimate_tokens("x" * 40, "y" * 40, handler.usage) == 2500
+
+            result = {}
+            analyzer._record_tokens(result, "x" * 40, handler.usage)
+            assert result["token_count"] == 2500
+            assert result["token_usage"]["cache_read_input_tokens"] == 1500
+
+    def test_usage_read_from_llm_output(self):
+        """Test usage is read from llm_output when messages carry no metadata"""
+        handler = UsageCallbackHandler()
+        handler.on_llm_end(LLMResult(
+            generations=[[ChatGeneration(message=AIMessage(content="{}"))]],
+            llm_output={"usage": {"input_tokens": 120, "output_tokens": 80}}
+        ))
+
+        assert handler.usage == {
+            "input_tokens": 120,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+            "output_tokens": 80
+        }
+
+    def test_analysis_prompt_caches_static_blocks(self):
+        """Test system prompt and schema are sent as cache_control blocks"""
+        prompt = _compile_prompt("SCHEMA")
+
+        system, human = prompt.invoke({
+            "static_prefix": "instructions",
+            "dynamic_suffix": "data"
+        })
+        schema, prefix, suffix = human.content
+
+        assert system.content[0]["cache_control"] == {"type": "ephemeral"}
+        assert schema["text"] == "SCHEMA"
+        assert prefix["text"] == "instructions"
+        assert prefix["cache_control"] == {"type": "ephemeral"}
+        assert suffix == {"type": "text", "text": "data"}
+        assert _compile_prompt("SCHEMA") is prompt
+
+    def test_analysis_prompt_static_prefix(self, sample_tweet_data, sample_user_profile):
+        """Test dynamic data stays out of the static prompt prefix"""
+        static_prefix, dynamic_suffix = get_analysis_prompt(
+            purpose="job_search",
+            tweet_data=sample_tweet_data,
+            user_profile=sample_user_profile,
+            analysis_config={}
+        )
+        other_prefix, _ = get_analysis_prompt(
+            purpose="job_search",
+            tweet_data={"tweets": []},
+            user_profile={"username": "other"},
+            analysis_config={}
+        )
+
+        assert static_prefix == other_prefix
+        assert "@testuser" in dynamic_suffix
+        assert "ANALYSIS DATE" in dynamic_suffix
+        assert "ANALYSIS DATE" not in static_prefix
+
+    def test_format_tweets_keeps_top_engagement_within_budget(self):
+        """Test a tweet budget keeps the most engaging distinct tweets"""
+        tweets = [
+            {"text": f"Quiet update number {i} about gardening", "likes": i}
+            for i in range(20)
+        ] + [
+            {"text": "Big launch announcement for our new product", "likes": 500},
+            {"text": "Big launch announcement for our new product!", "likes": 400}
+        ]
+
+        formatted = _format_tweets(tweets, token_budget=100)
+
+        assert "(Showing top 3 of 22 tweets by engagement)" in formatted
+        assert formatted.count("Big launch announcement") == 1
+        assert "Quiet update number 19" in formatted
+        assert "Quiet update number 18" in formatted
+        assert _format_tweets(tweets).count("[Tweet ") == 22
+
+    def test_format_tweets_within_budget_keeps_every_tweet(self):
+        """Test selection only kicks in when the tweets exceed the budget"""
+        tweets = [
+            {"text": "Big launch announcement for our new product", "likes": 5},
+            {"text": "Big launch announcement for our new product!", "likes": 4},
+            {"text": "Quiet update about gardening", "likes": 3},
+            {"text": "Another quiet update about gardening", "likes": 2}
+        ]
+
+        formatted = _format_tweets(tweets, token_budget=10_000)
+
+        assert formatted.count("[Tweet ") == 4
+        assert "Showing top" not in formatted
+
+    def test_compact_json_schema(self, mock_analysis_result):
+        """Test the minified schema still names every required result key"""
+        schema = get_json_schema()
+
+        assert "```" not in schema
+        assert '"sentiment_score":f[-1,1]' in schema
+        for key in mock_analysis_result:
+            if key not in ("token_count", "processing_time_ms", "model_used"):
+                assert f'"{key}":' in schema
+
 
 class TestFactoryFunctions:
     """Test factory functions"""
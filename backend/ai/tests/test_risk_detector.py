@@ -3,8 +3,19 @@ Tests for Risk and Bias Detection
 """
 
 import pytest
-from ..risk_detector import RiskDetector, BiasDetector, RiskKeywords, KnownEntities
+from datetime import date
+from ..risk_detector import (
+    RiskDetector, BiasDetector, RiskKeywords, KnownEntities, KeywordScanner, RISK_SCANNER,
+    get_risk_detector
+)
 from ..schemas import RiskLevel, RiskCategory
+from ..prompts.risk_prompts import (
+    RISK_DETECTION_SYSTEM_PROMPT,
+    get_batched_risk_prompt_parts,
+    get_composite_risk_prompt,
+    get_risk_analysis_prompt,
+    get_risk_prompt_parts
+)
 
 
 @pytest.fixture
@@ -166,6 +177,27 @@ class TestRiskDetector:
         # Should detect profanity
         assert any("profanity" in f.description.lower() for f in flags)
 
+    def test_purpose_weight_applies_to_multiword_category(self):
+        """Test weights apply to categories such as professional_conduct"""
+        detector = RiskDetector(purpose="job_search")
+        tweet_data = {"tweets": [{"id": "1", "text": "I hate my job"}]}
+
+        risk_score, risk_level, _ = detector.detect_risks(tweet_data)
+
+        # MEDIUM (50) x job_search professional_conduct weight (2.5) x 0.75
+        assert risk_score == pytest.approx(93.75)
+        assert risk_level == RiskLevel.CRITICAL
+
+    def test_brand_safety_ratio_counts_unflagged_tweets(self):
+        """Test profanity ratios are over all tweets, not just flagged ones"""
+        detector = RiskDetector(purpose="brand_building")
+        tweets = [{"id": str(i), "text": "Shipping the release today"} for i in range(6)]
+        tweets += [{"id": str(i), "text": "This shit is broken"} for i in range(6, 10)]
+
+        _, _, flags = detector.detect_risks({"tweets": tweets})
+
+        assert any("(40% of tweets)" in f.description for f in flags)
+
     def test_detect_extremism_keywords(self):
         """Test extremism keyword detection"""
         detector = RiskDetector(purpose="security_clearance")
@@ -181,6 +213,14 @@ class TestRiskDetector:
         flags = detector._detect_extremism(extremist_tweets)
         # Should detect if keywords are present
 
+    def test_get_risk_detector_shared_per_purpose(self):
+        """Test detectors are cached per purpose"""
+        detector = get_risk_detector("visa_application")
+
+        assert get_risk_detector("visa_application") is detector
+        assert get_risk_detector("job_search") is not detector
+        assert detector.purpose == "visa_application"
+
     def test_risk_level_calculation(self):
         """Test risk level calculation from scores"""
         detector = RiskDetector(purpose="personal_reputation")
@@ -261,6 +301,14 @@ class TestBiasDetector:
         assert -1.0 <= bias_left <= 1.0
         assert -1.0 <= bias_right <= 1.0
 
+    def test_shared_scan_matches_own_scan(self, political_right_tweets):
+        """Test hits from the shared risk scan give the same bias result"""
+        detector = BiasDetector()
+        hits = RISK_SCANNER.scan_tweets(political_right_tweets)
+
+        assert detector.detect_political_bias(political_right_tweets, hits) == \
+            detector.detect_political_bias(political_right_tweets)
+
     def test_bias_indicator_creation(self, political_left_tweets):
         """Test that bias indicators are created correctly"""
         detector = BiasDetector()
@@ -297,6 +345,40 @@ class TestRiskKeywords:
         assert isinstance(RiskKeywords.GEOPOLITICAL_SENSITIVE, list)
 
 
+class TestKeywordScanner:
+    """Test batched keyword scanning"""
+
+    def test_scan_tweets_matches_per_tweet_scan(self):
+        """Test batch scanning finds the same keywords as scanning each tweet"""
+        scanner = KeywordScanner({"a": ["kill", "bomb"], "b": ["bomb", "liberal"]})
+        tweets = [
+            {"text": "Great team launch"},
+            {"text": "This BOMB of a product will kill it"},
+            {"text": "liberal arts degree"}
+        ]
+
+        hits = scanner.scan_tweets(tweets)
+
+        assert hits == [scanner.scan(t["text"].lower()) for t in tweets]
+        assert hits[1]["a"] == ["kill", "bomb"]
+        assert hits[1]["b"] == ["bomb"]
+        assert hits[2]["a"] == ()
+
+    def test_scan_tweets_does_not_match_across_tweets(self):
+        """Test keywords spanning two tweets are not matched"""
+        scanner = KeywordScanner({"a": ["race war"]})
+        hits = scanner.scan_tweets([{"text": "race"}, {"text": "war"}])
+
+        assert hits == [{}, {}]
+
+    def test_scan_matches_whole_words_only(self):
+        """Test keywords inside longer words are not matched"""
+        scanner = KeywordScanner({"a": ["kill", "ass", "race war"]})
+
+        assert scanner.scan("great skill in class") == {}
+        assert scanner.scan("they will kill it, a race war!")["a"] == ["kill", "race war"]
+
+
 class TestKnownEntities:
     """Test known entity databases"""
 
@@ -314,3 +396,54 @@ class TestKnownEntities:
         """Test that controversial figures list exists"""
         assert hasattr(KnownEntities, 'CONTROVERSIAL_FIGURES')
         assert isinstance(KnownEntities.CONTROVERSIAL_FIGURES, list)
+
+
+class TestRiskPrompts:
+    """Test risk prompt layout"""
+
+    def test_static_prefix_shared_across_content(self):
+        """Test content and context only appear after the static prefix"""
+        for risk_type in ("extremism", "geopolitical", "brand_safety", "bias"):
+            prefix, suffix = get_risk_prompt_parts("tweet one", risk_type, {"purpose": "job_search"})
+            other_prefix, _ = get_risk_prompt_parts("tweet two", risk_type, {"purpose": "visa_application"})
+
+            assert prefix == other_prefix
+            assert "{{" not in prefix
+            assert suffix.endswith("tweet one")
+            assert get_risk_analysis_prompt("tweet one", risk_type, {"purpose": "job_search"}) == prefix + suffix
+
+    def test_risk_types_share_system_prefix(self):
+        """Test every risk prompt opens with the same system scaffolding"""
+        composite = get_composite_risk_prompt("tweet", ["bias", "extremism"], {})
+        prefixes = [
+            get_risk_prompt_parts("tweet", risk_type, {})[0]
+            for risk_type in ("extremism", "hate_speech", "professional_conduct")
+        ]
+
+        assert composite.startswith(RISK_DETECTION_SYSTEM_PROMPT)
+        assert all(prefix.startswith(RISK_DETECTION_SYSTEM_PROMPT) for prefix in prefixes)
+        assert "- political, demographic, or ideological bias" in composite
+
+    def test_batched_prompt_sends_content_once(self):
+        """Test a batched prompt has one section per risk type and the content once"""
+        prefix, suffix = get_batched_risk_prompt_parts(
+            "tweet text",
+            ["extremism", "hate_speech", "other"],
+            {"purpose": "job_search"}
+        )
+
+        assert "=== extremism ===" in prefix
+        assert "=== other ===" in prefix
+        assert "Analyze the content below for hate speech indicators:" in prefix
+        assert "tweet text" not in prefix
+        assert suffix.count("tweet text") == 1
+
+    def test_context_rendered_as_json(self):
+        """Test a {context} template receives the context as compact JSON"""
+        _, suffix = get_risk_prompt_parts(
+            "tweet",
+            "brand_safety",
+            {"purpose": "brand_building", "posted_at": date(2024, 1, 2)}
+        )
+
+        assert '**CONTEXT:** {"purpose":"brand_building","posted_at":"2024-01-02"}' in suffix
@@ -118,6 +118,9 @@ class Settings(BaseSettings):
     supabase_service_key: Optional[str] = Field(default=None, env="SUPABASE_SERVICE_KEY")
     supabase_anon_key: Optional[str] = Field(default=None, env="SUPABASE_ANON_KEY")
 
+    # Direct Postgres connection (asyncpg pool for the analysis hot path)
+    database_url: Optional[str] = Field(default=None, env="DATABASE_URL")
+
     # Database connection pool
     db_pool_size: int = Field(default=10, description="Database connection pool size")
     db_max_overflow: int = Field(default=20, description="Max overflow connections")
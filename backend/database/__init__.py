@@ -1,4 +1,12 @@
 """Database module"""
 from .supabase_client import SupabaseClient, db, get_db
+from .async_pool import AsyncDatabasePool, async_db, get_postgres_pool
 
-__all__ = ["SupabaseClient", "db", "get_db"]
+__all__ = [
+    "SupabaseClient",
+    "db",
+    "get_db",
+    "AsyncDatabasePool",
+    "async_db",
+    "get_postgres_pool"
+]
@@ -0,0 +1,339 @@
+"""
+Async Database Pool
+asyncpg connection pool for hot-path database operations
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional, Dict, Any, List
+
+import asyncpg
+import orjson
+
+from config import settings, TierLimits
+
+
+logger = logging.getLogger(__name__)
+
+# Combined analysis/usage/audit write (see sql/finalize_analysis.sql)
+FINALIZE_ANALYSIS_SQL = (Path(__file__).parent / "sql" / "finalize_analysis.sql").read_text()
+
+
+class AsyncDatabasePool:
+    """
+    asyncpg pool talking to Postgres directly
+
+    Mirrors the SupabaseClient methods used on the analysis hot path so
+    callers can swap one for the other, but never blocks the event loop
+    and reuses pooled connections instead of a new HTTP request per call.
+    """
+
+    def __init__(
+        self,
+        dsn: Optional[str] = None,
+        min_size: int = 10,
+        max_size: int = 50,
+        max_inactive_connection_lifetime: float = 300
+    ):
+        """
+        Initialize pool configuration (the pool is created lazily)
+
+        Args:
+            dsn: Postgres connection string (defaults to DATABASE_URL)
+            min_size: Minimum pooled connections
+            max_size: Maximum pooled connections
+            max_inactive_connection_lifetime: Seconds before idle connections close
+        """
+        self.dsn = dsn or settings.database_url
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_inactive_connection_lifetime = max_inactive_connection_lifetime
+        self._pool: Optional[asyncpg.Pool] = None
+
+    @property
+    def is_configured(self) -> bool:
+        """Whether a Postgres DSN is available"""
+        return bool(self.dsn)
+
+    async def connect(self) -> asyncpg.Pool:
+        """Create the connection pool if needed"""
+        if self._pool is None:
+            if not self.dsn:
+                raise ValueError("DATABASE_URL not configured")
+
+            self._pool = await asyncpg.create_pool(
+                self.dsn,
+                min_size=self.min_size,
+                max_size=self.max_size,
+                max_inactive_connection_lifetime=self.max_inactive_connection_lifetime,
+                init=_init_connection
+            )
+            logger.info(
+                f"asyncpg pool created (min={self.min_size}, max={self.max_size})"
+            )
+        return self._pool
+
+    async def close(self):
+        """Close the connection pool"""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            logger.info("asyncpg pool closed")
+
+    # ========================================================================
+    # Usage Operations
+    # ========================================================================
+
+    async def check_quota(self, user_id: str) -> bool:
+        """Check if user has remaining quota"""
+        pool = await self.connect()
+        try:
+            row = await pool.fetchrow(
+                """
+                SELECT s.tier, COALESCE(u.requests_used, 0) AS requests_used
+                FROM subscriptions s
+                LEFT JOIN api_usage u
+                  ON u.user_id = s.user_id
+                 AND u.period_start = s.current_period_start
+                WHERE s.user_id = $1
+                ORDER BY s.created_at DESC
+                LIMIT 1
+                """,
+                user_id
+            )
+        except asyncpg.PostgresError as e:
+            logger.error(f"Error fetching usage for user {user_id}: {e}")
+            return False
+
+        if not row:
+            return False
+
+        quota = TierLimits.get_monthly_quota(row["tier"] or "basic")
+        return quota - row["requests_used"] > 0
+
+    async def increment_usage(self, user_id: str, count: int = 1) -> bool:
+        """Increment API usage counter"""
+        pool = await self.connect()
+        try:
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    subscription = await conn.fetchrow(
+                        """
+                        SELECT current_period_start, current_period_end
+                        FROM subscriptions
+                        WHERE user_id = $1
+                        ORDER BY created_at DESC
+                        LIMIT 1
+                        """,
+                        user_id
+                    )
+                    if not subscription:
+                        logger.warning(f"No subscription found for user {user_id}")
+                        return False
+
+                    exists = await conn.fetchval(
+                        """
+                        SELECT 1 FROM api_usage
+                        WHERE user_id = $1 AND period_start = $2
+                        """,
+                        user_id,
+                        subscription["current_period_start"]
+                    )
+
+                    if exists:
+                        await conn.execute(
+                            "SELECT increment_api_usage($1, $2)",
+                            user_id,
+                            count
+                        )
+                    else:
+                        await conn.execute(
+                            """
+                            INSERT INTO api_usage (
+                                user_id, period_start, period_end,
+                                requests_used, created_at
+                            ) VALUES ($1, $2, $3, $4, NOW())
+                            """,
+                            user_id,
+                            subscription["current_period_start"],
+                            subscription["current_period_end"],
+                            count
+                        )
+
+            logger.debug(f"Incremented usage for user {user_id} by {count}")
+            return True
+
+        except asyncpg.PostgresError as e:
+            logger.error(f"Error incrementing usage for user {user_id}: {e}")
+            return False
+
+    # ========================================================================
+    # Audit Logging
+    # ========================================================================
+
+    async def log_audit(
+        self,
+        user_id: Optional[str],
+        action: str,
+        resource_type: Optional[str] = None,
+        resource_id: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        ip_address: Optional[str] = None
+    ) -> bool:
+        """Log audit event"""
+        pool = await self.connect()
+        try:
+            await pool.execute(
+                """
+                INSERT INTO audit_log (
+                    user_id, action, resource_type, resource_id,
+                    metadata, ip_address, created_at
+                ) VALUES ($1, $2, $3, $4, $5, $6, NOW())
+                """,
+                user_id,
+                action,
+                resource_type,
+                resource_id,
+                metadata or {},
+                ip_address
+            )
+            logger.debug(f"Logged audit: {action} by {user_id}")
+            return True
+
+        except asyncpg.PostgresError as e:
+            logger.error(f"Error logging audit event: {e}")
+            return False
+
+    # ========================================================================
+    # Twitter Account Operations
+    # ========================================================================
+
+    async def get_twitter_accounts(self, user_id: str) -> List[Dict[str, Any]]:
+        """Get user's connected Twitter accounts"""
+        pool = await self.connect()
+        try:
+            rows = await pool.fetch(
+                """
+                SELECT * FROM twitter_accounts
+                WHERE user_id = $1 AND is_active = TRUE
+                """,
+                user_id
+            )
+            return [dict(row) for row in rows]
+
+        except asyncpg.PostgresError as e:
+            logger.error(f"Error fetching Twitter accounts for user {user_id}: {e}")
+            return []
+
+    # ========================================================================
+    # Analysis Operations
+    # ========================================================================
+
+    async def create_analysis(self, analysis_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Create new analysis record"""
+        pool = await self.connect()
+
+        # Column names come from internal callers, never from user input
+        columns = list(analysis_data)
+        placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+
+        try:
+            row = await pool.fetchrow(
+                f"""
+                INSERT INTO analyses ({", ".join(columns)}, created_at, updated_at)
+                VALUES ({placeholders}, NOW(), NOW())
+                RETURNING *
+                """,
+                *analysis_data.values()
+            )
+            logger.info(f"Created analysis: {row['id']}")
+            return dict(row)
+
+        except asyncpg.PostgresError as e:
+            logger.error(f"Error creating analysis: {e}")
+            return None
+
+    async def finalize_analysis(
+        self,
+        analysis_row: Dict[str, Any],
+        usage_delta: int,
+        audit_row: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Store analysis, increment usage and log audit in a single statement
+
+        Args:
+            analysis_row: analyses table row (must include id and user_id)
+            usage_delta: Amount to add to the user's API usage
+            audit_row: Audit fields (action, resource_type, metadata)
+
+        Returns:
+            Dict with the analysis id and updated requests_used, or None on error
+        """
+        pool = await self.connect()
+        try:
+            row = await pool.fetchrow(
+                FINALIZE_ANALYSIS_SQL,
+                analysis_row,
+                analysis_row["user_id"],
+                usage_delta,
+                audit_row["action"],
+                audit_row.get("resource_type"),
+                audit_row.get("metadata") or {}
+            )
+            if row is None:
+                return None
+
+            logger.info(f"Finalized analysis: {row['id']}")
+            return dict(row)
+
+        except asyncpg.PostgresError as e:
+            logger.error(f"Error finalizing analysis: {e}")
+            return None
+
+
+# ============================================================================
+# Helper Functions
+# ============================================================================
+
+def _encode_json(value: Any) -> str:
+    """Serialize a JSON column value (asyncpg's text codec needs str)"""
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+async def _init_connection(conn: asyncpg.Connection):
+    """Encode/decode JSON columns as Python objects"""
+    for json_type in ("json", "jsonb"):
+        await conn.set_type_codec(
+            json_type,
+            encoder=_encode_json,
+            decoder=orjson.loads,
+            schema="pg_catalog"
+        )
+
+
+# ============================================================================
+# Global Instance
+# ============================================================================
+
+# Shared pool (connections are opened on first use)
+async_db = AsyncDatabasePool()
+
+
+async def get_postgres_pool() -> asyncpg.Pool:
+    """
+    Get the shared asyncpg pool, creating it on first use
+
+    Usage:
+        pool = await get_postgres_pool()
+        async with pool.acquire() as conn:
+            await conn.fetchval("SELECT 1")
+    """
+    return await async_db.connect()
+
+
+# ============================================================================
+# Export
+# ============================================================================
+
+__all__ = ["AsyncDatabasePool", "async_db", "get_postgres_pool"]
@@ -0,0 +1,66 @@
+-- Finalize Analysis
+-- Store an analysis, increment API usage and write the audit row in one round-trip
+--
+-- Parameters:
+--   $1  analysis row (jsonb, keys match analyses columns)
+--   $2  user id
+--   $3  usage delta
+--   $4  audit action
+--   $5  audit resource type
+--   $6  audit metadata (jsonb)
+
+WITH analysis_row AS (
+    SELECT * FROM jsonb_populate_record(NULL::analyses, $1::jsonb)
+),
+ins AS (
+    INSERT INTO analyses (
+        id, user_id, twitter_account_id, tier, purpose,
+        sentiment_data, themes_data, engagement_data, risk_data, bias_data,
+        recommendations_data, executive_summary, key_findings, model_used,
+        processing_time_ms, token_count, confidence_level, human_review_required,
+        created_at, updated_at
+    )
+    SELECT
+        id, user_id, twitter_account_id, tier, purpose,
+        sentiment_data, themes_data, engagement_data, risk_data, bias_data,
+        recommendations_data, executive_summary, key_findings, model_used,
+        processing_time_ms, token_count, confidence_level, human_review_required,
+        NOW(), NOW()
+    FROM analysis_row
+    RETURNING id
+),
+sub AS (
+    SELECT current_period_start, current_period_end
+    FROM subscriptions
+    WHERE user_id = $2
+    ORDER BY created_at DESC
+    LIMIT 1
+),
+upd AS (
+    UPDATE api_usage u
+    SET requests_used = u.requests_used + $3
+    FROM sub
+    WHERE u.user_id = $2
+      AND u.period_start = sub.current_period_start
+    RETURNING u.requests_used
+),
+new_usage AS (
+    INSERT INTO api_usage (user_id, period_start, period_end, requests_used, created_at)
+    SELECT $2, current_period_start, current_period_end, $3, NOW()
+    FROM sub
+    WHERE NOT EXISTS (SELECT 1 FROM upd)
+    RETURNING requests_used
+),
+audit AS (
+    INSERT INTO audit_log (user_id, action, resource_type, resource_id, metadata, created_at)
+    SELECT $2, $4, $5, ins.id::text, $6::jsonb, NOW()
+    FROM ins
+    RETURNING id
+)
+SELECT
+    ins.id,
+    COALESCE(
+        (SELECT requests_used FROM upd),
+        (SELECT requests_used FROM new_usage)
+    ) AS requests_used
+FROM ins;